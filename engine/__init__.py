@@ -1,6 +1,12 @@
 """Lightweight text adventure engine primitives."""
 
+from typing import Any
+
+from .artcache import RENDER_CACHE, ArtCache, RenderCache
+from .bundle import compile_bundle, load_game_file
+from .commands import VerbRegistry
 from .engine import CommandResponse, GameEngine
+from .lazy import load_game_lazy
 from .loader import load_game
 from .models import (
     ActorMetadata,
@@ -10,16 +16,52 @@ from .models import (
     ObjectMetadata,
     PathwayMetadata,
     PlayerMetadata,
+    ReferenceIndex,
+    StateOverlay,
     build_initial_state,
+    migrate_state,
+    writable_state,
 )
-from .llm import LLMClient, LLMUnavailableError
+from .validation import GameValidationError, ValidationIssue
+from .vocabulary import VOCABULARY, Vocabulary
+
+# engine.llm and engine.catalog are imported on first use (PEP 562) so
+# programs that never need them do not pay for them at startup.
+_LAZY_EXPORTS = {
+    "LLMClient": ".llm",
+    "LLMUnavailableError": ".llm",
+    "GameCatalog": ".catalog",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
+    "ArtCache",
+    "RENDER_CACHE",
+    "RenderCache",
     "CommandResponse",
     "GameEngine",
+    "VerbRegistry",
     "load_game",
+    "load_game_lazy",
+    "load_game_file",
+    "compile_bundle",
+    "GameCatalog",
     "LLMClient",
     "LLMUnavailableError",
+    "GameValidationError",
+    "ValidationIssue",
+    "VOCABULARY",
+    "Vocabulary",
     "ActorMetadata",
     "GameMetadata",
     "GameState",
@@ -27,5 +69,9 @@ __all__ = [
     "ObjectMetadata",
     "PathwayMetadata",
     "PlayerMetadata",
+    "ReferenceIndex",
+    "StateOverlay",
     "build_initial_state",
+    "migrate_state",
+    "writable_state",
 ]
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, TextIO, Tuple
+
+from .models import GameMetadata
+from .png import PNGImage, numpy_backend
+
+# Terminal art: at most this many characters per line and lines per image.
+ART_COLUMNS = 60
+ART_ROWS = 40
+ART_RAMP = " .:-=+*#%@"
+# Bump when the rendering changes so persisted ArtCache entries are not reused.
+_ART_FORMAT = 2
+# Everything that determines png_to_ascii's output, for cache keys.
+ASCII_ART_PARAMS = ("ascii", _ART_FORMAT, ART_COLUMNS, ART_ROWS, ART_RAMP, "mono")
+
+# Art styles: the ASCII ramp, or half-block cells in 256 or 24-bit color.
+ART_STYLES = ("ascii", "256", "truecolor")
+_ANSI_FORMAT = 1
+# Averaged alpha below this counts as transparent.
+_OPAQUE = 40
+
+# The treasure chart shown by the ``map`` verb in the captain's cabin.
+MAP_IMAGE = "images/PirateMap.png"
+MAP_LOCATION = "captains_cabin"
+
+
+def referenced_images(game: GameMetadata) -> List[str]:
+    """Every image path ``game`` can draw, as written in its metadata, in order."""
+    images = [location.image for location in game.locations.values() if location.image.strip()]
+    if MAP_LOCATION in game.locations:
+        images.append(MAP_IMAGE)
+    return list(dict.fromkeys(image.strip() for image in images))
+
+
+def png_to_ascii(path: Path) -> str:
+    """Render a PNG as lines of ASCII characters, darker pixels as sparser ones."""
+    image = PNGImage(path)
+    width, height = image.width, image.height
+    target_cols = min(ART_COLUMNS, width)
+    if target_cols <= 0:
+        return ""
+    step_x = width / target_cols
+    # characters are roughly twice as tall as they are wide
+    step_y = max(1.0, step_x * 0.5)
+    rows = min(ART_ROWS, max(1, int(height / step_y)))
+    ramp = ART_RAMP
+    # Average each character's whole cell instead of sampling one pixel;
+    # the image streams through and decoding stops below the last cell.
+    backend = numpy_backend()
+    ascii_lines: List[str] = []
+    for pixels in image.downsample(target_cols, rows, min(height, round(rows * step_y))):
+        if backend is not None:
+            ascii_lines.append(backend.ramp_line(pixels, ramp, 40))
+            continue
+        line_chars: List[str] = []
+        for r, g, b, a in pixels:
+            if a < 40:
+                line_chars.append(" ")
+                continue
+            luminance = 0.2126 * r + 0.7152 * g + 0.0722 * b
+            idx = int(luminance / 255 * (len(ramp) - 1))
+            line_chars.append(ramp[idx])
+        ascii_lines.append("".join(line_chars))
+    return "\n".join(ascii_lines)
+
+
+def art_params(style: str, columns: int) -> Tuple[object, ...]:
+    """Everything that determines :func:`render_art`'s output, for cache keys."""
+    if style == "ascii":
+        return ASCII_ART_PARAMS
+    return ("ansi", _ANSI_FORMAT, style, columns)
+
+
+def render_art(path: Path, style: str = "ascii", columns: int = ART_COLUMNS) -> str:
+    if style == "ascii":
+        return png_to_ascii(path)
+    return png_to_ansi(path, columns, style)
+
+
+def detect_art_style(stream: TextIO) -> str:
+    """The richest style ``stream`` can show: ASCII unless it is a color terminal."""
+    if not stream.isatty() or os.environ.get("NO_COLOR") or os.environ.get("TERM") == "dumb":
+        return "ascii"
+    if os.environ.get("COLORTERM", "").lower() in ("truecolor", "24bit"):
+        return "truecolor"
+    return "256"
+
+
+def terminal_columns() -> int:
+    """Width of the controlling terminal, or 80 when there is none."""
+    return shutil.get_terminal_size((80, 24)).columns
+
+
+# Escape tables. SGR parameters are joined into one "\x1b[...m" per change;
+# 256-color cells map each channel to the nearest of the 6 cube levels, or
+# to the 24-step gray ramp when the channels are close.
+_DEC = [str(value) for value in range(256)]
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+_CUBE = bytes(min(range(6), key=lambda level: abs(_CUBE_LEVELS[level] - value)) for value in range(256))
+_GRAY = bytes(
+    16 if value < 4 else 231 if value > 246 else 232 + min(23, max(0, (value - 3) // 10)) for value in range(256)
+)
+_FG_256 = [f"38;5;{index}" for index in range(256)]
+_BG_256 = [f"48;5;{index}" for index in range(256)]
+_DEFAULT_BG = "49"
+_RESET_LINE = "\x1b[0m\n"
+_UPPER_HALF = "\u2580"
+_LOWER_HALF = "\u2584"
+
+
+def _color_256(r: int, g: int, b: int) -> int:
+    if max(r, g, b) - min(r, g, b) < 12:
+        return _GRAY[(r + g + b) // 3]
+    return 16 + 36 * _CUBE[r] + 6 * _CUBE[g] + _CUBE[b]
+
+
+def _codes(style: str, r: int, g: int, b: int) -> Tuple[str, str]:
+    if style == "truecolor":
+        rgb = f"{_DEC[r]};{_DEC[g]};{_DEC[b]}"
+        return "38;2;" + rgb, "48;2;" + rgb
+    index = _color_256(r, g, b)
+    return _FG_256[index], _BG_256[index]
+
+
+def png_to_ansi(path: Path, columns: int, style: str = "truecolor") -> str:
+    """Render a PNG as half-block characters with ANSI colors, ``columns`` wide.
+
+    Each character cell shows two box-filtered pixels: the upper one as the
+    foreground of "\u2580" and the lower one as its background, which keeps
+    the picture's aspect ratio on terminals whose cells are twice as tall as
+    wide.
+    """
+    image = PNGImage(path)
+    width, height = image.width, image.height
+    columns = max(1, min(columns, width))
+    pixel_rows = max(1, min(height, round(height * columns / width)))
+    return half_blocks(image.downsample(columns, pixel_rows), style)
+
+
+def half_blocks(pixel_rows: Iterable[Sequence[Tuple[int, int, int, int]]], style: str = "truecolor") -> str:
+    """Draw rows of RGBA pixels two at a time as colored half-block lines.
+
+    Transparent pixels leave the terminal background showing. Escape codes
+    are only emitted when a color changes and every line ends with a reset;
+    the whole picture is one ``str.join``.
+    """
+    if style not in ("256", "truecolor"):
+        raise ValueError(f"unknown ANSI style {style!r}")
+    codes: Dict[int, Tuple[str, str]] = {}
+    parts: List[str] = []
+    rows = iter(pixel_rows)
+    for upper in rows:
+        lower = next(rows, None)
+        current_fg: Optional[str] = None
+        current_bg: Optional[str] = None
+        for index, (r, g, b, a) in enumerate(upper):
+            fg = bg = None
+            if a >= _OPAQUE:
+                fg = _cached_codes(codes, style, r, g, b)[0]
+                char = _UPPER_HALF
+            if lower is not None and lower[index][3] >= _OPAQUE:
+                r2, g2, b2, _ = lower[index]
+                if fg is None:
+                    fg = _cached_codes(codes, style, r2, g2, b2)[0]
+                    char = _LOWER_HALF
+                else:
+                    bg = _cached_codes(codes, style, r2, g2, b2)[1]
+            if fg is None:
+                char = " "
+            bg = bg or _DEFAULT_BG
+            changed = []
+            if fg is not None and fg != current_fg:
+                changed.append(fg)
+                current_fg = fg
+            if bg != current_bg:
+                changed.append(bg)
+                current_bg = bg
+            if changed:
+                parts.append("\x1b[" + ";".join(changed) + "m")
+            parts.append(char)
+        parts.append(_RESET_LINE)
+    return "".join(parts)[:-1]
+
+
+def _cached_codes(codes: Dict[int, Tuple[str, str]], style: str, r: int, g: int, b: int) -> Tuple[str, str]:
+    # Pictures repeat colors a lot; format each one's escapes once per render.
+    key = (r << 16) | (g << 8) | b
+    pair = codes.get(key)
+    if pair is None:
+        pair = codes[key] = _codes(style, r, g, b)
+    return pair
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+ENTRY_SUFFIX = ".txt"
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_MEMORY_BYTES = 8 * 1024 * 1024
+
+
+def default_cache_dir(kind: str = "art") -> Path:
+    """``$XDG_CACHE_HOME/text-adventure/<kind>``, falling back to ``~/.cache``."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "text-adventure" / kind
+
+
+_digests: Dict[Path, Tuple[int, int, str]] = {}
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file's contents, hashed again only when its mtime or size changes."""
+    stat = path.stat()
+    cached = _digests.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    _digests[path] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+class ArtCache:
+    """Rendered location art on disk, shared by every process using ``directory``.
+
+    Entries are keyed by the SHA-256 of the image file plus the render
+    parameters, so moving or renaming an image keeps its entry and editing
+    it misses. Each entry is one file written to a temporary name and moved
+    into place with ``os.replace``, so readers in other processes see either
+    the whole entry or none. Reading an entry refreshes its mtime; when the
+    directory grows past ``max_bytes`` the entries with the oldest mtimes
+    are deleted first (LRU). Every I/O error is treated as a miss, so a
+    read-only or vanished directory only costs the render.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0, "errors": 0}
+
+    def key(self, image: Path, params: Sequence[object]) -> str:
+        """The entry name for ``image`` rendered with ``params``."""
+        material = "\0".join([file_digest(Path(image)), *map(repr, params)])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._entry(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except OSError:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return text
+
+    def contains(self, key: str) -> bool:
+        """Whether ``key`` has an entry, without counting a lookup or touching it."""
+        return self._entry(key).exists()
+
+    def put(self, key: str, text: str) -> None:
+        import tempfile
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=key, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    handle.write(text)
+                os.replace(tmp_name, self._entry(key))
+            except BaseException:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+                raise
+            self._count("writes")
+            self.evict()
+        except OSError:
+            self._count("errors")
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits ``max_bytes``."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass  # another process evicted it first
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        if removed:
+            self._count("evictions", removed)
+        return removed
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, object]:
+        """Counters for this process, its hit rate and the cache's current size."""
+        with self._lock:
+            counters = dict(self._stats)
+        lookups = counters["hits"] + counters["misses"]
+        sizes = [size for _, size, _ in self._entries()]
+        return {
+            **counters,
+            "hit_rate": round(counters["hits"] / lookups, 3) if lookups else None,
+            "entries": len(sizes),
+            "bytes": sum(sizes),
+            "max_bytes": self.max_bytes,
+            "directory": str(self.directory),
+        }
+
+    def _entries(self) -> List[Tuple[int, int, str]]:
+        """(mtime_ns, size, path) of every entry currently in the directory."""
+        entries = []
+        try:
+            with os.scandir(self.directory) as scan:
+                for item in scan:
+                    if item.name.endswith(ENTRY_SUFFIX):
+                        try:
+                            stat = item.stat()
+                        except OSError:
+                            continue  # evicted meanwhile
+                        entries.append((stat.st_mtime_ns, stat.st_size, item.path))
+        except OSError:
+            pass
+        return entries
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / f"{key}{ENTRY_SUFFIX}"
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+
+class RenderCache:
+    """Rendered art in memory, shared by every engine in the process.
+
+    Values are charged at ``sys.getsizeof`` against ``max_bytes``; storing
+    past the budget evicts the least recently used entries first, and a
+    value larger than the whole budget is not stored. All methods take one
+    lock, so engines on different threads can share an instance.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MEMORY_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[str, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key: Hashable) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[0]
+
+    def put(self, key: Hashable, text: str) -> None:
+        size = sys.getsizeof(text)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (text, size)
+            self._bytes += size
+            self._shrink()
+
+    def resize(self, max_bytes: int) -> None:
+        """Change the budget, evicting right away if the cache no longer fits."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._shrink()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            stats: Dict[str, object] = dict(self._stats)
+            lookups = self._stats["hits"] + self._stats["misses"]
+            stats.update(
+                hit_rate=round(self._stats["hits"] / lookups, 3) if lookups else None,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+            )
+        return stats
+
+    def _shrink(self) -> None:
+        while self._bytes > self.max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._stats["evictions"] += 1
+
+
+# Shared by every GameEngine in this process unless given its own.
+RENDER_CACHE = RenderCache()
@@ -0,0 +1,413 @@
+from __future__ import annotations
+
+import gc
+import json
+import marshal
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+from .loader import load_game
+from .models import (
+    ActorMetadata,
+    GameMetadata,
+    LocationMetadata,
+    ObjectMetadata,
+    PathwayMetadata,
+    PlayerMetadata,
+    ReferenceIndex,
+    freeze_game,
+    read_only,
+)
+from .resolver import LocationNames, NameIndex
+from .vocabulary import VOCABULARY
+
+BUNDLE_SUFFIX = ".gamebundle"
+BUNDLE_MAGIC = b"TAGB"
+BUNDLE_VERSION = 3
+# magic, format version, marshal version, sha256 of source, source mtime_ns, source size
+_HEADER = struct.Struct(">4sHH32sQQ")
+# Bundles are only reused by the interpreter family that wrote them.
+_PYTHON_TAG = sys.implementation.cache_tag.encode("ascii")
+_NONE = -1
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.strings: List[str] = []
+        self._index: Dict[str, int] = {}
+        # Entries holding ids, names and state keys; interned again on decode.
+        self.vocabulary: Set[int] = set()
+
+    def ref(self, value: Optional[str]) -> int:
+        if value is None:
+            return _NONE
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def key(self, value: Optional[str]) -> int:
+        index = self.ref(value)
+        if index != _NONE:
+            self.vocabulary.add(index)
+        return index
+
+    def keys(self, values: Sequence[str]) -> Tuple[int, ...]:
+        return tuple(self.key(value) for value in values)
+
+    def pairs(
+        self, mapping: Mapping[str, str], *, values_are_keys: bool = False
+    ) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        values = list(mapping.values())
+        return self.keys(list(mapping)), self.keys(values) if values_are_keys else tuple(map(self.ref, values))
+
+
+def _encode_names(
+    table: _StringTable, index: NameIndex, entities: Sequence[Any]
+) -> Tuple[Tuple[int, Tuple[int, ...]], ...]:
+    # (key, positions of the entities it names) pairs for a location name index.
+    positions = {id(entity): position for position, entity in enumerate(entities)}
+    return tuple(
+        (table.ref(key), tuple(positions[id(entity)] for entity in bucket))
+        for key, bucket in index.items()
+    )
+
+
+def _decode_names(
+    strings: Sequence[str], entries: Tuple[Tuple[int, Tuple[int, ...]], ...], entities: Sequence[Any]
+) -> NameIndex:
+    return NameIndex.prebuilt(
+        {strings[key]: [entities[position] for position in positions] for key, positions in entries}
+    )
+
+
+def source_digest(data: bytes) -> bytes:
+    import hashlib  # only needed when a bundle is written or its mtime is off
+
+    return hashlib.sha256(data).digest()
+
+
+def bundle_path_for(source: Path) -> Path:
+    return Path(source).with_suffix(BUNDLE_SUFFIX)
+
+
+def encode_game(game: GameMetadata) -> bytes:
+    """Serialize ``game`` into the bundle payload (string table + records)."""
+    table = _StringTable()
+    locations = []
+    for location in game.locations.values():
+        objects = tuple(
+            (
+                table.key(obj.id),
+                table.key(obj.name),
+                table.ref(obj.description),
+                table.ref(obj.details),
+                int(obj.can_pick_up) | int(obj.can_move) << 1,
+                table.pairs(obj.initial_state, values_are_keys=True),
+                table.keys(obj.contains),
+                table.keys(obj.aliases),
+            )
+            for obj in location.objects
+        )
+        actors = tuple(
+            (
+                table.key(actor.id),
+                table.key(actor.name),
+                table.ref(actor.description),
+                table.ref(actor.persona),
+                table.ref(actor.background),
+                table.pairs(actor.dialogue),
+                table.keys(actor.inventory),
+                table.keys(actor.aliases),
+            )
+            for actor in location.actors
+        )
+        pathways = tuple(
+            (
+                table.key(path.id),
+                table.key(path.name),
+                table.key(path.target),
+                table.ref(path.description),
+                int(path.locked) | int(path.hidden) << 1,
+                table.key(path.unlocks_with),
+                table.key(path.reveals_with),
+                table.keys(path.aliases),
+            )
+            for path in location.pathways
+        )
+        names = tuple(
+            _encode_names(table, index, entities)
+            for index, entities in (
+                (location.names.objects, location.objects),
+                (location.names.actors, location.actors),
+                (location.names.pathways, location.pathways),
+            )
+        )
+        locations.append(
+            (
+                table.key(location.id),
+                table.key(location.name),
+                table.ref(location.image),
+                table.ref(location.description),
+                table.ref(location.details),
+                objects,
+                actors,
+                pathways,
+                names,
+            )
+        )
+    player = game.player
+    refs = game.references
+    references = (
+        tuple((table.key(key), table.keys(ids)) for key, ids in refs.entrances.items()),
+        tuple((table.key(key), table.keys(ids)) for key, ids in refs.unlocks.items()),
+        tuple((table.key(key), table.keys(ids)) for key, ids in refs.reveals.items()),
+        table.pairs(refs.container_of, values_are_keys=True),
+    )
+    record = (
+        table.ref(game.title),
+        table.ref(game.summary),
+        table.key(game.start_location),
+        (table.key(player.name), table.ref(player.description), table.keys(player.starting_inventory)),
+        tuple(locations),
+        references,
+    )
+    return marshal.dumps((_PYTHON_TAG, tuple(table.strings), tuple(sorted(table.vocabulary)), record))
+
+
+def decode_game(payload: bytes) -> GameMetadata:
+    """Rebuild ready-to-use metadata, indexes included, from a bundle payload.
+
+    Bundles are only compiled from games that passed ``load_game``'s
+    validation, so references are trusted rather than re-checked here.
+    """
+    tag, strings, vocabulary, record = marshal.loads(payload)
+    if tag != _PYTHON_TAG:
+        raise ValueError("Bundle was written by a different Python implementation")
+    strings = list(strings)
+    intern = VOCABULARY.intern
+    for index in vocabulary:
+        strings[index] = intern(strings[index])
+
+    def text(index: int) -> Optional[str]:
+        return None if index == _NONE else strings[index]
+
+    lookup = strings.__getitem__
+
+    def pairs(refs: Tuple[Tuple[int, ...], Tuple[int, ...]]) -> Mapping[str, str]:
+        return read_only(dict(zip(map(lookup, refs[0]), map(lookup, refs[1]))))
+
+    def texts(refs: Tuple[int, ...]) -> Tuple[str, ...]:
+        return tuple(map(lookup, refs))
+
+    title, summary, start, player_record, location_records, reference_records = record
+    entrances, unlocks, reveals, container_of = reference_records
+    game = GameMetadata(
+        title=strings[title],
+        summary=strings[summary],
+        start_location=strings[start],
+        locations={},
+        player=PlayerMetadata(
+            name=strings[player_record[0]],
+            description=strings[player_record[1]],
+            starting_inventory=texts(player_record[2]),
+        ),
+        references=ReferenceIndex(
+            entrances=read_only({strings[key]: texts(ids) for key, ids in entrances}),
+            unlocks=read_only({strings[key]: texts(ids) for key, ids in unlocks}),
+            reveals=read_only({strings[key]: texts(ids) for key, ids in reveals}),
+            container_of=pairs(container_of),
+        ),
+    )
+    # Records are built positionally (in dataclass field order) with the cyclic
+    # collector paused: the graph is acyclic and allocation-triggered
+    # collections would otherwise rescan it repeatedly while it grows.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for loc_id, name, image, description, details, objects, actors, pathways, names in location_records:
+            location_id = strings[loc_id]
+            object_list = tuple(
+                ObjectMetadata(
+                    strings[o[0]],
+                    strings[o[1]],
+                    strings[o[2]],
+                    strings[o[3]],
+                    bool(o[4] & 1),
+                    bool(o[4] & 2),
+                    pairs(o[5]),
+                    texts(o[6]),
+                    texts(o[7]),
+                )
+                for o in objects
+            )
+            actor_list = tuple(
+                ActorMetadata(
+                    strings[a[0]],
+                    strings[a[1]],
+                    strings[a[2]],
+                    strings[a[3]],
+                    strings[a[4]],
+                    pairs(a[5]),
+                    texts(a[6]),
+                    texts(a[7]),
+                )
+                for a in actors
+            )
+            pathway_list = tuple(
+                PathwayMetadata(
+                    strings[p[0]],
+                    strings[p[1]],
+                    strings[p[2]],
+                    strings[p[3]],
+                    bool(p[4] & 1),
+                    bool(p[4] & 2),
+                    text(p[5]),
+                    text(p[6]),
+                    texts(p[7]),
+                )
+                for p in pathways
+            )
+            location = LocationMetadata(
+                location_id,
+                strings[name],
+                strings[image],
+                strings[description],
+                strings[details],
+                object_list,
+                actor_list,
+                pathway_list,
+                LocationNames(
+                    objects=_decode_names(strings, names[0], object_list),
+                    actors=_decode_names(strings, names[1], actor_list),
+                    pathways=_decode_names(strings, names[2], pathway_list),
+                ),
+            )
+            game.locations[location_id] = location
+            for obj in location.objects:
+                game.objects[obj.id] = obj
+                game.object_locations[obj.id] = location_id
+            for actor in location.actors:
+                game.actors[actor.id] = actor
+                game.actor_locations[actor.id] = location_id
+            for path in location.pathways:
+                game.pathways[path.id] = path
+                game.pathway_locations[path.id] = location_id
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return freeze_game(game)
+
+
+def compile_bundle(source: Path, bundle: Optional[Path] = None) -> Path:
+    """Compile the game JSON at ``source`` into a bundle next to it."""
+    source = Path(source)
+    bundle = Path(bundle) if bundle else bundle_path_for(source)
+    data, stat = _read_source(source)
+    game = load_game(json.loads(data))
+    _write_bundle(bundle, source_digest(data), stat, encode_game(game))
+    return bundle
+
+
+def load_bundle(bundle: Path, source: Optional[Path] = None) -> Optional[GameMetadata]:
+    """Load ``bundle`` if it is current for ``source``; return None when stale.
+
+    Freshness is checked against the recorded mtime and size first and
+    falls back to comparing the source's SHA-256, so touching a file
+    without changing it does not invalidate the bundle. After such a
+    match the header is rewritten with the new mtime and size, so only
+    the first load after a touch pays for the hash.
+    """
+    try:
+        raw = Path(bundle).read_bytes()
+    except OSError:
+        return None
+    if len(raw) < _HEADER.size:
+        return None
+    magic, version, marshal_version, digest, mtime_ns, size = _HEADER.unpack_from(raw)
+    if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION or marshal_version != marshal.version:
+        return None
+    touched = None
+    if source is not None:
+        try:
+            stat = Path(source).stat()
+            if (stat.st_mtime_ns, stat.st_size) != (mtime_ns, size):
+                if source_digest(Path(source).read_bytes()) != digest:
+                    return None
+                touched = stat
+        except OSError:
+            return None
+    try:
+        game = decode_game(raw[_HEADER.size :])
+    except (ValueError, EOFError, TypeError, IndexError):
+        return None
+    if touched is not None:
+        try:
+            _write_bundle(Path(bundle), digest, touched, raw[_HEADER.size :])
+        except OSError:
+            pass  # read-only checkout: keep hashing on each load
+    return game
+
+
+def load_game_file(source: Path, *, use_bundle: bool = True) -> GameMetadata:
+    """Load a game JSON file through its bundle, recompiling it when stale."""
+    source = Path(source)
+    if not use_bundle:
+        return load_game(json.loads(source.read_text(encoding="utf-8")))
+    bundle = bundle_path_for(source)
+    game = load_bundle(bundle, source)
+    if game is not None:
+        return game
+    data, stat = _read_source(source)
+    game = load_game(json.loads(data))
+    try:
+        _write_bundle(bundle, source_digest(data), stat, encode_game(game))
+    except OSError:
+        pass  # read-only checkout: keep serving from JSON
+    return game
+
+
+def _read_source(source: Path) -> Tuple[bytes, os.stat_result]:
+    # Stat before reading: an edit in between then leaves a header whose
+    # mtime is older than the content, which only costs a hash check on the
+    # next load, instead of pairing the new mtime with the old content.
+    stat = source.stat()
+    return source.read_bytes(), stat
+
+
+def _write_bundle(bundle: Path, digest: bytes, source: os.stat_result, payload: bytes) -> None:
+    header = _HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, marshal.version, digest, source.st_mtime_ns, source.st_size)
+    import tempfile
+
+    fd, tmp_name = tempfile.mkstemp(dir=bundle.parent, prefix=bundle.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(header)
+            handle.write(payload)
+        # mkstemp creates the file 0600; give the bundle the source's read and
+        # write permissions so whoever can read the game can use it too.
+        os.chmod(tmp_name, source.st_mode & 0o666)
+        os.replace(tmp_name, bundle)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def describe_bundle(bundle: Path) -> Dict[str, Any]:
+    raw = Path(bundle).read_bytes()
+    magic, version, marshal_version, digest, mtime_ns, size = _HEADER.unpack_from(raw)
+    return {
+        "format_version": version,
+        "marshal_version": marshal_version,
+        "source_sha256": digest.hex(),
+        "source_mtime_ns": mtime_ns,
+        "source_size": size,
+        "bytes": len(raw),
+    }
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import hashlib
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .bundle import load_game_file
+from .lazy import scan_game_file
+from .models import GameMetadata, shared_baseline_state
+from .reload import ReloadReport, location_fingerprints, reload_game
+
+GAME_SUFFIX = ".json"
+
+
+@dataclass(slots=True)
+class CatalogEntry:
+    """One loaded game plus what it cost to load."""
+
+    digest: str
+    path: Path
+    metadata: GameMetadata
+    load_seconds: float
+    # Per-location hashes of the source file, recorded by GameCatalog.track
+    # so the next reload can rebuild only the locations that changed.
+    fingerprints: Optional[Dict[str, bytes]] = field(default=None, repr=False)
+    _memory_bytes: Optional[int] = field(default=None, init=False, repr=False)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate size of the metadata object graph, measured on first use."""
+        if self._memory_bytes is None:
+            self._memory_bytes = deep_sizeof(self.metadata)
+        return self._memory_bytes
+
+
+# Process-wide: every catalog (and so every session and title) shares one
+# GameMetadata per distinct file content.
+_ENTRIES: Dict[str, CatalogEntry] = {}
+_LOCK = threading.Lock()
+
+
+class GameCatalog:
+    """Discovers ``*.json`` games in a directory and loads each one once.
+
+    Games are addressed by file stem (``pirate_sample``). Loaded metadata is
+    cached process-wide by the SHA-256 of the file, so unchanged files are
+    never parsed twice, identical files share one object graph, and an
+    edited file is picked up on the next :meth:`get` and replaces its old
+    version in the cache (sessions still playing the old version keep it
+    alive until they end). The file is only rehashed when its mtime or size
+    changes.
+    """
+
+    def __init__(self, directory: Path, *, use_bundle: bool = True) -> None:
+        self.directory = Path(directory)
+        self.use_bundle = use_bundle
+        self._stats: Dict[Path, Tuple[int, int, str]] = {}
+        # Games being tracked for hot reload, by id.
+        self._tracked: Dict[str, CatalogEntry] = {}
+
+    def game_ids(self) -> List[str]:
+        return sorted(path.stem for path in self.directory.glob(f"*{GAME_SUFFIX}"))
+
+    def path(self, game_id: str) -> Path:
+        # Ids come from URLs; only plain stems of files in the directory count.
+        if not game_id or game_id.startswith(".") or Path(game_id).name != game_id:
+            raise KeyError(game_id)
+        path = self.directory / f"{game_id}{GAME_SUFFIX}"
+        if not path.is_file():
+            raise KeyError(game_id)
+        return path
+
+    def __contains__(self, game_id: object) -> bool:
+        try:
+            self.path(str(game_id))
+        except KeyError:
+            return False
+        return True
+
+    def entry(self, game_id: str) -> CatalogEntry:
+        path = self.path(game_id)
+        digest = self._digest(path)
+        entry = _ENTRIES.get(digest)
+        if entry is not None:
+            return entry
+        with _LOCK:
+            entry = _ENTRIES.get(digest)
+            if entry is None:
+                started = time.perf_counter()
+                metadata = load_game_file(path, use_bundle=self.use_bundle)
+                entry = CatalogEntry(digest, path, metadata, time.perf_counter() - started)
+                _ENTRIES[digest] = entry
+                _forget_older_versions(path, digest)
+        return entry
+
+    def get(self, game_id: str) -> GameMetadata:
+        return self.entry(game_id).metadata
+
+    def preload(self) -> List[CatalogEntry]:
+        """Load every game and build its shared baseline state now.
+
+        Called before forking workers so they inherit the metadata instead
+        of each building their own copy.
+        """
+        entries = [self.entry(game_id) for game_id in self.game_ids()]
+        for entry in entries:
+            shared_baseline_state(entry.metadata)
+        return entries
+
+    def track(self, game_id: str) -> CatalogEntry:
+        """Load ``game_id`` and fingerprint its locations for :meth:`reload`.
+
+        Costs one extra scan of the file, so it is only worth doing when
+        the game is being watched for edits.
+        """
+        entry = self.entry(game_id)
+        if entry.fingerprints is None:
+            data = entry.path.read_bytes()
+            if hashlib.sha256(data).hexdigest() == entry.digest:
+                entry.fingerprints = location_fingerprints(data, scan_game_file(data.decode("utf-8")))
+        self._tracked[game_id] = entry
+        return entry
+
+    def reload(self, game_id: str) -> Optional[Tuple[CatalogEntry, ReloadReport]]:
+        """Pick up edits to ``game_id`` incrementally; ``None`` if its content is unchanged.
+
+        Only locations whose source changed since the game was tracked (or
+        last reloaded) are rebuilt; see ``reload_game``. Untracked games are
+        rebuilt in full. Raises ``GameValidationError``/``ValueError`` for a
+        broken file, leaving the cached game in place.
+        """
+        path = self.path(game_id)
+        stat = path.stat()
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        self._stats[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        previous = self._tracked.get(game_id)
+        if previous is not None and previous.digest == digest:
+            return None
+        with _LOCK:
+            base = previous if previous is not None and previous.fingerprints is not None else None
+            metadata, fingerprints, report = reload_game(
+                base.metadata if base is not None else None,
+                base.fingerprints or {} if base is not None else {},
+                data,
+            )
+            entry = _ENTRIES.get(digest)
+            if entry is None:
+                entry = _ENTRIES[digest] = CatalogEntry(digest, path, metadata, report.seconds)
+            if entry.fingerprints is None:
+                entry.fingerprints = fingerprints
+            # Sessions migrated off the old version keep no reference to it,
+            # whether or not this catalog was tracking the game.
+            _forget_older_versions(path, digest)
+        self._tracked[game_id] = entry
+        return entry, report
+
+    def describe(self) -> List[Dict[str, Any]]:
+        """Title, cost and content hash of every game, loading any not yet cached."""
+        rows = []
+        for game_id in self.game_ids():
+            entry = self.entry(game_id)
+            rows.append(
+                {
+                    "id": game_id,
+                    "title": entry.metadata.title,
+                    "summary": entry.metadata.summary,
+                    "sha256": entry.digest,
+                    "load_ms": round(entry.load_seconds * 1000, 3),
+                    "memory_bytes": entry.memory_bytes,
+                }
+            )
+        return rows
+
+    def _digest(self, path: Path) -> str:
+        stat = path.stat()
+        cached = self._stats.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self._stats[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+
+def _forget_older_versions(path: Path, digest: str) -> None:
+    """Drop cached versions of ``path`` other than ``digest``; call with ``_LOCK`` held."""
+    for stale in [key for key, entry in _ENTRIES.items() if entry.path == path and key != digest]:
+        del _ENTRIES[stale]
+
+
+def cached_games() -> List[CatalogEntry]:
+    """Every game loaded in this process so far, across all catalogs."""
+    return list(_ENTRIES.values())
+
+
+def deep_sizeof(root: object) -> int:
+    """Sum ``sys.getsizeof`` over everything reachable from ``root``, once each.
+
+    Follows containers and ``__slots__``/``__dict__`` attributes; classes,
+    functions and modules are not counted. Strings shared with other games
+    through the vocabulary are counted here too, so totals are an upper bound.
+    """
+    seen: Set[int] = set()
+    stack = [root]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, (type, type(deep_sizeof), type(sys))):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+            continue
+        if isinstance(obj, (dict, MappingProxyType)):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+            continue
+        if isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+            continue
+        for cls in type(obj).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(obj, name):
+                    stack.append(getattr(obj, name))
+        if hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+    return total
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+Handler = Callable[..., str]
+
+# Filler words dropped between a verb and its target ("talk to the captain").
+TARGET_FILLERS = frozenset({"to", "the", "at", "toward", "towards"})
+
+
+@dataclass
+class Verb:
+    name: str
+    handler: Handler
+    takes_target: bool = True
+
+    def invoke(self, engine: Any, target: Optional[str]) -> str:
+        if self.takes_target:
+            return self.handler(engine, target)
+        return self.handler(engine)
+
+
+@dataclass
+class _PhraseNode:
+    children: Dict[str, "_PhraseNode"] = field(default_factory=dict)
+    verb: Optional[Verb] = None
+
+
+class VerbRegistry:
+    """Dispatch table mapping command phrases to engine handlers.
+
+    Phrases are stored in a word trie keyed by their first token, so resolving
+    a command costs one dict probe per word of the matched phrase no matter
+    how many verbs are registered. Verbs registered with ``takes_target=False``
+    only match when the phrase is the whole command ("look at map"); others
+    treat the remaining words as the target ("pick up the lantern").
+    """
+
+    def __init__(self) -> None:
+        self._roots: Dict[str, _PhraseNode] = {}
+        self._verbs: List[Verb] = []
+        self._phrases: List[Tuple[List[str], Verb]] = []
+
+    def register(
+        self,
+        *phrases: str,
+        takes_target: bool = True,
+        name: Optional[str] = None,
+    ) -> Callable[[Handler], Handler]:
+        """Decorator registering ``handler`` under each of ``phrases``."""
+
+        def decorator(handler: Handler) -> Handler:
+            self.add(phrases, handler, takes_target=takes_target, name=name)
+            return handler
+
+        return decorator
+
+    def add(
+        self,
+        phrases: Iterable[str],
+        handler: Handler,
+        *,
+        takes_target: bool = True,
+        name: Optional[str] = None,
+    ) -> Verb:
+        word_lists = [phrase.lower().split() for phrase in phrases]
+        word_lists = [words for words in word_lists if words]
+        if not word_lists:
+            raise ValueError("A verb needs at least one phrase")
+        verb = Verb(name or " ".join(word_lists[0]), handler, takes_target)
+        for words in word_lists:
+            self._insert(words, verb)
+        self._verbs.append(verb)
+        return verb
+
+    def resolve(self, command: str) -> Optional[Tuple[Verb, Optional[str]]]:
+        """Return the verb matching ``command`` and its cleaned-up target."""
+        words = command.lower().split()
+        if not words:
+            return None
+        node = self._roots.get(words[0])
+        match: Optional[Tuple[Verb, int]] = None
+        consumed = 1
+        while node is not None:
+            verb = node.verb
+            if verb is not None and (verb.takes_target or consumed == len(words)):
+                match = (verb, consumed)
+            if consumed == len(words):
+                break
+            node = node.children.get(words[consumed])
+            consumed += 1
+        if match is None:
+            return None
+        verb, consumed = match
+        rest = words[consumed:]
+        while rest and rest[0] in TARGET_FILLERS:
+            rest = rest[1:]
+        return verb, " ".join(rest) or None
+
+    def copy(self) -> "VerbRegistry":
+        clone = VerbRegistry()
+        for words, verb in self._phrases:
+            clone._insert(words, verb)
+        clone._verbs = list(self._verbs)
+        return clone
+
+    def verbs(self) -> List[Verb]:
+        return list(self._verbs)
+
+    def __len__(self) -> int:
+        return len(self._verbs)
+
+    # Internal helpers --------------------------------------------------
+    def _insert(self, words: List[str], verb: Verb) -> None:
+        node = self._roots.setdefault(words[0], _PhraseNode())
+        for word in words[1:]:
+            node = node.children.setdefault(word, _PhraseNode())
+        node.verb = verb
+        self._phrases.append((words, verb))
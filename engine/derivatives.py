@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .artcache import default_cache_dir, file_digest
+from .png import PNGError, PNGImage, encode_png
+
+# Widths the web app serves through /assets/<image>?w=<width>.
+DERIVATIVE_WIDTHS = (320, 640, 1280)
+ASSET_PREFIX = "/assets/"
+
+
+def scaled_png(image: PNGImage, width: int) -> bytes:
+    """``image`` box-filtered to ``width`` pixels across, keeping its aspect ratio, as PNG."""
+    height = max(1, round(image.height * width / image.width))
+    rows = image.resize(width, height)
+    alpha = image.info.has_alpha
+    if not alpha:
+        rows = (_drop_alpha(line) for line in rows)
+    return encode_png(width, height, rows, alpha=alpha)
+
+
+def _drop_alpha(line: bytearray) -> bytearray:
+    del line[3::4]
+    return line
+
+
+class DerivativeCache:
+    """Scaled-down copies of PNG assets, generated on first request and kept on disk.
+
+    Files are named by the SHA-256 of the source plus the width, so an edited
+    image gets new derivatives and old ones are simply never read again.
+    Each is written to a temporary name and renamed into place, so processes
+    can share the directory; within a process, concurrent requests for the
+    same derivative wait for one thread to build it.
+    """
+
+    def __init__(self, directory: Optional[Path] = None) -> None:
+        self.directory = Path(directory) if directory is not None else default_cache_dir("images")
+        self._lock = threading.Lock()
+        self._building: Dict[str, threading.Lock] = {}
+        self._stats = {"hits": 0, "generated": 0}
+
+    def path(self, source: Path, width: int) -> Path:
+        """The file to serve for ``source`` at ``width``: a cached derivative,
+        or ``source`` itself when it is not wider than that.
+
+        Raises ``ValueError`` for a width outside ``DERIVATIVE_WIDTHS``,
+        ``PNGError`` for a source that is not a readable PNG and ``OSError``
+        when the cache directory cannot be written.
+        """
+        if width not in DERIVATIVE_WIDTHS:
+            raise ValueError(f"width must be one of {DERIVATIVE_WIDTHS}, got {width}")
+        image = PNGImage(source)
+        if width >= image.width:
+            return source
+        target = self.directory / f"{file_digest(source)}-w{width}.png"
+        if not target.exists():
+            with self._lock:
+                building = self._building.setdefault(target.name, threading.Lock())
+            with building:
+                if not target.exists():
+                    self._write(target, scaled_png(image, width))
+                    with self._lock:
+                        self._stats["generated"] += 1
+                    return target
+        with self._lock:
+            self._stats["hits"] += 1
+        return target
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def _write(self, target: Path, data: bytes) -> None:
+        import tempfile
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=target.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp_name, target)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+
+_widths: Dict[Path, Tuple[int, int, int]] = {}
+
+
+def srcset(label: str, source: Path) -> str:
+    """An HTML ``srcset`` for the asset ``label`` (resolved to ``source``).
+
+    Lists each derivative narrower than the image plus the original at its
+    own width, or is empty when ``source`` is not a readable PNG.
+    """
+    try:
+        stat = source.stat()
+        cached = _widths.get(source)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            width = cached[2]
+        else:
+            width = PNGImage(source).width
+            _widths[source] = (stat.st_mtime_ns, stat.st_size, width)
+    except (OSError, PNGError):
+        return ""
+    url = ASSET_PREFIX + label
+    candidates = [f"{url}?w={size} {size}w" for size in DERIVATIVE_WIDTHS if size < width]
+    candidates.append(f"{url} {width}w")
+    return ", ".join(candidates)
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-import zlib
-
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 
 from .models import (
     ActorMetadata,
@@ -13,9 +11,34 @@ from .models import (
     LocationMetadata,
     ObjectMetadata,
     PathwayMetadata,
+    StateOverlay,
     build_initial_state,
+    migrate_state,
+    writable_state,
 )
-from .llm import LLMClient, LLMUnavailableError, SerializedGameContext
+from .art import ART_STYLES, MAP_IMAGE, MAP_LOCATION, art_params, render_art, terminal_columns
+from .artcache import RENDER_CACHE, ArtCache, RenderCache
+from .derivatives import ASSET_PREFIX, srcset
+from .lazy import LazyLocations
+from .commands import Handler, VerbRegistry
+from .resolver import NameIndex, normalize_name
+
+if TYPE_CHECKING:
+    # engine.llm is only imported once a game actually talks to the LLM.
+    from .llm import LLMClient, SerializedGameContext
+
+_T = TypeVar("_T")
+
+VERBS = VerbRegistry()
+
+RENDER_MODES = ("each", "last", "none")
+
+# GameMetadata index giving the location each kind of entity belongs to.
+_HOME_INDEXES = {
+    "objects": "object_locations",
+    "actors": "actor_locations",
+    "pathways": "pathway_locations",
+}
 
 
 @dataclass
@@ -25,69 +48,193 @@ class CommandResponse:
 
 
 class GameEngine:
+    verbs: VerbRegistry = VERBS
+
     def __init__(
         self,
         metadata: GameMetadata,
         *,
         render_ascii_art: bool = True,
         llm_client: Optional[LLMClient] = None,
+        copy_on_write: bool = False,
+        art_cache: Optional[ArtCache] = None,
+        render_cache: Optional[RenderCache] = None,
+        art_style: str = "ascii",
+        art_columns: Optional[int] = None,
+        asset_root: Optional[Path] = None,
     ) -> None:
+        if art_style not in ART_STYLES:
+            raise ValueError(f"art_style must be one of {ART_STYLES}, got {art_style!r}")
         self.metadata = metadata
-        self.state: GameState = build_initial_state(metadata)
-        self.state.locations[self.state.player.location_id].visited = True
-        self._image_cache: Dict[str, str] = {}
+        self.state: GameState = build_initial_state(metadata, copy_on_write=copy_on_write)
+        # Every mutation bumps state_version and records (kind, id) in dirty;
+        # rendered views are memoized per location against these versions.
+        self.state_version = 0
+        self.dirty: Set[Tuple[str, str]] = set()
+        self._location_versions: Dict[str, int] = {}
+        self._inventory_version = 0
+        self._render_cache: Dict[str, Dict[str, Tuple[Tuple[object, ...], Any]]] = {
+            "describe": {},
+            "view_state": {},
+        }
+        self._cache_stats: Dict[str, Dict[str, int]] = {
+            name: {"hits": 0, "misses": 0} for name in self._render_cache
+        }
+        self._edit("locations", self.state.player.location_id).visited = True
+        # Rendered art is shared in memory with the other engines of this
+        # process and, with an art_cache, on disk with other processes.
+        self.render_cache = render_cache if render_cache is not None else RENDER_CACHE
+        self.art_cache = art_cache
+        # Color styles follow the terminal's width unless art_columns is set;
+        # each width is rendered and cached separately.
+        self.art_style = art_style
+        self.art_columns = art_columns
+        # Relative image paths resolve here; the working directory when None.
+        self.asset_root = asset_root
+        # Player-held items get their own name index, updated as items are taken.
+        self._inventory_names: NameIndex = NameIndex(
+            self.metadata.objects[obj_id] for obj_id in self.state.player.inventory
+        )
         self.render_ascii_art = render_ascii_art
         self.llm_client = llm_client
         self._llm_history: List[Dict[str, str]] = []
 
     # Public API -----------------------------------------------------------
-    def handle_command(self, raw_input: str) -> CommandResponse:
+    def register_verb(
+        self,
+        *phrases: str,
+        handler: Handler,
+        takes_target: bool = True,
+        name: Optional[str] = None,
+    ) -> None:
+        """Add a verb for this engine only, leaving the class-wide table untouched."""
+        if self.verbs is type(self).verbs:
+            self.verbs = self.verbs.copy()
+        self.verbs.add(phrases, handler, takes_target=takes_target, name=name)
+
+    def reload_metadata(self, metadata: GameMetadata) -> None:
+        """Switch to a reloaded version of this game without losing progress.
+
+        Session state is migrated by entity id (see ``migrate_state``) and
+        every memoized view is dropped, since any location may have changed.
+        """
+        copy_on_write = isinstance(self.state.objects, StateOverlay)
+        self.metadata = metadata
+        self._adopt_state(migrate_state(self.state, metadata, copy_on_write=copy_on_write))
+
+    def export_session(self) -> Dict[str, Any]:
+        """This session's progress as picklable data for :meth:`restore_session`.
+
+        With ``copy_on_write`` only the entity states the session changed
+        are included, not the shared baseline. Entries are the live state
+        objects: pickle or copy the result before the session moves on.
+        """
+
+        def own(states: Any) -> Dict[str, Any]:
+            return dict(states.delta if isinstance(states, StateOverlay) else states)
+
+        state = self.state
+        return {
+            "state": GameState(
+                player=state.player,
+                objects=own(state.objects),
+                actors=own(state.actors),
+                pathways=own(state.pathways),
+                locations=own(state.locations),
+            ),
+            "llm_history": self._llm_history,
+        }
+
+    def restore_session(self, snapshot: Dict[str, Any]) -> None:
+        """Replace this session's progress with one from :meth:`export_session`."""
+        copy_on_write = isinstance(self.state.objects, StateOverlay)
+        self._adopt_state(migrate_state(snapshot["state"], self.metadata, copy_on_write=copy_on_write))
+        self._llm_history = list(snapshot["llm_history"])
+
+    def _adopt_state(self, state: GameState) -> None:
+        self.state = state
+        for cache in self._render_cache.values():
+            cache.clear()
+        self._location_versions.clear()
+        self._inventory_names = NameIndex(
+            self.metadata.objects[obj_id] for obj_id in self.state.player.inventory
+        )
+        self._inventory_version += 1
+        self._edit("locations", self.state.player.location_id).visited = True
+
+    def handle_command(self, raw_input: str, *, render_art: Optional[bool] = None) -> CommandResponse:
+        """Run one command. ``render_art`` overrides ``render_ascii_art`` for it alone."""
+        if render_art is None or render_art == self.render_ascii_art:
+            return self._dispatch(raw_input)
+        default = self.render_ascii_art
+        self.render_ascii_art = render_art
+        try:
+            return self._dispatch(raw_input)
+        finally:
+            self.render_ascii_art = default
+
+    def _dispatch(self, raw_input: str) -> CommandResponse:
         command = raw_input.strip()
         if not command:
             return CommandResponse(self.describe_current_location())
 
-        lowered = command.lower()
-
-        if lowered in {"look", "look around", "l"}:
-            return CommandResponse(self.describe_current_location())
-        if lowered in {"details", "examine location"}:
-            return CommandResponse(self.describe_location_details())
-        if lowered in {"inventory", "i"}:
-            return CommandResponse(self.describe_inventory())
-        if lowered == "help":
-            return CommandResponse(self.describe_help())
-
-        if lowered in {"map", "view map", "study map", "look at map"}:
-            return CommandResponse(self.show_map())
-
-        if lowered.startswith("inspect ") or lowered.startswith("examine "):
-            target = self._extract_target(lowered)
-            return CommandResponse(self.inspect_object(target))
-
-        if lowered.startswith("take ") or lowered.startswith("pick up "):
-            target = self._extract_target(lowered)
-            return CommandResponse(self.take_object(target))
-
-        if lowered.startswith("open "):
-            target = self._extract_target(lowered)
-            return CommandResponse(self.open_object(target))
-
-        if lowered.startswith("talk ") or lowered.startswith("speak "):
-            target = self._extract_target(lowered)
-            return CommandResponse(self.talk_to_actor(target))
-
-        if lowered.startswith("go ") or lowered.startswith("move "):
-            target = self._extract_target(lowered)
-            if target == "map":
-                return CommandResponse(self.show_map())
-            return CommandResponse(self.move_to_location(target))
+        resolved = self.verbs.resolve(command)
+        if resolved is not None:
+            verb, target = resolved
+            return CommandResponse(verb.invoke(self, target))
 
         # Placeholder for LLM-backed responses.
         lore = self.describe_location_details()
         llm_text, via_llm = self._llm_response(command, lore)
         return CommandResponse(llm_text, handled=via_llm)
 
+    def handle_commands(
+        self,
+        commands: Iterable[str],
+        render: str = "last",
+        *,
+        lookahead: bool = True,
+    ) -> Iterator[CommandResponse]:
+        """Run a sequence of commands, yielding each response as it completes.
+
+        ``render`` controls location artwork: ``"each"`` renders it for every
+        command, ``"last"`` only for the final command and ``"none"`` never.
+        To recognise the final command, ``"last"`` reads one command ahead,
+        which holds back each response until the next command arrives. Pass
+        ``lookahead=False`` for input typed or piped in live; ``"last"`` then
+        draws no art, since no command is known to be the final one.
+        ``render`` is checked here, not when the first response is taken.
+        """
+        if render not in RENDER_MODES:
+            raise ValueError(f"render must be one of {', '.join(RENDER_MODES)}")
+        return self._run_commands(iter(commands), render, lookahead)
+
+    def _run_commands(self, commands: Iterator[str], render: str, lookahead: bool) -> Iterator[CommandResponse]:
+        art = self.render_ascii_art
+        if render != "last" or not lookahead:
+            for command in commands:
+                yield self.handle_command(command, render_art=art and render == "each")
+            return
+        end = object()
+        pending = next(commands, end)
+        while pending is not end:
+            upcoming = next(commands, end)
+            yield self.handle_command(pending, render_art=art and upcoming is end)  # type: ignore[arg-type]
+            pending = upcoming
+
+    @VERBS.register("look", "look around", "l", takes_target=False)
     def describe_current_location(self) -> str:
+        location_id = self.state.player.location_id
+        art = None
+        if self.render_ascii_art:
+            # Include the image's signature, so editing it invalidates the memo too.
+            image = self.current_location.image.strip()
+            signature = image and self._asset_signature(self._asset_path(image))
+            art = (self.art_style, self._art_columns(), signature)
+        key = (self._location_versions.get(location_id, 0), art)
+        return self._memoized("describe", location_id, key, self._render_current_location)
+
+    def _render_current_location(self) -> str:
         location = self.current_location
         parts: List[str] = []
         artwork = None
@@ -117,21 +264,20 @@ class GameEngine:
             parts.append(f"Exits: {path_names}.")
         return "\n".join(parts)
 
+    @VERBS.register("details", "examine location", takes_target=False)
     def describe_location_details(self) -> str:
         details = self.current_location.details.strip()
         return details or "Nothing notable beyond the obvious." 
 
+    @VERBS.register("inventory", "i", takes_target=False)
     def describe_inventory(self) -> str:
         inventory = self.state.player.inventory
         if not inventory:
             return "Your inventory is empty."
-        rendered: List[str] = []
-        for obj_id in inventory:
-            meta = self._object_by_id(obj_id)
-            if meta:
-                rendered.append(meta.name)
-        return "You carry: " + ", ".join(rendered)
+        objects = self.metadata.objects
+        return "You carry: " + ", ".join(objects[obj_id].name for obj_id in inventory)
 
+    @VERBS.register("help", takes_target=False)
     def describe_help(self) -> str:
         return (
             "Commands: look, details, inventory, map, inspect <object>, take <object>, open <object>, "
@@ -139,6 +285,7 @@ class GameEngine:
         )
 
     # Object commands -----------------------------------------------------
+    @VERBS.register("inspect", "examine")
     def inspect_object(self, target: Optional[str]) -> str:
         if not target:
             return "Inspect what?"
@@ -146,43 +293,46 @@ class GameEngine:
         obj = self._match_object_in_scope(target)
         if not obj:
             return f"There is no '{target}' to inspect."
-        state = self.state.objects.get(obj.id)
+        state = self.state.objects[obj.id]
         description = obj.description
         if obj.details:
             description = f"{description}\n{obj.details}"
-        if state and state.status:
+        if state.status:
             state_bits = ", ".join(f"{key}={value}" for key, value in state.status.items())
             description = f"{description}\nCurrent state: {state_bits}."
         return description
 
+    @VERBS.register("take", "pick up")
     def take_object(self, target: Optional[str]) -> str:
         if not target:
             return "Take what?"
         obj = self._match_object_in_scope(target, include_inventory=False)
         if not obj:
             return f"You cannot find '{target}'."
-        state = self.state.objects[obj.id]
-        if state.held_by_player:
+        if self.state.objects[obj.id].held_by_player:
             return "You already have it."
         if not obj.can_pick_up:
             return "That cannot be picked up."
-        state.held_by_player = True
+        self._edit("objects", obj.id).held_by_player = True
         self.state.player.inventory.append(obj.id)
+        self._inventory_names.add(obj)
+        self._mark_dirty("player", "inventory")
         return f"You pick up the {obj.name}."
 
+    @VERBS.register("open")
     def open_object(self, target: Optional[str]) -> str:
         if not target:
             return "Open what?"
         obj = self._match_object_in_scope(target)
         if not obj:
             return f"There is no '{target}' here."
-        state = self.state.objects[obj.id]
-        if state.status.get("open") == "true":
+        if self.state.objects[obj.id].status.get("open") == "true":
             return "It is already open."
-        state.status["open"] = "true"
+        self._edit("objects", obj.id).status["open"] = "true"
         return f"You open the {obj.name}."
 
     # Actor commands ------------------------------------------------------
+    @VERBS.register("talk", "speak")
     def talk_to_actor(self, target: Optional[str]) -> str:
         if not target:
             return "Talk to whom?"
@@ -193,6 +343,12 @@ class GameEngine:
         return dialogue
 
     # Movement -------------------------------------------------------------
+    @VERBS.register("go", "move")
+    def _handle_go(self, target: Optional[str]) -> str:
+        if target == "map":
+            return self.show_map()
+        return self.move_to_location(target)
+
     def move_to_location(self, target: Optional[str]) -> str:
         if not target:
             return "Go where?"
@@ -205,10 +361,50 @@ class GameEngine:
         if state.locked:
             return "That way is locked."
         self.state.player.location_id = pathway.target
-        self.state.locations[pathway.target].visited = True
+        self._mark_dirty("player", "location")
+        if not self.state.locations[pathway.target].visited:
+            self._edit("locations", pathway.target).visited = True
         return self.describe_current_location()
 
     # Helpers --------------------------------------------------------------
+    def _edit(self, kind: str, entity_id: str) -> Any:
+        """Return the writable state of an entity and record the change."""
+        entry = writable_state(getattr(self.state, kind), entity_id)
+        self._mark_dirty(kind, entity_id)
+        return entry
+
+    def _mark_dirty(self, kind: str, entity_id: str) -> None:
+        self.state_version += 1
+        self.dirty.add((kind, entity_id))
+        if kind == "player":
+            if entity_id == "inventory":
+                self._inventory_version += 1
+            return
+        if kind == "locations":
+            location_id: Optional[str] = entity_id
+        else:
+            location_id = getattr(self.metadata, _HOME_INDEXES[kind]).get(entity_id)
+        if location_id is not None:
+            self._location_versions[location_id] = self._location_versions.get(location_id, 0) + 1
+
+    def _memoized(
+        self,
+        cache_name: str,
+        location_id: str,
+        key: Tuple[object, ...],
+        build: Callable[[], Any],
+    ) -> Any:
+        cache = self._render_cache[cache_name]
+        stats = self._cache_stats[cache_name]
+        entry = cache.get(location_id)
+        if entry is not None and entry[0] == key:
+            stats["hits"] += 1
+            return entry[1]
+        stats["misses"] += 1
+        value = build()
+        cache[location_id] = (key, value)
+        return value
+
     @property
     def current_location(self) -> LocationMetadata:
         return self.metadata.locations[self.state.player.location_id]
@@ -233,10 +429,7 @@ class GameEngine:
         for obj in self._objects_in_location(self.current_location):
             if not self.state.objects[obj.id].held_by_player:
                 objects.append(obj)
-        for obj_id in self.state.player.inventory:
-            obj_meta = self._object_by_id(obj_id)
-            if obj_meta:
-                objects.append(obj_meta)
+        objects.extend(self.metadata.objects[obj_id] for obj_id in self.state.player.inventory)
         return objects
 
     def _match_object_in_scope(
@@ -244,63 +437,64 @@ class GameEngine:
         target: str,
         include_inventory: bool = True,
     ) -> Optional[ObjectMetadata]:
-        target_lower = target.lower()
-        candidates = []
-        for obj in self._objects_in_location(self.current_location):
-            if obj.name.lower() == target_lower or obj.id.lower() == target_lower:
+        key = normalize_name(target)
+        location_names = self.current_location.names.objects
+        # Exact names win over prefixes anywhere in scope before prefixes are tried.
+        for strategy in (NameIndex.exact, NameIndex.prefix):
+            held = None
+            for obj in strategy(location_names, key):
                 if not self.state.objects[obj.id].held_by_player:
                     return obj
-                candidates.append(obj)
-        if include_inventory:
-            for obj_id in self.state.player.inventory:
-                obj = self._object_by_id(obj_id)
-                if obj and (obj.name.lower() == target_lower or obj.id.lower() == target_lower):
+                held = held or obj
+            if include_inventory:
+                for obj in strategy(self._inventory_names, key):
                     return obj
-        if candidates:
-            return candidates[0]
+            if held:
+                return held
         return None
 
     def _match_actor_in_scope(self, target: str) -> Optional[ActorMetadata]:
-        target_lower = target.lower()
-        for actor in self._actors_in_location():
-            if actor.name.lower() == target_lower or actor.id.lower() == target_lower:
-                return actor
-        return None
+        return self._resolve_name(self.current_location.names.actors, target)
 
     def _match_pathway_in_scope(self, target: str) -> Optional[PathwayMetadata]:
-        target_lower = target.lower()
-        for path in self._pathways_in_location():
-            if path.name.lower() == target_lower or path.id.lower() == target_lower:
-                return path
-        return None
-
-    def _object_by_id(self, obj_id: str) -> Optional[ObjectMetadata]:
-        for location in self.metadata.locations.values():
-            for obj in location.objects:
-                if obj.id == obj_id:
-                    return obj
-        return None
+        return self._resolve_name(self.current_location.names.pathways, target)
 
     @staticmethod
-    def _extract_target(command: str) -> Optional[str]:
-        parts = command.split(" ", 1)
-        if len(parts) == 1:
-            return None
-        target = parts[1].strip()
-        cleanup_prefixes = ("to ", "the ", "at ", "toward ", "towards ")
-        changed = True
-        while changed and target:
-            changed = False
-            for prefix in cleanup_prefixes:
-                if target.startswith(prefix):
-                    target = target[len(prefix) :].strip()
-                    changed = True
-        return target or None
+    def _resolve_name(index: NameIndex[_T], target: str) -> Optional[_T]:
+        key = normalize_name(target)
+        matches = index.exact(key) or index.prefix(key)
+        return matches[0] if matches else None
+
+    def _object_by_id(self, obj_id: str) -> ObjectMetadata:
+        # Ids reaching the engine were checked at load time; no None fallback.
+        return self.metadata.objects[obj_id]
 
     def _render_location_image(self, location: LocationMetadata) -> Optional[str]:
         return self._render_image_asset(location.image)
 
     def view_state(self) -> Dict[str, object]:
+        """Return the web view of the current location and inventory.
+
+        The result is memoized until the state changes; treat it as read-only.
+        """
+        location_id = self.state.player.location_id
+        key = (self._location_versions.get(location_id, 0), self._inventory_version)
+        return self._memoized("view_state", location_id, key, self._build_view_state)
+
+    def cache_info(self) -> Dict[str, object]:
+        return {
+            "state_version": self.state_version,
+            **{name: dict(stats) for name, stats in self._cache_stats.items()},
+            "render_cache": self.render_cache.stats(),
+            **({"art_cache": self.art_cache.stats()} if self.art_cache is not None else {}),
+        }
+
+    def drain_dirty(self) -> Set[Tuple[str, str]]:
+        """Return the entities modified since the last call and reset the set."""
+        dirty, self.dirty = self.dirty, set()
+        return dirty
+
+    def _build_view_state(self) -> Dict[str, object]:
         location = self.current_location
         actors = [
             {
@@ -333,11 +527,11 @@ class GameEngine:
             for path in location.pathways
             if not self.state.pathways[path.id].hidden
         ]
-        inventory = []
-        for obj_id in self.state.player.inventory:
-            meta = self._object_by_id(obj_id)
-            if meta:
-                inventory.append({"id": obj_id, "name": meta.name})
+        objects_by_id = self.metadata.objects
+        inventory = [
+            {"id": obj_id, "name": objects_by_id[obj_id].name}
+            for obj_id in self.state.player.inventory
+        ]
         return {
             "location": {
                 "id": location.id,
@@ -345,6 +539,7 @@ class GameEngine:
                 "description": location.description,
                 "details": location.details,
                 "image": location.image,
+                "srcset": srcset(location.image, self._asset_path(location.image)),
                 "actors": actors,
                 "objects": objects,
                 "exits": exits,
@@ -352,25 +547,24 @@ class GameEngine:
             "inventory": inventory,
         }
 
+    @VERBS.register("map", "view map", "study map", "look at map", takes_target=False)
     def show_map(self) -> str:
-        if self.current_location.id != "captains_cabin":
+        if self.current_location.id != MAP_LOCATION:
             return "There is no map to study here."
         art = None
         if self.render_ascii_art:
-            art = self._render_image_asset("images/PirateMap.png")
-        map_object = next((obj for obj in self.current_location.objects if obj.id == "treasure_map"), None)
+            art = self._render_image_asset(MAP_IMAGE)
+        map_object = self.metadata.objects.get("treasure_map")
         description = map_object.details if map_object and map_object.details else "The weathered parchment hints at a hidden cove marked with a bold red X."
         if art:
             return f"{art}\n{description}"
-        return description + "\nMap available at /assets/images/PirateMap.png"
+        return description + f"\nMap available at {ASSET_PREFIX}{MAP_IMAGE}"
 
     def _serialize_for_llm(self) -> SerializedGameContext:
-        locations = list(self.metadata.locations.values())
-        inventory_objects: List[ObjectMetadata] = []
-        for obj_id in self.state.player.inventory:
-            meta = self._object_by_id(obj_id)
-            if meta:
-                inventory_objects.append(meta)
+        from .llm import SerializedGameContext
+
+        locations = self._llm_locations()
+        inventory_objects = [self.metadata.objects[obj_id] for obj_id in self.state.player.inventory]
         return SerializedGameContext(
             title=self.metadata.title,
             summary=self.metadata.summary,
@@ -380,6 +574,21 @@ class GameEngine:
             inventory=inventory_objects,
         )
 
+    def _llm_locations(self) -> List[LocationMetadata]:
+        locations = self.metadata.locations
+        if not isinstance(locations, LazyLocations):
+            return list(locations.values())
+        # Listing every location would parse the whole lazy file; send the
+        # current one, its neighbours and whatever is already loaded.
+        current = self.current_location
+        chosen = {current.id: current}
+        for path in current.pathways:
+            if path.target in locations:
+                chosen.setdefault(path.target, locations[path.target])
+        for location_id, location in list(locations.loaded.items()):
+            chosen.setdefault(location_id, location)
+        return list(chosen.values())
+
     def _llm_response(self, command: str, lore: str) -> Tuple[str, bool]:
         fallback = (
             "The narrative engine would answer via an AI, "
@@ -389,6 +598,8 @@ class GameEngine:
         if not self.llm_client:
             return fallback, False
 
+        from .llm import LLMUnavailableError
+
         try:
             context = self._serialize_for_llm()
             response = self.llm_client.generate_response(command, context, self._llm_history)
@@ -406,17 +617,19 @@ class GameEngine:
         path_label = path_label.strip()
         if not path_label:
             return None
-        cached = self._image_cache.get(path_label)
+        asset_path = self._asset_path(path_label)
+        # The file's mtime and size are part of the key, so an edited image
+        # is rendered again rather than served stale from the shared cache.
+        columns = self._art_columns()
+        params = art_params(self.art_style, columns)
+        key = (asset_path, self._asset_signature(asset_path), params)
+        cached = self.render_cache.get(key)
         if cached is not None:
             return cached
 
-        asset_path = Path(path_label)
-        if not asset_path.is_absolute():
-            asset_path = Path.cwd() / asset_path
-
         if asset_path.suffix.lower() == ".png":
             try:
-                content = self._png_to_ascii(asset_path)
+                content = self._cached_png_art(asset_path, columns, params)
             except Exception:
                 content = f"[unable to render image: {path_label}]"
         else:
@@ -425,78 +638,33 @@ class GameEngine:
             except OSError:
                 content = f"[missing artwork: {path_label}]"
 
-        self._image_cache[path_label] = content
+        self.render_cache.put(key, content)
         return content
 
-    def _png_to_ascii(self, path: Path) -> str:
-        width, height, pixels = self._decode_png_rgba(path)
-        target_cols = min(60, width)
-        if target_cols <= 0:
-            return ""
-        step_x = width / target_cols
-        # characters are roughly twice as tall as they are wide
-        step_y = max(1.0, step_x * 0.5)
-        rows = min(40, max(1, int(height / step_y)))
-        ramp = " .:-=+*#%@"
-        ascii_lines: List[str] = []
-        for row_index in range(rows):
-            y = min(height - 1, int(row_index * step_y))
-            line_chars: List[str] = []
-            for col_index in range(target_cols):
-                x = min(width - 1, int(col_index * step_x))
-                r, g, b, a = pixels[y][x]
-                if a < 40:
-                    line_chars.append(" ")
-                    continue
-                luminance = 0.2126 * r + 0.7152 * g + 0.0722 * b
-                idx = int(luminance / 255 * (len(ramp) - 1))
-                line_chars.append(ramp[idx])
-            ascii_lines.append("".join(line_chars))
-        return "\n".join(ascii_lines)
+    def _asset_path(self, path_label: str) -> Path:
+        asset_path = Path(path_label.strip())
+        return asset_path if asset_path.is_absolute() else (self.asset_root or Path.cwd()) / asset_path
 
     @staticmethod
-    def _decode_png_rgba(path: Path) -> Tuple[int, int, List[List[Tuple[int, int, int, int]]]]:
-        data = path.read_bytes()
-        if not data.startswith(b"\x89PNG\r\n\x1a\n"):
-            raise ValueError("Not a PNG file")
-
-        offset = 8
-        width = height = None
-        idat_data = bytearray()
-        while offset < len(data):
-            length = int.from_bytes(data[offset : offset + 4], "big")
-            chunk_type = data[offset + 4 : offset + 8]
-            chunk_data = data[offset + 8 : offset + 8 + length]
-            offset += 12 + length
-            if chunk_type == b"IHDR":
-                width = int.from_bytes(chunk_data[0:4], "big")
-                height = int.from_bytes(chunk_data[4:8], "big")
-                bit_depth = chunk_data[8]
-                color_type = chunk_data[9]
-                if bit_depth != 8 or color_type != 6:
-                    raise ValueError("Unsupported PNG format")
-            elif chunk_type == b"IDAT":
-                idat_data.extend(chunk_data)
-            elif chunk_type == b"IEND":
-                break
-
-        if width is None or height is None:
-            raise ValueError("PNG missing IHDR")
-
-        decompressed = zlib.decompress(bytes(idat_data))
-        stride = width * 4
-        pixels: List[List[Tuple[int, int, int, int]]] = []
-        idx = 0
-        for _ in range(height):
-            filter_type = decompressed[idx]
-            idx += 1
-            if filter_type != 0:
-                raise ValueError("Unsupported PNG filter")
-            row: List[Tuple[int, int, int, int]] = []
-            row_bytes = decompressed[idx : idx + stride]
-            idx += stride
-            for px in range(0, len(row_bytes), 4):
-                r, g, b, a = row_bytes[px : px + 4]
-                row.append((r, g, b, a))
-            pixels.append(row)
-        return width, height, pixels
+    def _asset_signature(asset_path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = asset_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _art_columns(self) -> int:
+        if self.art_style == "ascii":
+            return 0  # fixed width, see engine.art.ART_COLUMNS
+        return self.art_columns or terminal_columns()
+
+    def _cached_png_art(self, path: Path, columns: int, params: Tuple[object, ...]) -> str:
+        style = self.art_style
+        if self.art_cache is None:
+            return render_art(path, style, columns)
+        key = self.art_cache.key(path, params)
+        content = self.art_cache.get(key)
+        if content is None:
+            content = render_art(path, style, columns)
+            self.art_cache.put(key, content)
+        return content
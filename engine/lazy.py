@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Mapping, MutableMapping, Optional, Tuple, TypeVar
+
+from .loader import build_location, index_location
+from .models import (
+    HIDDEN,
+    LOCKED,
+    ActorState,
+    GameMetadata,
+    GameState,
+    LocationMetadata,
+    LocationState,
+    ObjectState,
+    PathwayState,
+    PlayerMetadata,
+    PlayerState,
+    ReferenceIndex,
+    set_baseline_state,
+)
+from .validation import ReferenceChecker
+from .vocabulary import VOCABULARY
+
+V = TypeVar("V")
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_ENTITY_KINDS = ("objects", "actors", "pathways")
+
+
+@dataclass
+class GameFileIndex:
+    """Byte offsets of every location in a game file plus entity ownership."""
+
+    header: Dict[str, Any]
+    spans: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    owners: Dict[str, Dict[str, str]] = field(
+        default_factory=lambda: {kind: {} for kind in _ENTITY_KINDS}
+    )
+    references: ReferenceIndex = field(default_factory=ReferenceIndex)
+
+
+def scan_game_file(text: str) -> GameFileIndex:
+    """Index the game document ``text`` in one pass.
+
+    Top-level values are decoded one at a time; each element of the
+    ``locations`` array is decoded only long enough to record its id, its
+    byte span in the UTF-8 file and the ids of the entities it holds, so peak
+    memory is the text plus a single location. References are validated in
+    the same pass, raising ``GameValidationError`` as ``load_game`` would.
+    """
+    decoder = json.JSONDecoder()
+    index = GameFileIndex(header={})
+    checker = ReferenceChecker(VOCABULARY)
+    intern = VOCABULARY.intern
+    ascii_only = text.isascii()
+    char_cursor = byte_cursor = 0
+
+    def byte_offset(char_pos: int) -> int:
+        nonlocal char_cursor, byte_cursor
+        if ascii_only:
+            return char_pos
+        byte_cursor += len(text[char_cursor:char_pos].encode("utf-8"))
+        char_cursor = char_pos
+        return byte_cursor
+
+    def skip(pos: int, expected: str = "") -> int:
+        pos = _WHITESPACE.match(text, pos).end()  # type: ignore[union-attr]
+        if expected:
+            if text[pos : pos + 1] != expected:
+                raise ValueError(f"Expected {expected!r} at offset {pos} of game file")
+            pos = _WHITESPACE.match(text, pos + 1).end()  # type: ignore[union-attr]
+        return pos
+
+    pos = skip(0, "{")
+    while text[pos : pos + 1] != "}":
+        key, pos = decoder.raw_decode(text, pos)
+        pos = skip(pos, ":")
+        if key != "locations":
+            index.header[key], pos = decoder.raw_decode(text, pos)
+        else:
+            pos = skip(pos, "[")
+            position = 0
+            while text[pos : pos + 1] != "]":
+                location_cfg, end = decoder.raw_decode(text, pos)
+                checker.add_location(position, location_cfg)
+                position += 1
+                location_id = location_cfg.get("id")
+                if isinstance(location_id, str):
+                    # Entries missing ids are reported by the checker below.
+                    location_id = intern(location_id)
+                    index.spans[location_id] = (byte_offset(pos), byte_offset(end))
+                    for kind in _ENTITY_KINDS:
+                        owners = index.owners[kind]
+                        for entity_cfg in location_cfg.get(kind, ()):
+                            if isinstance(entity_cfg.get("id"), str):
+                                owners[intern(entity_cfg["id"])] = location_id
+                pos = skip(end)
+                if text[pos : pos + 1] == ",":
+                    pos = skip(pos + 1)
+            pos += 1
+        pos = skip(pos)
+        if text[pos : pos + 1] == ",":
+            pos = skip(pos + 1)
+    index.references = checker.finish(index.header)
+    return index
+
+
+class LazyLocations(Mapping[str, LocationMetadata]):
+    """Location mapping that parses each location the first time it is read."""
+
+    def __init__(self, data: Any, index: GameFileIndex) -> None:
+        self._data = data
+        self._index = index
+        self._loaded: Dict[str, LocationMetadata] = {}
+        self._lock = threading.Lock()
+        self.game: Optional[GameMetadata] = None
+
+    @property
+    def loaded(self) -> Dict[str, LocationMetadata]:
+        return self._loaded
+
+    def __getitem__(self, location_id: str) -> LocationMetadata:
+        location = self._loaded.get(location_id)
+        if location is not None:
+            return location
+        start, end = self._index.spans[location_id]
+        with self._lock:
+            location = self._loaded.get(location_id)
+            if location is None:
+                location = build_location(json.loads(self._data[start:end]))
+                if self.game is not None:
+                    index_location(self.game, location)
+                self._loaded[location_id] = location
+        return location
+
+    def __contains__(self, location_id: object) -> bool:
+        return location_id in self._index.spans
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index.spans)
+
+    def __len__(self) -> int:
+        return len(self._index.spans)
+
+
+class LazyIndex(MutableMapping[str, V]):
+    """Id index whose entries appear once their owning location is loaded."""
+
+    def __init__(self, owners: Mapping[str, str], locations: LazyLocations) -> None:
+        self._owners = owners
+        self._locations = locations
+        self._entries: Dict[str, V] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __getitem__(self, key: str) -> V:
+        entry = self._entries.get(key)
+        if entry is None:
+            owner = self._owners[key]
+            self._locations[owner]
+            entry = self._entries[key]
+        return entry
+
+    def __setitem__(self, key: str, value: V) -> None:
+        self._entries[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._entries[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries or key in self._owners
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._owners)
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+
+class DefaultStates(Mapping[str, V]):
+    """Read-only baseline states created from metadata the first time they are read."""
+
+    def __init__(self, ids: Mapping[str, Any], factory: Callable[[str], V]) -> None:
+        self._ids = ids
+        self._factory = factory
+        self._states: Dict[str, V] = {}
+
+    def __getitem__(self, key: str) -> V:
+        state = self._states.get(key)
+        if state is None:
+            if key not in self._ids:
+                raise KeyError(key)
+            state = self._states.setdefault(key, self._factory(key))
+        return state
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+def load_game_lazy(path: Path) -> GameMetadata:
+    """Index ``path`` once and return metadata that loads locations on demand.
+
+    Locations, the id indexes and the shared baseline state all materialize
+    transparently when first read, so startup cost is one scan of the file
+    and only the id index and the file's bytes stay resident. The file is
+    read once: locations are parsed from that copy, so editing or
+    truncating it later cannot shift their offsets.
+    Sessions should be created with ``copy_on_write=True`` so building their
+    state does not force every location to load.
+    """
+    data = Path(path).read_bytes()
+    index = scan_game_file(data.decode("utf-8"))
+    header = index.header
+    intern = VOCABULARY.intern
+    player_cfg = header["player"]
+    player = PlayerMetadata(
+        name=intern(player_cfg.get("name", "Player")),
+        description=player_cfg.get("description", ""),
+        starting_inventory=tuple(intern(obj_id) for obj_id in player_cfg.get("starting_inventory", [])),
+    )
+    locations = LazyLocations(data, index)
+    game = GameMetadata(
+        title=header.get("title", "Untitled"),
+        summary=header.get("summary", ""),
+        start_location=intern(header["start_location"]),
+        locations=locations,  # type: ignore[arg-type]
+        player=player,
+        objects=LazyIndex(index.owners["objects"], locations),  # type: ignore[arg-type]
+        actors=LazyIndex(index.owners["actors"], locations),  # type: ignore[arg-type]
+        pathways=LazyIndex(index.owners["pathways"], locations),  # type: ignore[arg-type]
+        object_locations=index.owners["objects"],
+        actor_locations=index.owners["actors"],
+        pathway_locations=index.owners["pathways"],
+        references=index.references,
+    )
+    locations.game = game
+    set_baseline_state(game, _lazy_baseline(game))
+    return game
+
+
+def _lazy_baseline(game: GameMetadata) -> GameState:
+    held = set(game.player.starting_inventory)
+
+    def object_state(obj_id: str) -> ObjectState:
+        return ObjectState.from_status(game.objects[obj_id].initial_state, obj_id in held)
+
+    def pathway_state(path_id: str) -> PathwayState:
+        path = game.pathways[path_id]
+        return PathwayState((LOCKED if path.locked else 0) | (HIDDEN if path.hidden else 0))
+
+    return GameState(
+        player=PlayerState(
+            location_id=game.start_location,
+            inventory=list(game.player.starting_inventory),
+        ),
+        objects=DefaultStates(game.object_locations, object_state),  # type: ignore[arg-type]
+        actors=DefaultStates(game.actor_locations, lambda _: ActorState()),  # type: ignore[arg-type]
+        pathways=DefaultStates(game.pathway_locations, pathway_state),  # type: ignore[arg-type]
+        locations=DefaultStates(game.locations, lambda _: LocationState()),  # type: ignore[arg-type]
+    )
@@ -1,11 +1,9 @@
 from __future__ import annotations
 
-import json
 import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
-from urllib import error, request
 
 from .models import ActorMetadata, LocationMetadata, ObjectMetadata, PathwayMetadata
 
@@ -55,6 +53,11 @@ class LLMClient:
         if not self.available():
             raise LLMUnavailableError("OpenAI API key not configured.")
 
+        # Deferred so importing the engine (or a keyless client) never loads
+        # the HTTP stack.
+        import json
+        from urllib import error, request
+
         messages = self._build_messages(command, context, llm_history)
         payload = {
             "model": self.model,
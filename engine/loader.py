@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional
 
 from .models import (
     ActorMetadata,
@@ -9,74 +9,132 @@ from .models import (
     ObjectMetadata,
     PathwayMetadata,
     PlayerMetadata,
+    freeze_game,
+    read_only,
 )
+from .resolver import LocationNames, NameIndex
+from .validation import validate_game_config
+from .vocabulary import VOCABULARY, Vocabulary, interner
 
 
-def load_game(metadata: Dict[str, Any]) -> GameMetadata:
+def load_game(metadata: Dict[str, Any], vocabulary: Optional[Vocabulary] = VOCABULARY) -> GameMetadata:
+    """Validate ``metadata`` and build indexed game metadata from it.
+
+    Raises ``GameValidationError`` listing every missing field and dangling
+    reference, so the engine can trust ids once a game has loaded. Ids,
+    names and state keys and values are interned through ``vocabulary``
+    (the process-wide table by default; ``None`` keeps the parser's copies).
+    """
+    references = validate_game_config(metadata, vocabulary)
+    intern = interner(vocabulary)
     player_cfg = metadata["player"]
     player = PlayerMetadata(
-        name=player_cfg.get("name", "Player"),
+        name=intern(player_cfg.get("name", "Player")),
         description=player_cfg.get("description", ""),
-        starting_inventory=list(player_cfg.get("starting_inventory", [])),
+        starting_inventory=tuple(intern(obj_id) for obj_id in player_cfg.get("starting_inventory", [])),
     )
 
     locations: Dict[str, LocationMetadata] = {}
     for location_cfg in metadata.get("locations", []):
-        objects = [
-            ObjectMetadata(
-                id=obj_cfg["id"],
-                name=obj_cfg.get("name", obj_cfg["id"]),
-                description=obj_cfg.get("description", ""),
-                details=obj_cfg.get("details", ""),
-                can_pick_up=obj_cfg.get("can_pick_up", False),
-                can_move=obj_cfg.get("can_move", False),
-                initial_state=dict(obj_cfg.get("initial_state", {})),
-                contains=list(obj_cfg.get("contains", [])),
-            )
-            for obj_cfg in location_cfg.get("objects", [])
-        ]
-        actors = [
-            ActorMetadata(
-                id=actor_cfg["id"],
-                name=actor_cfg.get("name", actor_cfg["id"]),
-                description=actor_cfg.get("description", ""),
-                persona=actor_cfg.get("persona", ""),
-                background=actor_cfg.get("background", ""),
-                dialogue=dict(actor_cfg.get("dialogue", {})),
-                inventory=list(actor_cfg.get("inventory", [])),
-            )
-            for actor_cfg in location_cfg.get("actors", [])
-        ]
-        pathways = [
+        location = build_location(location_cfg, vocabulary)
+        locations[location.id] = location
+
+    game = GameMetadata(
+        title=metadata.get("title", "Untitled"),
+        summary=metadata.get("summary", ""),
+        start_location=intern(metadata["start_location"]),
+        locations=locations,
+        player=player,
+        references=references,
+    )
+    index_game(game)
+    return freeze_game(game)
+
+
+def build_location(
+    location_cfg: Dict[str, Any], vocabulary: Optional[Vocabulary] = VOCABULARY
+) -> LocationMetadata:
+    intern = interner(vocabulary)
+    objects = [
+        ObjectMetadata(
+            id=intern(obj_cfg["id"]),
+            name=intern(obj_cfg.get("name", obj_cfg["id"])),
+            description=obj_cfg.get("description", ""),
+            details=obj_cfg.get("details", ""),
+            can_pick_up=obj_cfg.get("can_pick_up", False),
+            can_move=obj_cfg.get("can_move", False),
+            initial_state=read_only(
+                {
+                    intern(key): intern(value) if isinstance(value, str) else value
+                    for key, value in obj_cfg.get("initial_state", {}).items()
+                }
+            ),
+            contains=tuple(intern(obj_id) for obj_id in obj_cfg.get("contains", [])),
+            aliases=tuple(intern(alias) for alias in obj_cfg.get("aliases", [])),
+        )
+        for obj_cfg in location_cfg.get("objects", [])
+    ]
+    actors = [
+        ActorMetadata(
+            id=intern(actor_cfg["id"]),
+            name=intern(actor_cfg.get("name", actor_cfg["id"])),
+            description=actor_cfg.get("description", ""),
+            persona=actor_cfg.get("persona", ""),
+            background=actor_cfg.get("background", ""),
+            dialogue=read_only({intern(key): line for key, line in actor_cfg.get("dialogue", {}).items()}),
+            inventory=tuple(intern(obj_id) for obj_id in actor_cfg.get("inventory", [])),
+            aliases=tuple(intern(alias) for alias in actor_cfg.get("aliases", [])),
+        )
+        for actor_cfg in location_cfg.get("actors", [])
+    ]
+    pathways = []
+    for path_cfg in location_cfg.get("pathways", []):
+        unlocks_with = path_cfg.get("unlocks_with")
+        reveals_with = path_cfg.get("reveals_with")
+        pathways.append(
             PathwayMetadata(
-                id=path_cfg["id"],
-                name=path_cfg.get("name", path_cfg["id"]),
-                target=path_cfg["target"],
+                id=intern(path_cfg["id"]),
+                name=intern(path_cfg.get("name", path_cfg["id"])),
+                target=intern(path_cfg["target"]),
                 description=path_cfg.get("description", ""),
                 locked=path_cfg.get("locked", False),
                 hidden=path_cfg.get("hidden", False),
-                unlocks_with=path_cfg.get("unlocks_with"),
-                reveals_with=path_cfg.get("reveals_with"),
+                unlocks_with=intern(unlocks_with) if unlocks_with is not None else None,
+                reveals_with=intern(reveals_with) if reveals_with is not None else None,
+                aliases=tuple(intern(alias) for alias in path_cfg.get("aliases", [])),
             )
-            for path_cfg in location_cfg.get("pathways", [])
-        ]
-
-        location = LocationMetadata(
-            id=location_cfg["id"],
-            name=location_cfg.get("name", location_cfg["id"]),
-            image=location_cfg.get("image", ""),
-            description=location_cfg.get("description", ""),
-            details=location_cfg.get("details", ""),
-            objects=objects,
-            actors=actors,
-            pathways=pathways,
         )
-        locations[location.id] = location
 
-    return GameMetadata(
-        title=metadata.get("title", "Untitled"),
-        summary=metadata.get("summary", ""),
-        start_location=metadata["start_location"],
-        locations=locations,
-        player=player,
+    return LocationMetadata(
+        id=intern(location_cfg["id"]),
+        name=intern(location_cfg.get("name", location_cfg["id"])),
+        image=location_cfg.get("image", ""),
+        description=location_cfg.get("description", ""),
+        details=location_cfg.get("details", ""),
+        objects=tuple(objects),
+        actors=tuple(actors),
+        pathways=tuple(pathways),
+        names=LocationNames(
+            objects=NameIndex(objects),
+            actors=NameIndex(actors),
+            pathways=NameIndex(pathways),
+        ),
     )
+
+
+def index_game(game: GameMetadata) -> None:
+    """Populate the id-keyed entity indexes on ``game`` from its locations."""
+    for location in game.locations.values():
+        index_location(game, location)
+
+
+def index_location(game: GameMetadata, location: LocationMetadata) -> None:
+    for obj in location.objects:
+        game.objects[obj.id] = obj
+        game.object_locations[obj.id] = location.id
+    for actor in location.actors:
+        game.actors[actor.id] = actor
+        game.actor_locations[actor.id] = location.id
+    for path in location.pathways:
+        game.pathways[path.id] = path
+        game.pathway_locations[path.id] = location.id
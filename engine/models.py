@@ -1,10 +1,30 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, TypeVar
 
+from .resolver import LocationNames
+from .vocabulary import Vocabulary
 
-@dataclass
+
+# Metadata is immutable once loaded: frozen slotted classes, tuples and
+# read-only mappings, so one copy can be shared by every session, thread and
+# (after ``gc.freeze()``) forked worker process.
+_V = TypeVar("_V")
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _empty() -> Mapping[str, Any]:
+    return _EMPTY
+
+
+def read_only(mapping: Dict[str, _V]) -> Mapping[str, _V]:
+    """Wrap ``mapping`` in a read-only view; empty ones share a single view."""
+    return MappingProxyType(mapping) if mapping else _EMPTY
+
+
+@dataclass(frozen=True, slots=True)
 class ObjectMetadata:
     id: str
     name: str
@@ -12,22 +32,24 @@ class ObjectMetadata:
     details: str = ""
     can_pick_up: bool = False
     can_move: bool = False
-    initial_state: Dict[str, str] = field(default_factory=dict)
-    contains: List[str] = field(default_factory=list)
+    initial_state: Mapping[str, str] = field(default_factory=_empty)
+    contains: Tuple[str, ...] = ()
+    aliases: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActorMetadata:
     id: str
     name: str
     description: str
     persona: str = ""
     background: str = ""
-    dialogue: Dict[str, str] = field(default_factory=dict)
-    inventory: List[str] = field(default_factory=list)
+    dialogue: Mapping[str, str] = field(default_factory=_empty)
+    inventory: Tuple[str, ...] = ()
+    aliases: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PathwayMetadata:
     id: str
     name: str
@@ -37,92 +59,517 @@ class PathwayMetadata:
     hidden: bool = False
     unlocks_with: Optional[str] = None
     reveals_with: Optional[str] = None
+    aliases: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LocationMetadata:
     id: str
     name: str
     image: str
     description: str
     details: str = ""
-    objects: List[ObjectMetadata] = field(default_factory=list)
-    actors: List[ActorMetadata] = field(default_factory=list)
-    pathways: List[PathwayMetadata] = field(default_factory=list)
+    objects: Tuple[ObjectMetadata, ...] = ()
+    actors: Tuple[ActorMetadata, ...] = ()
+    pathways: Tuple[PathwayMetadata, ...] = ()
+    names: LocationNames = field(default_factory=LocationNames, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlayerMetadata:
     name: str
     description: str = ""
-    starting_inventory: List[str] = field(default_factory=list)
+    starting_inventory: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class ReferenceIndex:
+    """Reverse reference indexes produced by load-time validation.
 
+    Every id in here is known to exist, so callers can index the game's
+    id maps directly.
+    """
 
-@dataclass
+    # location id -> ids of the pathways that lead into it
+    entrances: Mapping[str, Tuple[str, ...]] = field(default_factory=_empty)
+    # object id -> ids of the pathways it unlocks / reveals
+    unlocks: Mapping[str, Tuple[str, ...]] = field(default_factory=_empty)
+    reveals: Mapping[str, Tuple[str, ...]] = field(default_factory=_empty)
+    # object id -> id of the object it is found inside
+    container_of: Mapping[str, str] = field(default_factory=_empty)
+
+
+@dataclass(frozen=True, slots=True)
 class GameMetadata:
+    """A loaded game.
+
+    The id-keyed indexes are filled while the game is built and exposed
+    read-only afterwards (see ``freeze_game``); lazily loaded games keep
+    growable indexes instead.
+    """
+
     title: str
     summary: str
     start_location: str
-    locations: Dict[str, LocationMetadata]
+    locations: Mapping[str, LocationMetadata]
     player: PlayerMetadata
+    # Id-keyed indexes built once by the loader so lookups never scan locations.
+    objects: Mapping[str, ObjectMetadata] = field(default_factory=dict, repr=False)
+    actors: Mapping[str, ActorMetadata] = field(default_factory=dict, repr=False)
+    pathways: Mapping[str, PathwayMetadata] = field(default_factory=dict, repr=False)
+    object_locations: Mapping[str, str] = field(default_factory=dict, repr=False)
+    actor_locations: Mapping[str, str] = field(default_factory=dict, repr=False)
+    pathway_locations: Mapping[str, str] = field(default_factory=dict, repr=False)
+    references: ReferenceIndex = field(default_factory=ReferenceIndex, repr=False, compare=False)
+    # Shared, read-only initial state for copy-on-write sessions; built on
+    # demand, the only field ever set after construction (see set_baseline_state).
+    baseline_state: Optional[GameState] = field(default=None, repr=False, compare=False)
+
+
+def freeze_game(game: GameMetadata) -> GameMetadata:
+    """Return ``game`` with its locations and id indexes behind read-only views."""
+    return replace(
+        game,
+        locations=MappingProxyType(game.locations),  # type: ignore[arg-type]
+        objects=MappingProxyType(game.objects),  # type: ignore[arg-type]
+        actors=MappingProxyType(game.actors),  # type: ignore[arg-type]
+        pathways=MappingProxyType(game.pathways),  # type: ignore[arg-type]
+        object_locations=MappingProxyType(game.object_locations),  # type: ignore[arg-type]
+        actor_locations=MappingProxyType(game.actor_locations),  # type: ignore[arg-type]
+        pathway_locations=MappingProxyType(game.pathway_locations),  # type: ignore[arg-type]
+    )
+
+
+def set_baseline_state(game: GameMetadata, state: GameState) -> None:
+    object.__setattr__(game, "baseline_state", state)
+
+
+def _flag(bit: int) -> property:
+    """Expose one bit of an instance's packed ``flags`` field as a bool."""
+
+    def getter(self) -> bool:
+        return bool(self.flags & bit)
+
+    def setter(self, value: bool) -> None:
+        self.flags = self.flags | bit if value else self.flags & ~bit
+
+    return property(getter, setter)
+
 
+HELD_BY_PLAYER = 1
+LOCKED = 1
+HIDDEN = 2
+VISITED = 1
 
-@dataclass
+
+# Boolean status keys ("open", "lit", ...) are assigned process-wide slots so an
+# object's "true"/"false" values pack into two bits each of ObjectState.flags:
+# bit 1 + 2*slot marks the key present, the bit above it holds the value.
+# Kept apart from the id vocabulary so slot numbers stay small. Slot numbers
+# never decide iteration order: ObjectState.keys keeps each object's own.
+_STATUS_VOCABULARY = Vocabulary()
+_STATUS_SLOTS: Dict[str, int] = _STATUS_VOCABULARY.codes
+_BOOL_VALUES = {"true": True, "false": False}
+_status_slot = _STATUS_VOCABULARY.code
+# One shared tuple per distinct key order, so objects with the same status
+# keys (and every copy of a state) point at the same tuple.
+_KEY_ORDERS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _key_order(keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    return _KEY_ORDERS.setdefault(keys, keys)
+
+
+@dataclass(slots=True, init=False)
 class ObjectState:
-    status: Dict[str, str] = field(default_factory=dict)
-    held_by_player: bool = False
+    flags: int = 0
+    # Status values that are not "true"/"false"; None until one is stored.
+    extra: Optional[Dict[str, str]] = None
+    # Status keys in the order they were first set, as a dict would keep them.
+    keys: Tuple[str, ...] = ()
+
+    held_by_player = _flag(HELD_BY_PLAYER)
+
+    def __init__(
+        self,
+        status: Optional[Mapping[str, str]] = None,
+        held_by_player: bool = False,
+        *,
+        flags: int = 0,
+        extra: Optional[Dict[str, str]] = None,
+        keys: Tuple[str, ...] = (),
+    ) -> None:
+        self.flags = flags | (HELD_BY_PLAYER if held_by_player else 0)
+        self.extra = extra
+        self.keys = keys
+        if status:
+            self.status = status
+
+    @classmethod
+    def from_status(cls, status: Mapping[str, str], held_by_player: bool = False) -> "ObjectState":
+        return cls(status, held_by_player)
+
+    @property
+    def status(self) -> "ObjectStatus":
+        return ObjectStatus(self)
+
+    @status.setter
+    def status(self, values: Mapping[str, str]) -> None:
+        values = dict(values)
+        view = ObjectStatus(self)
+        view.clear()
+        for key, value in values.items():
+            view[key] = value
+
+    def copy(self) -> "ObjectState":
+        return ObjectState(
+            flags=self.flags, extra=dict(self.extra) if self.extra is not None else None, keys=self.keys
+        )
+
 
+class ObjectStatus(MutableMapping[str, str]):
+    """Dict-like view over the status values packed into an ObjectState."""
 
-@dataclass
+    __slots__ = ("_state",)
+
+    def __init__(self, state: ObjectState) -> None:
+        self._state = state
+
+    def __getitem__(self, key: str) -> str:
+        slot = _STATUS_SLOTS.get(key)
+        if slot is not None:
+            present = 1 << (1 + 2 * slot)
+            if self._state.flags & present:
+                return "true" if self._state.flags & (present << 1) else "false"
+        extra = self._state.extra
+        if extra is not None and key in extra:
+            return extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: str) -> None:
+        state = self._state
+        flag = _BOOL_VALUES.get(value) if isinstance(value, str) else None
+        if flag is None:
+            self._clear_bits(key)
+            if state.extra is None:
+                state.extra = {}
+            state.extra[key] = value
+            self._remember(key)
+            return
+        present = 1 << (1 + 2 * _status_slot(key))
+        if flag:
+            state.flags |= present | (present << 1)
+        else:
+            state.flags = (state.flags | present) & ~(present << 1)
+        if state.extra is not None:
+            state.extra.pop(key, None)
+        self._remember(key)
+
+    def __delitem__(self, key: str) -> None:
+        extra = self._state.extra
+        if not self._clear_bits(key):
+            if extra is None or key not in extra:
+                raise KeyError(key)
+            del extra[key]
+        keys = self._state.keys
+        self._state.keys = _key_order(tuple(name for name in keys if name != key))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._state.keys)
+
+    def __len__(self) -> int:
+        return len(self._state.keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._state.keys
+
+    def _remember(self, key: str) -> None:
+        keys = self._state.keys
+        if key not in keys:
+            self._state.keys = _key_order(keys + (key,))
+
+    def _clear_bits(self, key: str) -> bool:
+        slot = _STATUS_SLOTS.get(key)
+        if slot is None:
+            return False
+        present = 1 << (1 + 2 * slot)
+        if not self._state.flags & present:
+            return False
+        self._state.flags &= ~(present | (present << 1))
+        return True
+
+
+@dataclass(slots=True)
 class ActorState:
     conversation_flags: Dict[str, bool] = field(default_factory=dict)
     inventory: List[str] = field(default_factory=list)
 
+    def copy(self) -> "ActorState":
+        return ActorState(dict(self.conversation_flags), list(self.inventory))
+
 
-@dataclass
+@dataclass(slots=True)
 class PathwayState:
-    locked: bool = False
-    hidden: bool = False
+    flags: int = 0
+
+    locked = _flag(LOCKED)
+    hidden = _flag(HIDDEN)
+
+    def copy(self) -> "PathwayState":
+        return PathwayState(self.flags)
 
 
-@dataclass
+@dataclass(slots=True)
 class LocationState:
-    visited: bool = False
+    flags: int = 0
 
+    visited = _flag(VISITED)
 
-@dataclass
+    def copy(self) -> "LocationState":
+        return LocationState(self.flags)
+
+
+@dataclass(slots=True)
 class PlayerState:
     location_id: str
     inventory: List[str] = field(default_factory=list)
     attributes: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     player: PlayerState
-    objects: Dict[str, ObjectState]
-    actors: Dict[str, ActorState]
-    pathways: Dict[str, PathwayState]
-    locations: Dict[str, LocationState]
+    objects: MutableMapping[str, ObjectState]
+    actors: MutableMapping[str, ActorState]
+    pathways: MutableMapping[str, PathwayState]
+    locations: MutableMapping[str, LocationState]
+
+
+S = TypeVar("S", ObjectState, ActorState, PathwayState, LocationState)
+
+class _Removed:
+    """Marks an entity state deleted in a session; pickles as the one shared instance."""
+
+    __slots__ = ()
+
+    def __reduce__(self) -> str:
+        return "_REMOVED"
+
+
+_REMOVED = _Removed()
+
+
+class StateOverlay(MutableMapping[str, S]):
+    """Session-local entity states layered over a shared baseline mapping.
+
+    Reads fall through to the baseline until an entity is first modified;
+    ``writable`` copies the baseline entry into the session delta so the
+    shared baseline is never mutated. Creating an overlay is O(1).
+    """
+
+    __slots__ = ("baseline", "delta")
+
+    def __init__(self, baseline: Mapping[str, S]) -> None:
+        self.baseline = baseline
+        self.delta: Dict[str, object] = {}
+
+    def writable(self, key: str) -> S:
+        entry = self.delta.get(key)
+        if entry is _REMOVED:
+            raise KeyError(key)
+        if entry is None:
+            entry = self.baseline[key].copy()
+            self.delta[key] = entry
+        return entry  # type: ignore[return-value]
+
+    def __getitem__(self, key: str) -> S:
+        entry = self.delta.get(key)
+        if entry is None:
+            return self.baseline[key]
+        if entry is _REMOVED:
+            raise KeyError(key)
+        return entry  # type: ignore[return-value]
+
+    def __setitem__(self, key: str, value: S) -> None:
+        self.delta[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        if key in self.baseline:
+            self.delta[key] = _REMOVED
+        else:
+            del self.delta[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.baseline:
+            if self.delta.get(key) is not _REMOVED:
+                yield key
+        for key in self.delta:
+            if key not in self.baseline:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        entry = self.delta.get(key)  # type: ignore[arg-type]
+        if entry is None:
+            return key in self.baseline
+        return entry is not _REMOVED
 
 
-def build_initial_state(game: GameMetadata) -> GameState:
+def writable_state(states: MutableMapping[str, S], key: str) -> S:
+    """Return the entity state for ``key``, ready to be modified in place."""
+    if isinstance(states, StateOverlay):
+        return states.writable(key)
+    return states[key]
+
+
+def build_initial_state(game: GameMetadata, *, copy_on_write: bool = False) -> GameState:
+    """Build a fresh session state for ``game``.
+
+    With ``copy_on_write`` the entity maps are overlays over one read-only
+    baseline shared by every session of ``game``; only entities the session
+    modifies are copied.
+    """
+    if copy_on_write:
+        baseline = shared_baseline_state(game)
+        return GameState(
+            player=PlayerState(
+                location_id=baseline.player.location_id,
+                inventory=list(baseline.player.inventory),
+            ),
+            objects=StateOverlay(baseline.objects),
+            actors=StateOverlay(baseline.actors),
+            pathways=StateOverlay(baseline.pathways),
+            locations=StateOverlay(baseline.locations),
+        )
+    return _build_full_state(game)
+
+
+def migrate_state(state: GameState, game: GameMetadata, *, copy_on_write: bool = False) -> GameState:
+    """Carry session ``state`` over to ``game``, a reloaded version of its game.
+
+    Entity states are matched by id: entities that still exist keep the
+    session's state, new ones start from their defaults and removed ones are
+    dropped. With ``copy_on_write`` only the session delta is carried, so
+    untouched entities pick up edited defaults from the new baseline. A
+    player standing in a removed location returns to the start location,
+    and inventory items that no longer exist are discarded.
+    """
+    fresh = build_initial_state(game, copy_on_write=copy_on_write)
+    for kind in ("objects", "actors", "pathways", "locations"):
+        old, new = getattr(state, kind), getattr(fresh, kind)
+        entries = old.delta if isinstance(old, StateOverlay) else old
+        if isinstance(new, StateOverlay):
+            known, target = new.baseline, new.delta
+        else:
+            known = target = new
+        for key, entry in entries.items():
+            if key in known:
+                target[key] = entry
+    player = state.player
+    fresh.player = PlayerState(
+        location_id=player.location_id if player.location_id in game.locations else game.start_location,
+        inventory=[obj_id for obj_id in player.inventory if obj_id in game.objects],
+        attributes=player.attributes,
+    )
+    return fresh
+
+
+def shared_baseline_state(game: GameMetadata) -> GameState:
+    if game.baseline_state is None:
+        state = _build_full_state(game)
+        set_baseline_state(
+            game,
+            GameState(
+                player=state.player,
+                objects=MappingProxyType(state.objects),  # type: ignore[arg-type]
+                actors=MappingProxyType(state.actors),  # type: ignore[arg-type]
+                pathways=MappingProxyType(state.pathways),  # type: ignore[arg-type]
+                locations=MappingProxyType(state.locations),  # type: ignore[arg-type]
+            ),
+        )
+    return game.baseline_state
+
+
+def patch_baseline_state(
+    game: GameMetadata,
+    previous: GameMetadata,
+    replaced: Iterable[LocationMetadata],
+    rebuilt: Iterable[LocationMetadata],
+) -> None:
+    """Derive ``game``'s shared baseline from ``previous``'s after a partial reload.
+
+    ``replaced`` are locations of ``previous`` that were edited or removed
+    and ``rebuilt`` their successors in ``game``; every other location's
+    entity states are reused as they are. Does nothing (leaving the baseline
+    to be built on demand) if ``previous`` has none or the player's start
+    changed.
+    """
+    old = previous.baseline_state
+    if (
+        old is None
+        or old.player.location_id != game.start_location
+        or old.player.inventory != list(game.player.starting_inventory)
+    ):
+        return
+    states = [dict(getattr(old, kind)) for kind in ("objects", "actors", "pathways", "locations")]
+    objects_state, actors_state, pathways_state, locations_state = states
+    for location in replaced:
+        locations_state.pop(location.id, None)
+        for obj in location.objects:
+            objects_state.pop(obj.id, None)
+        for actor in location.actors:
+            actors_state.pop(actor.id, None)
+        for path in location.pathways:
+            pathways_state.pop(path.id, None)
+    fresh = set()
+    for location in rebuilt:
+        _add_location_states(location, objects_state, actors_state, pathways_state, locations_state)
+        fresh.add(location.id)
+    for obj_id in game.player.starting_inventory:
+        if game.object_locations.get(obj_id) in fresh:
+            objects_state[obj_id].held_by_player = True
+    set_baseline_state(
+        game,
+        GameState(
+            player=old.player,
+            objects=MappingProxyType(objects_state),  # type: ignore[arg-type]
+            actors=MappingProxyType(actors_state),  # type: ignore[arg-type]
+            pathways=MappingProxyType(pathways_state),  # type: ignore[arg-type]
+            locations=MappingProxyType(locations_state),  # type: ignore[arg-type]
+        ),
+    )
+
+
+def _add_location_states(
+    location: LocationMetadata,
+    objects_state: Dict[str, ObjectState],
+    actors_state: Dict[str, ActorState],
+    pathways_state: Dict[str, PathwayState],
+    locations_state: Dict[str, LocationState],
+) -> None:
+    locations_state[location.id] = LocationState()
+    for obj in location.objects:
+        objects_state[obj.id] = ObjectState.from_status(obj.initial_state)
+    for actor in location.actors:
+        actors_state[actor.id] = ActorState()
+    for path in location.pathways:
+        pathways_state[path.id] = PathwayState(
+            flags=(LOCKED if path.locked else 0) | (HIDDEN if path.hidden else 0)
+        )
+
+
+def _build_full_state(game: GameMetadata) -> GameState:
     objects_state: Dict[str, ObjectState] = {}
     actors_state: Dict[str, ActorState] = {}
     pathways_state: Dict[str, PathwayState] = {}
     locations_state: Dict[str, LocationState] = {}
 
     for location in game.locations.values():
-        locations_state[location.id] = LocationState(visited=False)
-        for obj in location.objects:
-            objects_state[obj.id] = ObjectState(status=dict(obj.initial_state))
-        for actor in location.actors:
-            actors_state[actor.id] = ActorState()
-        for path in location.pathways:
-            pathways_state[path.id] = PathwayState(
-                locked=path.locked,
-                hidden=path.hidden,
-            )
+        _add_location_states(location, objects_state, actors_state, pathways_state, locations_state)
 
     player_state = PlayerState(
         location_id=game.start_location,
@@ -0,0 +1,540 @@
+from __future__ import annotations
+
+import os
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import dataclass
+from itertools import accumulate
+from operator import add, sub
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+GRAY, RGB, PALETTE, GRAY_ALPHA, RGBA = 0, 2, 3, 4, 6
+_CHANNELS = {GRAY: 1, RGB: 3, PALETTE: 1, GRAY_ALPHA: 2, RGBA: 4}
+_BIT_DEPTHS = {
+    GRAY: (1, 2, 4, 8, 16),
+    RGB: (8, 16),
+    PALETTE: (1, 2, 4, 8),
+    GRAY_ALPHA: (8, 16),
+    RGBA: (8, 16),
+}
+# Adam7 passes: x start, y start, x step, y step.
+_ADAM7 = ((0, 0, 8, 8), (4, 0, 8, 8), (0, 4, 4, 8), (2, 0, 4, 4), (0, 2, 2, 4), (1, 0, 2, 2), (0, 1, 1, 2))
+# Compressed bytes fed to zlib at a time; bounds memory to a row plus this.
+_READ_SIZE = 1 << 16
+
+_LOW_BYTE = (255).__and__
+# Filtered byte -> its distance from zero as a signed residual, for picking filters.
+_MAGNITUDE = bytes(min(value, 256 - value) for value in range(256))
+
+
+def _unpack_table(depth: int) -> List[bytes]:
+    # byte value -> the 8 // depth samples packed in it, most significant first
+    per_byte = 8 // depth
+    mask = (1 << depth) - 1
+    return [
+        bytes((value >> (8 - depth * (i + 1))) & mask for i in range(per_byte)) for value in range(256)
+    ]
+
+
+_UNPACK = {depth: _unpack_table(depth) for depth in (1, 2, 4)}
+# Sample value at a sub-byte depth -> the same intensity on a 0-255 scale.
+_SCALE = {
+    depth: bytes(value * 255 // ((1 << depth) - 1) for value in range(1 << depth)).ljust(256, b"\0")
+    for depth in (1, 2, 4)
+}
+
+
+# NumPy is optional. When it imports, engine.png_numpy takes over the per-row
+# loops; set TEXT_ADVENTURE_NUMPY=0 (or call use_numpy(False)) to keep the
+# pure-Python path. Both produce identical bytes.
+_numpy_enabled = os.environ.get("TEXT_ADVENTURE_NUMPY", "1") != "0"
+_numpy_module = None
+
+
+def numpy_backend():
+    """The :mod:`engine.png_numpy` module, or None when NumPy is missing or switched off.
+
+    Imported on first use, so programs that never decode an image do not
+    pay for loading NumPy.
+    """
+    global _numpy_enabled, _numpy_module
+    if not _numpy_enabled:
+        return None
+    if _numpy_module is None:
+        try:
+            from . import png_numpy
+        except ImportError:
+            _numpy_enabled = False
+            return None
+        _numpy_module = png_numpy
+    return _numpy_module
+
+
+def use_numpy(enabled: bool = True) -> bool:
+    """Switch the NumPy path on or off; returns whether it is now in use."""
+    global _numpy_enabled
+    _numpy_enabled = enabled
+    return numpy_backend() is not None
+
+
+class PNGError(ValueError):
+    """The file is not a PNG this decoder can read, or it is corrupt."""
+
+
+@dataclass(frozen=True, slots=True)
+class PNGInfo:
+    width: int
+    height: int
+    bit_depth: int
+    color_type: int
+    interlaced: bool
+    palette: Optional[bytes] = None
+    transparency: Optional[bytes] = None
+
+    @property
+    def channels(self) -> int:
+        return _CHANNELS[self.color_type]
+
+    @property
+    def has_alpha(self) -> bool:
+        return self.color_type in (GRAY_ALPHA, RGBA) or self.transparency is not None
+
+    @property
+    def filter_unit(self) -> int:
+        """Bytes per complete pixel (at least one), the distance filters look back."""
+        return max(1, self.channels * self.bit_depth // 8)
+
+    def row_bytes(self, width: int) -> int:
+        return (width * self.channels * self.bit_depth + 7) // 8
+
+
+class PNGImage:
+    """A PNG file decoded on demand, one RGBA row at a time.
+
+    Construction reads only the header chunks. :meth:`rows` then streams the
+    image data through ``zlib.decompressobj``, keeping just the current and
+    previous scanline, and yields each row as ``bytearray`` of 8-bit RGBA.
+    Every color type and bit depth of the PNG spec is supported, as are all
+    five filter types, ``PLTE``/``tRNS`` transparency and Adam7 interlacing.
+    :meth:`downsample` box-filters the rows to a small grid as they arrive.
+    Interlaced images have to be assembled in full before the first row can
+    be returned. 16-bit samples are reduced to their high byte, and
+    ancillary chunks such as gamma are ignored. With NumPy available (see
+    :func:`numpy_backend`) scanlines are unfiltered a band at a time
+    instead, with the same output.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            self.info, self._data_offset = _read_header(handle)
+
+    @property
+    def width(self) -> int:
+        return self.info.width
+
+    @property
+    def height(self) -> int:
+        return self.info.height
+
+    def rows(self) -> Iterator[bytearray]:
+        """Yield the image's rows top to bottom as RGBA bytes (4 per pixel)."""
+        with self.path.open("rb") as handle:
+            handle.seek(self._data_offset)
+            stream = _Inflater(_image_data(handle))
+            backend = numpy_backend()
+            passes = backend.pass_rows if backend is not None else _pass_rows
+            if not self.info.interlaced:
+                yield from passes(stream, self.info, self.info.width, self.info.height)
+                return
+            yield from _deinterlace(stream, self.info, passes)
+
+    def decode(self) -> bytearray:
+        """The whole image as one RGBA buffer, rows concatenated."""
+        return bytearray().join(self.rows())
+
+    def downsample(
+        self, columns: int, rows: int, source_height: Optional[int] = None
+    ) -> Iterator[List[Tuple[int, int, int, int]]]:
+        """Yield the image box-filtered down to ``rows`` x ``columns`` RGBA pixels.
+
+        Each output pixel is the rounded mean of the source pixels in its box;
+        box edges fall on whole source pixels, so boxes differ in size by at
+        most one pixel along each axis. Only the top ``source_height`` rows
+        (all by default) are covered, and decoding stops after the last of
+        them. Source rows are added into per-column running totals as they
+        stream in, so memory stays proportional to the width.
+        """
+        for means in self._box_means(columns, rows, source_height):
+            yield list(zip(*means))
+
+    def resize(self, columns: int, rows: int) -> Iterator[bytearray]:
+        """Yield the whole image box-filtered to ``columns`` x ``rows`` as RGBA rows.
+
+        The same reduction as :meth:`downsample`, returned as bytes ready for
+        :func:`encode_png` instead of pixel tuples.
+        """
+        for means in self._box_means(columns, rows):
+            line = bytearray(columns * 4)
+            for channel in range(4):
+                line[channel::4] = bytes(means[channel])
+            yield line
+
+    def _box_means(
+        self, columns: int, rows: int, source_height: Optional[int] = None
+    ) -> Iterator[List[List[int]]]:
+        # One list of box means per channel (R, G, B, A) for each output row.
+        width = self.width
+        height = min(self.height, source_height or self.height)
+        if not 0 < columns <= width or not 0 < rows <= height:
+            raise ValueError(f"cannot reduce {width}x{height} pixels to {columns}x{rows}")
+        x_edges = [column * width // columns for column in range(columns + 1)]
+        y_edges = [row * height // rows for row in range(rows + 1)]
+        backend = numpy_backend()
+        if backend is not None:
+            yield from backend.box_means(self.rows(), width, x_edges, y_edges)
+            return
+        boxes = list(zip(x_edges, x_edges[1:]))
+        tallest = max(end - start for start, end in zip(y_edges, y_edges[1:]))
+        # Column totals for the current band of rows are kept in one integer
+        # with a little-endian lane per sample, wide enough not to overflow:
+        # adding a row is then a single big-integer addition instead of a
+        # Python loop over its bytes.
+        typecode = "H" if tallest * 255 < 1 << 16 else "Q"
+        lane = array(typecode).itemsize
+        spread = bytearray(width * 4 * lane)
+        total = 0
+        band = 0
+        for y, line in enumerate(self.rows()):
+            spread[::lane] = line
+            total += int.from_bytes(spread, "little")
+            if y + 1 < y_edges[band + 1]:
+                continue
+            sums = array(typecode, total.to_bytes(len(spread), "little"))
+            if sys.byteorder == "big":
+                sums.byteswap()
+            box_height = y_edges[band + 1] - y_edges[band]
+            counts = [(end - start) * box_height for start, end in boxes]
+            means = []
+            for channel in range(4):
+                prefix = list(accumulate(sums[channel::4], initial=0))
+                means.append(
+                    [
+                        (prefix[end] - prefix[start] + count // 2) // count
+                        for (start, end), count in zip(boxes, counts)
+                    ]
+                )
+            yield means
+            total = 0
+            band += 1
+            if band == rows:
+                return
+
+
+def encode_png(width: int, height: int, rows: Iterable[bytes], *, alpha: bool = True, level: int = 6) -> bytes:
+    """Encode 8-bit RGBA (or, with ``alpha=False``, RGB) rows as a PNG file.
+
+    Each row is stored with whichever of the None, Sub and Up filters leaves
+    the smallest sum of absolute residuals, the usual heuristic; those three
+    run at C speed, Average and Paeth would not. Rows are compressed as they
+    arrive, so the image never has to be in memory whole.
+    """
+    color_type, unit = (RGBA, 4) if alpha else (RGB, 3)
+    header = struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)
+    compressor = zlib.compressobj(level)
+    data: List[bytes] = []
+    previous = bytes(width * unit)
+    count = 0
+    for line in rows:
+        line = bytes(line)
+        if len(line) != width * unit:
+            raise ValueError(f"row {count} has {len(line)} bytes, expected {width * unit}")
+        candidates = (
+            (0, line),
+            (1, line[:unit] + bytes(map(_LOW_BYTE, map(sub, line[unit:], line)))),
+            (2, bytes(map(_LOW_BYTE, map(sub, line, previous)))),
+        )
+        filter_type, filtered = min(candidates, key=lambda candidate: sum(candidate[1].translate(_MAGNITUDE)))
+        data.append(compressor.compress(bytes((filter_type,)) + filtered))
+        previous = line
+        count += 1
+    if count != height:
+        raise ValueError(f"got {count} rows, expected {height}")
+    data.append(compressor.flush())
+    return b"".join(
+        (
+            PNG_SIGNATURE,
+            _chunk(b"IHDR", header),
+            _chunk(b"IDAT", b"".join(data)),
+            _chunk(b"IEND", b""),
+        )
+    )
+
+
+def _chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+
+def _read_chunk_header(handle: BinaryIO) -> Tuple[int, bytes]:
+    header = handle.read(8)
+    if len(header) < 8:
+        raise PNGError("Truncated PNG: missing IEND")
+    return int.from_bytes(header[:4], "big"), header[4:]
+
+
+def _read_chunk(handle: BinaryIO, length: int, chunk_type: bytes) -> bytes:
+    data = handle.read(length)
+    crc = handle.read(4)
+    if len(data) < length or len(crc) < 4:
+        raise PNGError(f"Truncated {chunk_type.decode('latin-1')} chunk")
+    if zlib.crc32(data, zlib.crc32(chunk_type)) != int.from_bytes(crc, "big"):
+        raise PNGError(f"Bad CRC in {chunk_type.decode('latin-1')} chunk")
+    return data
+
+
+def _read_header(handle: BinaryIO) -> Tuple[PNGInfo, int]:
+    """Parse the chunks before the image data; return the info and the offset of the first IDAT."""
+    if handle.read(8) != PNG_SIGNATURE:
+        raise PNGError("Not a PNG file")
+    length, chunk_type = _read_chunk_header(handle)
+    if chunk_type != b"IHDR" or length != 13:
+        raise PNGError("PNG missing IHDR")
+    ihdr = _read_chunk(handle, length, chunk_type)
+    width = int.from_bytes(ihdr[0:4], "big")
+    height = int.from_bytes(ihdr[4:8], "big")
+    bit_depth, color_type, compression, filter_method, interlace = ihdr[8:13]
+    if bit_depth not in _BIT_DEPTHS.get(color_type, ()):
+        raise PNGError(f"Invalid bit depth {bit_depth} for color type {color_type}")
+    if width == 0 or height == 0 or compression != 0 or filter_method != 0 or interlace > 1:
+        raise PNGError("Unsupported PNG header")
+
+    palette = transparency = None
+    while True:
+        offset = handle.tell()
+        length, chunk_type = _read_chunk_header(handle)
+        if chunk_type == b"IDAT":
+            break
+        if chunk_type == b"IEND":
+            raise PNGError("PNG has no image data")
+        data = _read_chunk(handle, length, chunk_type)
+        if chunk_type == b"PLTE":
+            palette = data
+        elif chunk_type == b"tRNS":
+            transparency = data
+        elif not chunk_type[0] & 0x20:
+            raise PNGError(f"Unknown critical chunk {chunk_type.decode('latin-1')}")
+    if color_type == PALETTE and palette is None:
+        raise PNGError("Palette image without PLTE chunk")
+    info = PNGInfo(width, height, bit_depth, color_type, bool(interlace), palette, transparency)
+    return info, offset
+
+
+def _image_data(handle: BinaryIO) -> Iterator[bytes]:
+    """Yield the payload of the consecutive IDAT chunks in pieces, checking CRCs."""
+    while True:
+        length, chunk_type = _read_chunk_header(handle)
+        if chunk_type != b"IDAT":
+            return
+        crc = zlib.crc32(chunk_type)
+        remaining = length
+        while remaining:
+            piece = handle.read(min(remaining, _READ_SIZE))
+            if not piece:
+                raise PNGError("Truncated IDAT chunk")
+            crc = zlib.crc32(piece, crc)
+            remaining -= len(piece)
+            yield piece
+        if handle.read(4) != crc.to_bytes(4, "big"):
+            raise PNGError("Bad CRC in IDAT chunk")
+
+
+class _Inflater:
+    """Decompressed image data, handed out in exact-sized pieces."""
+
+    __slots__ = ("_chunks", "_zlib", "_buffer", "_tail")
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._zlib = zlib.decompressobj()
+        self._buffer = bytearray()
+        self._tail = b""
+
+    def read(self, size: int) -> bytearray:
+        buffer = self._buffer
+        while len(buffer) < size:
+            if not self._tail:
+                self._tail = next(self._chunks, b"")
+                if not self._tail:
+                    buffer += self._zlib.flush()
+                    if len(buffer) < size:
+                        raise PNGError("Truncated image data")
+                    break
+            try:
+                buffer += self._zlib.decompress(self._tail, max(size, _READ_SIZE))
+            except zlib.error as exc:
+                raise PNGError(f"Corrupt image data: {exc}") from exc
+            self._tail = self._zlib.unconsumed_tail
+        line = buffer[:size]
+        # Deleting from the front of a bytearray is O(1) in CPython.
+        del buffer[:size]
+        return line
+
+
+def _pass_rows(stream: _Inflater, info: PNGInfo, width: int, height: int) -> Iterator[bytearray]:
+    """Unfilter and convert ``height`` scanlines of ``width`` pixels."""
+    size = info.row_bytes(width)
+    unit = info.filter_unit
+    previous = bytearray(size)
+    convert = _converter(info, width)
+    for _ in range(height):
+        line = stream.read(size + 1)
+        filter_type = line[0]
+        del line[0]
+        if filter_type:
+            _unfilter(filter_type, line, previous, unit)
+        yield convert(line)
+        previous = line
+
+
+def _deinterlace(stream: _Inflater, info: PNGInfo, passes=_pass_rows) -> Iterator[bytearray]:
+    width, height = info.width, info.height
+    image = [bytearray(width * 4) for _ in range(height)]
+    for x0, y0, dx, dy in _ADAM7:
+        pass_width = (width - x0 + dx - 1) // dx
+        pass_height = (height - y0 + dy - 1) // dy
+        if pass_width <= 0 or pass_height <= 0:
+            continue
+        for index, row in enumerate(passes(stream, info, pass_width, pass_height)):
+            target = image[y0 + index * dy]
+            for channel in range(4):
+                target[x0 * 4 + channel :: dx * 4] = row[channel::4]
+    yield from image
+
+
+def _unfilter(filter_type: int, line: bytearray, previous: bytearray, unit: int) -> None:
+    """Undo a scanline filter in place; ``previous`` is the unfiltered row above."""
+    if filter_type == 1:
+        for start in range(unit):
+            line[start::unit] = bytes(map(_LOW_BYTE, accumulate(line[start::unit])))
+    elif filter_type == 2:
+        line[:] = bytes(map(_LOW_BYTE, map(add, line, previous)))
+    elif filter_type == 3:
+        for i in range(unit):
+            line[i] = (line[i] + (previous[i] >> 1)) & 255
+        for i in range(unit, len(line)):
+            line[i] = (line[i] + ((line[i - unit] + previous[i]) >> 1)) & 255
+    elif filter_type == 4:
+        if not any(previous):
+            # With no row above, Paeth always predicts the left neighbour: Sub.
+            _unfilter(1, line, previous, unit)
+            return
+        for i in range(unit):
+            line[i] = (line[i] + previous[i]) & 255
+        # Paeth: p = a + b - c, so |p - a| = |b - c|, |p - b| = |a - c| and
+        # |p - c| = |(b - c) + (a - c)|.
+        for i, up, up_left in zip(range(unit, len(line)), previous[unit:], previous):
+            left = line[i - unit]
+            pa = up - up_left
+            pb = left - up_left
+            pc = pa + pb
+            if pa < 0:
+                pa = -pa
+            if pb < 0:
+                pb = -pb
+            if pc < 0:
+                pc = -pc
+            if pa <= pb and pa <= pc:
+                predictor = left
+            elif pb <= pc:
+                predictor = up
+            else:
+                predictor = up_left
+            line[i] = (line[i] + predictor) & 255
+    else:
+        raise PNGError(f"Unknown filter type {filter_type}")
+
+
+def _converter(info: PNGInfo, width: int):
+    """Return a function turning one unfiltered scanline into RGBA bytes."""
+    color_type, depth = info.color_type, info.bit_depth
+    opaque = b"\xff" * width
+    transparency = info.transparency
+
+    def samples(line: bytearray) -> bytes:
+        # One byte per sample: sub-byte samples unpacked, 16-bit reduced to the high byte.
+        if depth < 8:
+            return b"".join(map(_UNPACK[depth].__getitem__, line))[: width * info.channels]
+        if depth == 16:
+            return bytes(line[0::2])
+        return bytes(line)
+
+    if color_type == PALETTE:
+        lookup = _palette_entries(info).__getitem__
+        return lambda line: bytearray(b"".join(map(lookup, samples(line))))
+
+    key = None
+    if transparency is not None and color_type in (GRAY, RGB):
+        # The tRNS color key, laid out like one pixel of the scanline.
+        values = [int.from_bytes(transparency[i : i + 2], "big") for i in range(0, len(transparency), 2)]
+        if depth == 16:
+            key = b"".join(value.to_bytes(2, "big") for value in values)
+        else:
+            key = bytes(value & 255 for value in values)
+
+    def convert(line: bytearray) -> bytearray:
+        data = samples(line)
+        out = bytearray(width * 4)
+        if color_type == GRAY:
+            gray = data.translate(_SCALE[depth]) if depth < 8 else data
+            out[0::4] = gray
+            out[1::4] = gray
+            out[2::4] = gray
+            out[3::4] = opaque
+        elif color_type == GRAY_ALPHA:
+            gray = data[0::2]
+            out[0::4] = gray
+            out[1::4] = gray
+            out[2::4] = gray
+            out[3::4] = data[1::2]
+        elif color_type == RGB:
+            out[0::4] = data[0::3]
+            out[1::4] = data[1::3]
+            out[2::4] = data[2::3]
+            out[3::4] = opaque
+        else:
+            out[:] = data
+        if key is not None:
+            # Sub-byte samples are compared after unpacking, the rest as stored.
+            haystack = data if depth < 8 else line
+            for pixel in _matches(haystack, key):
+                out[pixel * 4 + 3] = 0
+        return out
+
+    return convert
+
+
+def _palette_entries(info: PNGInfo) -> List[bytes]:
+    """RGBA bytes for each of the 256 palette indexes; missing entries are opaque black."""
+    palette = info.palette or b""
+    alphas = info.transparency or b""
+    return [
+        palette[i * 3 : i * 3 + 3] + (alphas[i : i + 1] or b"\xff") if i * 3 < len(palette) else b"\0\0\0\xff"
+        for i in range(256)
+    ]
+
+
+def _matches(data, pattern: bytes) -> Iterator[int]:
+    """Indexes of the pixels in ``data`` equal to ``pattern`` (one pixel's bytes)."""
+    step = len(pattern)
+    start = data.find(pattern)
+    while start >= 0:
+        if start % step:
+            start = data.find(pattern, start + 1)
+            continue
+        yield start // step
+        start = data.find(pattern, start + step)
@@ -0,0 +1,195 @@
+"""NumPy versions of the per-pixel loops in :mod:`engine.png` and :mod:`engine.art`.
+
+Imported only through :func:`engine.png.numpy_backend`, and only when NumPy
+is installed. Every function here returns exactly what its pure-Python
+counterpart returns, down to the byte: unfiltering and box sums are integer
+arithmetic, and luminance is computed with the same float64 operations in
+the same order.
+"""
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from .png import GRAY, GRAY_ALPHA, PALETTE, RGB, PNGError, PNGInfo, _Inflater, _palette_entries, _unfilter
+
+# Scanlines unfiltered together. Bounds memory to this many rows and is the
+# most a downsample reads past its last cell.
+BAND_ROWS = 256
+# A band solved along its diagonals costs about as much as this many Average
+# or Paeth rows done one at a time in Python.
+_WAVEFRONT_MIN_ROWS = 16
+
+
+def pass_rows(stream: _Inflater, info: PNGInfo, width: int, height: int) -> Iterator[bytearray]:
+    """Unfilter and convert ``height`` scanlines of ``width`` pixels, a band at a time."""
+    size = info.row_bytes(width)
+    unit = info.filter_unit
+    convert = converter(info, width)
+    previous = np.zeros(size, np.uint8)
+    done = 0
+    while done < height:
+        count = min(BAND_ROWS, height - done)
+        band = np.frombuffer(stream.read((size + 1) * count), np.uint8).reshape(count, size + 1)
+        filters = band[:, 0]
+        if filters.max() > 4:
+            raise PNGError(f"Unknown filter type {filters.max()}")
+        if np.count_nonzero(filters >= 3) >= _WAVEFRONT_MIN_ROWS:
+            lines = _wavefront(filters, band[:, 1:], previous, unit)
+        else:
+            lines = _by_row(filters, band[:, 1:], previous, unit)
+        for line in convert(lines):
+            yield bytearray(line)
+        previous = lines[-1]
+        done += count
+
+
+def _by_row(filters: np.ndarray, data: np.ndarray, previous: np.ndarray, unit: int) -> np.ndarray:
+    lines = data.copy()
+    for index, filter_type in enumerate(filters.tolist()):
+        line = lines[index]
+        if filter_type == 1:
+            line[:] = np.cumsum(line.reshape(-1, unit), axis=0, dtype=np.uint8).reshape(-1)
+        elif filter_type == 2:
+            line += previous
+        elif filter_type:
+            # Average and Paeth depend on the byte just unfiltered to their left.
+            row = bytearray(line.tobytes())
+            _unfilter(filter_type, row, bytearray(previous.tobytes()), unit)
+            line[:] = np.frombuffer(row, np.uint8)
+        previous = line
+    return lines
+
+
+def _wavefront(filters: np.ndarray, data: np.ndarray, previous: np.ndarray, unit: int) -> np.ndarray:
+    """Unfilter a band of any filter types along its anti-diagonals.
+
+    Every filter predicts a pixel from its left, upper and upper-left
+    neighbours only, so all pixels with the same ``row + column`` can be
+    computed at once from the diagonal before. The band is stored skewed,
+    ``skew[row + column + 1, row]``, which turns each diagonal into one
+    contiguous slice; row 0 is ``previous`` and column -1 stays zero.
+    """
+    rows, size = data.shape
+    pixels = size // unit
+    columns = pixels + rows + 1
+    skew = np.zeros((columns, rows + 1, unit), np.int16)
+    filtered = np.zeros_like(skew)
+    skew[1 : pixels + 1, 0] = previous.reshape(pixels, unit)
+    for row in range(1, rows + 1):
+        filtered[row + 1 : row + 1 + pixels, row] = data[row - 1].reshape(pixels, unit)
+    # Sub, Up and None are Paeth with some neighbours read as zero (Paeth of
+    # (a, 0, 0) is a, of (0, b, 0) is b), so one formula covers four filters.
+    kinds = filters[:, None]
+    uses_left = np.isin(kinds, (1, 3, 4)).astype(np.int16)
+    uses_up = np.isin(kinds, (2, 3, 4)).astype(np.int16)
+    uses_up_left = (kinds == 4).astype(np.int16)
+    average = np.broadcast_to(kinds == 3, (rows, unit))
+    for column in range(2, columns):
+        first = max(1, column - pixels)
+        stop = min(rows, column - 1) + 1
+        masks = slice(first - 1, stop - 1)
+        left = skew[column - 1, first:stop] * uses_left[masks]
+        up = skew[column - 1, first - 1 : stop - 1] * uses_up[masks]
+        predictor = skew[column - 2, first - 1 : stop - 1] * uses_up_left[masks]
+        pa = up - predictor
+        pb = left - predictor
+        pc = np.abs(pa + pb)
+        np.abs(pa, out=pa)
+        np.abs(pb, out=pb)
+        np.copyto(predictor, up, where=pb <= pc)
+        np.copyto(predictor, left, where=(pa <= pb) & (pa <= pc))
+        left += up
+        left >>= 1
+        np.copyto(predictor, left, where=average[masks])
+        predictor += filtered[column, first:stop]
+        predictor &= 255
+        skew[column, first:stop] = predictor
+    lines = np.empty((rows, size), np.uint8)
+    for row in range(1, rows + 1):
+        lines[row - 1] = skew[row + 1 : row + 1 + pixels, row].reshape(size)
+    return lines
+
+
+def converter(info: PNGInfo, width: int):
+    """Return a function turning a band of unfiltered scanlines into RGBA rows."""
+    color_type, depth, channels = info.color_type, info.bit_depth, info.channels
+    if depth < 8:
+        shifts = np.arange(8 - depth, -1, -depth, dtype=np.uint8)
+        mask = (1 << depth) - 1
+        scale = np.array([value * 255 // mask for value in range(mask + 1)], np.uint8)
+
+    def samples(lines: np.ndarray) -> np.ndarray:
+        # One byte per sample: sub-byte samples unpacked, 16-bit reduced to the high byte.
+        if depth < 8:
+            unpacked = (lines[:, :, None] >> shifts) & mask
+            return unpacked.reshape(len(lines), -1)[:, : width * channels]
+        if depth == 16:
+            return lines[:, 0::2]
+        return lines
+
+    if color_type == PALETTE:
+        table = np.frombuffer(b"".join(_palette_entries(info)), np.uint8).reshape(256, 4)
+        return lambda lines: table[samples(lines)].reshape(len(lines), width * 4)
+
+    key = None
+    if info.transparency is not None and color_type in (GRAY, RGB):
+        values = [int.from_bytes(info.transparency[i : i + 2], "big") for i in range(0, len(info.transparency), 2)]
+        if depth == 16:
+            key = np.frombuffer(b"".join(value.to_bytes(2, "big") for value in values), np.uint8)
+        else:
+            key = np.array([value & 255 for value in values], np.uint8)
+
+    def convert(lines: np.ndarray) -> np.ndarray:
+        data = samples(lines)
+        out = np.empty((len(lines), width, 4), np.uint8)
+        if color_type in (GRAY, GRAY_ALPHA):
+            step = 1 if color_type == GRAY else 2
+            gray = data[:, 0::step]
+            out[:, :, :3] = (scale[gray] if depth < 8 else gray)[:, :, None]
+            out[:, :, 3] = 255 if color_type == GRAY else data[:, 1::2]
+        elif color_type == RGB:
+            out[:, :, :3] = data.reshape(len(lines), width, 3)
+            out[:, :, 3] = 255
+        else:
+            out[:] = data.reshape(len(lines), width, 4)
+        if key is not None:
+            # Sub-byte samples are compared after unpacking, the rest as stored.
+            haystack = data if depth < 8 else lines
+            out[:, :, 3][(haystack.reshape(len(lines), width, -1) == key).all(axis=2)] = 0
+        return out.reshape(len(lines), width * 4)
+
+    return convert
+
+
+def box_means(
+    lines: Iterable[bytes], width: int, x_edges: Sequence[int], y_edges: Sequence[int]
+) -> Iterator[List[List[int]]]:
+    """Per-channel box means for each band of ``y_edges``, as ``PNGImage._box_means`` yields them."""
+    starts = np.array(x_edges[:-1], np.intp)
+    widths = np.diff(np.array(x_edges, np.int64))
+    total = np.zeros(width * 4, np.int64)
+    band = 0
+    for y, line in enumerate(lines):
+        total += np.frombuffer(line, np.uint8)
+        if y + 1 < y_edges[band + 1]:
+            continue
+        sums = np.add.reduceat(total.reshape(width, 4), starts, axis=0)
+        counts = (widths * (y_edges[band + 1] - y_edges[band]))[:, None]
+        yield ((sums + counts // 2) // counts).T.tolist()
+        total[:] = 0
+        band += 1
+        if band == len(y_edges) - 1:
+            return
+
+
+def ramp_line(pixels: Sequence[Tuple[int, int, int, int]], ramp: str, opaque: int) -> str:
+    """One line of ASCII art: each pixel's luminance picks a ``ramp`` character."""
+    values = np.array(pixels, np.int64).reshape(-1, 4)
+    r, g, b, a = values.T
+    luminance = 0.2126 * r + 0.7152 * g + 0.0722 * b
+    indexes = (luminance / 255 * (len(ramp) - 1)).astype(np.intp)
+    chars = np.array(list(ramp))[indexes]
+    chars[a < opaque] = " "
+    return "".join(chars.tolist())
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .lazy import GameFileIndex, scan_game_file
+from .loader import build_location, index_location
+from .models import GameMetadata, LocationMetadata, PlayerMetadata, freeze_game, patch_baseline_state
+from .vocabulary import VOCABULARY
+
+_INDEXES = (
+    ("objects", "object_locations"),
+    ("actors", "actor_locations"),
+    ("pathways", "pathway_locations"),
+)
+
+
+@dataclass(slots=True)
+class ReloadReport:
+    """What an incremental reload rebuilt and how long it took."""
+
+    rebuilt: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    reused: int = 0
+    seconds: float = 0.0
+
+    def as_dict(self) -> Dict[str, object]:
+        report = asdict(self)
+        report["ms"] = round(report.pop("seconds") * 1000, 3)
+        return report
+
+
+def location_fingerprints(data: bytes, index: GameFileIndex) -> Dict[str, bytes]:
+    """Hash the raw bytes of every location in the game file ``data``.
+
+    Any edit inside a location's JSON, including whitespace, changes its
+    fingerprint; edits elsewhere in the file leave it alone.
+    """
+    return {
+        location_id: hashlib.blake2b(data[start:end], digest_size=16).digest()
+        for location_id, (start, end) in index.spans.items()
+    }
+
+
+def reload_game(
+    previous: Optional[GameMetadata],
+    previous_fingerprints: Dict[str, bytes],
+    data: bytes,
+) -> Tuple[GameMetadata, Dict[str, bytes], ReloadReport]:
+    """Build metadata for the game file ``data``, reusing unchanged locations.
+
+    Locations whose fingerprint matches ``previous_fingerprints`` keep their
+    ``LocationMetadata`` from ``previous``; only new and edited ones are
+    parsed and built, and only their entities are re-indexed and given
+    fresh baseline states. The whole file is still scanned and validated,
+    so a broken edit raises ``GameValidationError`` (or ``ValueError`` for
+    malformed JSON) and ``previous`` stays usable; it is never modified.
+    Returns the new metadata, its fingerprints and a report.
+    """
+    started = time.perf_counter()
+    index = scan_game_file(data.decode("utf-8"))
+    fingerprints = location_fingerprints(data, index)
+    old_locations: Mapping[str, LocationMetadata] = previous.locations if previous is not None else {}
+    report = ReloadReport()
+
+    locations: Dict[str, LocationMetadata] = {}
+    rebuilt: List[LocationMetadata] = []
+    for location_id, (start, end) in index.spans.items():
+        location = old_locations.get(location_id)
+        if location is None or previous_fingerprints.get(location_id) != fingerprints[location_id]:
+            location = build_location(json.loads(data[start:end]))
+            rebuilt.append(location)
+            report.rebuilt.append(location_id)
+        locations[location_id] = location
+    report.reused = len(locations) - len(rebuilt)
+    report.removed = [location_id for location_id in old_locations if location_id not in locations]
+
+    header = index.header
+    intern = VOCABULARY.intern
+    player_cfg = header["player"]
+    game = GameMetadata(
+        title=header.get("title", "Untitled"),
+        summary=header.get("summary", ""),
+        start_location=intern(header["start_location"]),
+        locations=locations,
+        player=PlayerMetadata(
+            name=intern(player_cfg.get("name", "Player")),
+            description=player_cfg.get("description", ""),
+            starting_inventory=tuple(intern(obj_id) for obj_id in player_cfg.get("starting_inventory", [])),
+        ),
+        references=index.references,
+    )
+    replaced: List[LocationMetadata] = []
+    if previous is not None:
+        # Start from the old indexes and drop entities of every location that
+        # was replaced or removed before indexing the rebuilt ones, so an
+        # entity that moved between two edited locations ends up in the right one.
+        for kind, home in _INDEXES:
+            getattr(game, kind).update(getattr(previous, kind))
+            getattr(game, home).update(getattr(previous, home))
+        replaced = [old for location_id, old in old_locations.items() if locations.get(location_id) is not old]
+        for location in replaced:
+            for kind, home in _INDEXES:
+                entities, homes = getattr(game, kind), getattr(game, home)
+                for entity in getattr(location, kind):
+                    if homes.get(entity.id) == location.id:
+                        del entities[entity.id]
+                        del homes[entity.id]
+    for location in rebuilt:
+        index_location(game, location)
+    game = freeze_game(game)
+    if previous is not None:
+        patch_baseline_state(game, previous, replaced, rebuilt)
+    report.seconds = time.perf_counter() - started
+    return game, fingerprints, report
+
+
+class PollingWatcher:
+    """Poll files for changes to their mtime or size from a daemon thread.
+
+    ``paths`` is called on every poll, so files that appear later are picked
+    up; ``on_change`` receives each new or modified path (deletions are
+    ignored) and must handle its own errors. Uses only ``os.stat``, so it
+    works everywhere at the cost of up to ``interval`` seconds of delay.
+    """
+
+    def __init__(
+        self,
+        paths: Callable[[], Iterable[Path]],
+        on_change: Callable[[Path], None],
+        interval: float = 1.0,
+    ) -> None:
+        self.paths = paths
+        self.on_change = on_change
+        self.interval = interval
+        self._seen: Dict[Path, Tuple[int, int]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.poll(notify=False)
+
+    def poll(self, notify: bool = True) -> List[Path]:
+        """Check every path once and return (and report) the ones that changed."""
+        changed = []
+        for path in self.paths():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if self._seen.get(path) != signature:
+                self._seen[path] = signature
+                changed.append(path)
+        if notify:
+            for path in changed:
+                self.on_change(path)
+        return changed
+
+    def start(self) -> "PollingWatcher":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="game-reload", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.poll()
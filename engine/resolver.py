@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from typing import Dict, Generic, Iterable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def normalize_name(text: str) -> str:
+    normalized = " ".join(text.casefold().split())
+    # Hand back the caller's (usually interned) string when nothing changed,
+    # so index keys share storage with the names and ids they come from.
+    return text if normalized == text else normalized
+
+
+def entity_keys(entity: object) -> List[str]:
+    """Return the normalized names an entity answers to (name, id and aliases)."""
+    keys = [getattr(entity, "name", ""), getattr(entity, "id", "")]
+    keys.extend(getattr(entity, "aliases", ()))
+    return [key for key in (normalize_name(raw) for raw in keys) if key]
+
+
+class NameIndex(Generic[T]):
+    """Casefolded name lookup with exact and unambiguous-prefix matching.
+
+    Exact matches are a single dict probe. Prefix matches bisect a sorted key
+    list and only succeed when every key sharing the prefix names the same
+    entity, so "cab" resolves to "cabin door" but not when a "cabinet" exists.
+    """
+
+    def __init__(self, entities: Iterable[T] = ()) -> None:
+        self._entries: Dict[str, List[T]] = {}
+        for entity in entities:
+            for key in entity_keys(entity):
+                bucket = self._entries.setdefault(key, [])
+                if not any(existing is entity for existing in bucket):
+                    bucket.append(entity)
+        self._keys: List[str] = sorted(self._entries)
+
+    @classmethod
+    def prebuilt(cls, entries: Dict[str, List[T]]) -> "NameIndex[T]":
+        """Wrap entries already keyed by normalized name, e.g. from a bundle."""
+        index = cls()
+        index._entries = entries
+        index._keys = sorted(entries)
+        return index
+
+    def items(self) -> Iterable[Tuple[str, List[T]]]:
+        return self._entries.items()
+
+    def add(self, entity: T) -> None:
+        for key in entity_keys(entity):
+            bucket = self._entries.get(key)
+            if bucket is None:
+                self._entries[key] = [entity]
+                insort(self._keys, key)
+            elif not any(existing is entity for existing in bucket):
+                bucket.append(entity)
+
+    def discard(self, entity: T) -> None:
+        for key in entity_keys(entity):
+            bucket = self._entries.get(key)
+            if not bucket:
+                continue
+            bucket[:] = [existing for existing in bucket if existing is not entity]
+            if not bucket:
+                del self._entries[key]
+                del self._keys[bisect_left(self._keys, key)]
+
+    def exact(self, key: str) -> List[T]:
+        return self._entries.get(key, [])
+
+    def prefix(self, key: str) -> List[T]:
+        if not key:
+            return []
+        match = None
+        index = bisect_left(self._keys, key)
+        while index < len(self._keys) and self._keys[index].startswith(key):
+            for entity in self._entries[self._keys[index]]:
+                if match is None:
+                    match = entity
+                elif entity is not match:
+                    return []
+            index += 1
+        return [match] if match is not None else []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass(frozen=True, slots=True)
+class LocationNames:
+    """Prebuilt name indexes for everything a location holds."""
+
+    objects: NameIndex = field(default_factory=NameIndex)
+    actors: NameIndex = field(default_factory=NameIndex)
+    pathways: NameIndex = field(default_factory=NameIndex)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import math
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .engine import CommandResponse, GameEngine
+
+TRANSCRIPT_VERSION = 1
+NARRATOR_VERB = "narrator"
+
+
+@dataclass
+class TranscriptEntry:
+    command: str
+    output: str
+    handled: bool
+    elapsed_ms: float
+
+
+@dataclass
+class Transcript:
+    title: str
+    entries: List[TranscriptEntry] = field(default_factory=list)
+
+    @property
+    def commands(self) -> List[str]:
+        return [entry.command for entry in self.entries]
+
+    def save(self, path: Path) -> None:
+        payload = {
+            "version": TRANSCRIPT_VERSION,
+            "title": self.title,
+            "entries": [asdict(entry) for entry in self.entries],
+        }
+        path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> "Transcript":
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        entries = [TranscriptEntry(**entry) for entry in payload.get("entries", [])]
+        return cls(title=payload.get("title", ""), entries=entries)
+
+
+class TranscriptRecorder:
+    """Capture every command an engine handles, with its output and latency.
+
+    The recorder wraps the engine instance's ``handle_command`` so commands
+    arriving through ``handle_commands`` or any other caller are recorded too.
+    """
+
+    def __init__(self, engine: GameEngine) -> None:
+        self.engine = engine
+        self.transcript = Transcript(title=engine.metadata.title)
+        self._handle_command = engine.handle_command
+        engine.handle_command = self.handle_command  # type: ignore[method-assign]
+
+    def handle_command(self, raw_input: str, *, render_art: Optional[bool] = None) -> CommandResponse:
+        started = time.perf_counter()
+        response = self._handle_command(raw_input, render_art=render_art)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.transcript.entries.append(
+            TranscriptEntry(raw_input, response.output, response.handled, elapsed_ms)
+        )
+        return response
+
+    def detach(self) -> Transcript:
+        self.engine.handle_command = self._handle_command  # type: ignore[method-assign]
+        return self.transcript
+
+
+def verb_label(engine: GameEngine, command: str) -> str:
+    """Name of the registered verb ``command`` dispatches to."""
+    if not command.strip():
+        return "look"
+    resolved = engine.verbs.resolve(command)
+    if resolved is None:
+        return NARRATOR_VERB
+    return resolved[0].name
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples`` (which must be sorted)."""
+    if not samples:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(samples)))
+    return samples[rank - 1]
+
+
+@dataclass
+class ReplayResult:
+    commands: int = 0
+    total_seconds: float = 0.0
+    mismatches: int = 0
+    latencies_ms: Dict[str, List[float]] = field(default_factory=dict)
+
+    def add(self, verb: str, elapsed_ms: float) -> None:
+        self.latencies_ms.setdefault(verb, []).append(elapsed_ms)
+        self.commands += 1
+        self.total_seconds += elapsed_ms / 1000
+
+    def summary(self) -> Dict[str, object]:
+        verbs: Dict[str, Dict[str, float]] = {}
+        for verb, samples in sorted(self.latencies_ms.items()):
+            ordered = sorted(samples)
+            verbs[verb] = {
+                "count": len(ordered),
+                "mean_ms": sum(ordered) / len(ordered),
+                "p50_ms": percentile(ordered, 50),
+                "p95_ms": percentile(ordered, 95),
+                "p99_ms": percentile(ordered, 99),
+            }
+        throughput = self.commands / self.total_seconds if self.total_seconds else 0.0
+        return {
+            "commands": self.commands,
+            "total_seconds": self.total_seconds,
+            "commands_per_second": throughput,
+            "mismatches": self.mismatches,
+            "verbs": verbs,
+        }
+
+
+def replay(
+    engine: GameEngine,
+    transcript: Transcript,
+    result: Optional[ReplayResult] = None,
+    *,
+    check_output: bool = True,
+) -> ReplayResult:
+    """Run ``transcript`` against ``engine`` and collect per-verb latencies."""
+    result = result or ReplayResult()
+    for entry in transcript.entries:
+        verb = verb_label(engine, entry.command)
+        started = time.perf_counter()
+        response = engine.handle_command(entry.command)
+        result.add(verb, (time.perf_counter() - started) * 1000)
+        if check_output and response.output != entry.output:
+            result.mismatches += 1
+    return result
+
+
+def record(engine: GameEngine, commands: Iterable[str]) -> Transcript:
+    recorder = TranscriptRecorder(engine)
+    try:
+        for command in commands:
+            engine.handle_command(command)
+    finally:
+        recorder.detach()
+    return recorder.transcript
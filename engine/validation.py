@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from .models import ReferenceIndex, read_only
+from .vocabulary import Vocabulary, interner
+
+PathPart = Union[str, int]
+
+# Which id namespace each reference field points into.
+_REFERENCE_KINDS = {
+    "target": "locations",
+    "unlocks_with": "objects",
+    "reveals_with": "objects",
+    "contains": "objects",
+    "inventory": "objects",
+    "starting_inventory": "objects",
+    "start_location": "locations",
+}
+_ENTITY_KINDS = ("objects", "actors", "pathways")
+_REQUIRED = {"objects": ("id",), "actors": ("id",), "pathways": ("id", "target")}
+
+
+def _entity_path(where: Tuple[Any, ...], *rest: PathPart) -> Tuple[PathPart, ...]:
+    position, kind, index = where
+    return ("locations", position, kind, index) + rest
+
+
+def _full_path(where: Tuple[Any, ...]) -> Tuple[PathPart, ...]:
+    return where if where[0] == "locations" else _entity_path(where)
+
+
+def _reference_path(field_name: str, where: Optional[Tuple[Any, ...]], item: int) -> Tuple[PathPart, ...]:
+    if where is None or len(where) == 1:
+        path: Tuple[PathPart, ...] = (where or ()) + (field_name,)
+    else:
+        path = _entity_path(where, field_name)
+    return path + (item,) if item >= 0 else path
+
+
+def json_path(parts: Iterable[PathPart]) -> str:
+    """Format ``("locations", 2, "id")`` as ``$.locations[2].id``."""
+    rendered = ["$"]
+    for part in parts:
+        rendered.append(f"[{part}]" if isinstance(part, int) else f".{part}")
+    return "".join(rendered)
+
+
+@dataclass(slots=True)
+class ValidationIssue:
+    path: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}"
+
+
+class GameValidationError(ValueError):
+    """Raised when a game file has missing fields or dangling references."""
+
+    def __init__(self, issues: List[ValidationIssue]) -> None:
+        self.issues = issues
+        lines = "\n".join(f"  {issue}" for issue in issues)
+        super().__init__(f"Game metadata has {len(issues)} problem(s):\n{lines}")
+
+
+class ReferenceChecker:
+    """Check a game's raw config for dangling references in a single pass.
+
+    Locations are fed one at a time (as ``load_game`` and the lazy file scan
+    see them), ids are recorded as they appear and references are resolved
+    once in :meth:`finish`, so forward references between locations are
+    fine. JSON paths are only formatted for references that fail.
+    """
+
+    def __init__(self, vocabulary: Optional[Vocabulary] = None) -> None:
+        # Ids kept in the reference index are interned like the metadata's.
+        self._intern = interner(vocabulary)
+        self.issues: List[ValidationIssue] = []
+        # Reverse references, frozen into a ReferenceIndex by finish().
+        self._entrances: Dict[str, List[str]] = {}
+        self._unlocks: Dict[str, List[str]] = {}
+        self._reveals: Dict[str, List[str]] = {}
+        self._container_of: Dict[str, str] = {}
+        self._ids: Dict[str, Dict[str, Tuple[PathPart, ...]]] = {
+            "locations": {},
+            **{kind: {} for kind in _ENTITY_KINDS},
+        }
+        self._pending: List[Tuple[str, Any, Optional[Tuple[Any, ...]], int]] = []
+
+    def add_location(self, position: int, cfg: Mapping[str, Any]) -> None:
+        self._declare("locations", cfg, ("locations", position))
+        intern = self._intern
+        entrances, unlocks, reveals = self._entrances, self._unlocks, self._reveals
+        for kind in _ENTITY_KINDS:
+            required = _REQUIRED[kind]
+            for index, entity in enumerate(cfg.get(kind, ())):
+                # Paths are kept as (location, kind, index) until something fails.
+                where = (position, kind, index)
+                for key in required:
+                    if key not in entity:
+                        self._issue(_entity_path(where, key), "missing required field")
+                entity_id = self._declare(kind, entity, where)
+                if entity_id is not None:
+                    entity_id = intern(entity_id)
+                if kind == "pathways":
+                    target = entity.get("target")
+                    if target is not None and self._reference("target", target, where):
+                        entrances.setdefault(intern(target), []).append(entity_id)
+                    ref = entity.get("unlocks_with")
+                    if ref is not None and self._reference("unlocks_with", ref, where):
+                        unlocks.setdefault(intern(ref), []).append(entity_id)
+                    ref = entity.get("reveals_with")
+                    if ref is not None and self._reference("reveals_with", ref, where):
+                        reveals.setdefault(intern(ref), []).append(entity_id)
+                elif kind == "objects":
+                    for item, ref in enumerate(self._id_list(entity, "contains", where)):
+                        if self._reference("contains", ref, where, item):
+                            self._container_of[intern(ref)] = entity_id
+                else:
+                    for item, ref in enumerate(self._id_list(entity, "inventory", where)):
+                        self._reference("inventory", ref, where, item)
+
+    def finish(self, header: Mapping[str, Any]) -> ReferenceIndex:
+        """Check the top-level fields and every recorded reference.
+
+        Raises :class:`GameValidationError` listing all problems found.
+        """
+        if "start_location" not in header:
+            self._issue(("start_location",), "missing required field")
+        else:
+            self._reference("start_location", header["start_location"], None)
+        if "player" not in header:
+            self._issue(("player",), "missing required field")
+        else:
+            inventory = self._id_list(header["player"], "starting_inventory", ("player",))
+            for item, ref in enumerate(inventory):
+                self._reference("starting_inventory", ref, ("player",), item)
+        for field_name, ref, where, item in self._pending:
+            kind = _REFERENCE_KINDS[field_name]
+            if ref not in self._ids[kind]:
+                self._issue(_reference_path(field_name, where, item), f"unknown {kind[:-1]} id {ref!r}")
+        self._pending.clear()
+        if self.issues:
+            raise GameValidationError(self.issues)
+        return ReferenceIndex(
+            entrances=read_only({key: tuple(ids) for key, ids in self._entrances.items()}),
+            unlocks=read_only({key: tuple(ids) for key, ids in self._unlocks.items()}),
+            reveals=read_only({key: tuple(ids) for key, ids in self._reveals.items()}),
+            container_of=read_only(self._container_of),
+        )
+
+    def _reference(self, field_name: str, ref: Any, where: Optional[Tuple[Any, ...]], item: int = -1) -> bool:
+        """Queue ``ref`` for :meth:`finish`, or report it now if it is not an id string."""
+        if not isinstance(ref, str):
+            kind = _REFERENCE_KINDS[field_name]
+            self._issue(
+                _reference_path(field_name, where, item),
+                f"expected a string {kind[:-1]} id, got {type(ref).__name__} {ref!r}",
+            )
+            return False
+        self._pending.append((field_name, ref, where, item))
+        return True
+
+    def _id_list(self, cfg: Mapping[str, Any], field_name: str, where: Tuple[Any, ...]) -> Iterable[Any]:
+        refs = cfg.get(field_name, ())
+        if isinstance(refs, (list, tuple)):
+            return refs
+        kind = _REFERENCE_KINDS[field_name]
+        self._issue(
+            _reference_path(field_name, where, -1),
+            f"expected a list of {kind[:-1]} ids, got {type(refs).__name__} {refs!r}",
+        )
+        return ()
+
+    def _declare(self, kind: str, cfg: Mapping[str, Any], where: Tuple[Any, ...]) -> Any:
+        entity_id = cfg.get("id")
+        if entity_id is None:
+            if kind == "locations":
+                self._issue(where + ("id",), "missing required field")
+            return None
+        if not isinstance(entity_id, str):
+            self._issue(
+                _full_path(where) + ("id",), f"expected a string id, got {type(entity_id).__name__} {entity_id!r}"
+            )
+            return None
+        seen = self._ids[kind]
+        first = seen.setdefault(entity_id, where)
+        if first is not where:
+            self._issue(
+                _full_path(where) + ("id",),
+                f"duplicate {kind[:-1]} id {entity_id!r} (first defined at {json_path(_full_path(first))})",
+            )
+        return entity_id
+
+    def _issue(self, path: Tuple[PathPart, ...], message: str) -> None:
+        self.issues.append(ValidationIssue(json_path(path), message))
+
+
+def validate_game_config(
+    metadata: Mapping[str, Any], vocabulary: Optional[Vocabulary] = None
+) -> ReferenceIndex:
+    """Validate a whole game document and return its reference indexes."""
+    checker = ReferenceChecker(vocabulary)
+    for position, location_cfg in enumerate(metadata.get("locations", ())):
+        checker.add_location(position, location_cfg)
+    return checker.finish(metadata)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import sys
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+class Vocabulary:
+    """Table of canonical strings, optionally numbered with small integer codes.
+
+    ``intern`` returns one shared ``str`` instance per distinct text, so an
+    id that appears as an entity id, a pathway target, a ``contains`` entry,
+    a name-index key and a state key is stored once, and dict probes with it
+    succeed on the identity check before comparing characters. ``code`` and
+    ``text`` map strings to dense ints for callers that pack them into bit
+    fields or arrays; codes are only assigned to strings that ask for one.
+    Entries are never removed.
+    """
+
+    __slots__ = ("_canonical", "codes", "texts")
+
+    def __init__(self, texts: Iterable[str] = ()) -> None:
+        self._canonical: Dict[str, str] = {}
+        self.codes: Dict[str, int] = {}
+        self.texts: List[str] = []
+        for text in texts:
+            self.code(text)
+
+    def intern(self, text: str) -> str:
+        return self._canonical.setdefault(text, text)
+
+    def code(self, text: str) -> int:
+        code = self.codes.get(text)
+        if code is None:
+            text = self.intern(text)
+            code = self.codes[text] = len(self.texts)
+            self.texts.append(text)
+        return code
+
+    def text(self, code: int) -> str:
+        return self.texts[code]
+
+    def table_bytes(self) -> int:
+        """Memory held by the lookup tables themselves, excluding the strings."""
+        return sys.getsizeof(self._canonical) + sys.getsizeof(self.codes) + sys.getsizeof(self.texts)
+
+    def __contains__(self, text: object) -> bool:
+        return text in self._canonical
+
+    def __len__(self) -> int:
+        return len(self._canonical)
+
+
+# Shared by every game loaded in this process: ids, names and state keys.
+VOCABULARY = Vocabulary()
+
+
+def _same(text: str) -> str:
+    return text
+
+
+def interner(vocabulary: Optional[Vocabulary]) -> Callable[[str], str]:
+    """Return ``vocabulary.intern``, or a no-op when interning is disabled."""
+    return vocabulary.intern if vocabulary is not None else _same
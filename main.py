@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-import json
+import argparse
+import sys
 from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, TextIO
 
-from engine import GameEngine, LLMClient, load_game
+from engine import GameEngine
+from engine.art import ART_STYLES, detect_art_style
+from engine.artcache import ArtCache
+from engine.catalog import GameCatalog
+from engine.engine import RENDER_MODES
+from engine.lazy import load_game_lazy
+from engine.transcript import TranscriptRecorder
 
 
-def load_metadata(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+GAMES_DIR = Path(__file__).parent / "games"
+DEFAULT_GAME = "pirate_sample"
 
 
 def run_cli(game: GameEngine) -> None:
@@ -23,23 +30,157 @@ def run_cli(game: GameEngine) -> None:
         print(response.output)
 
 
+def script_commands(lines: Iterable[str]) -> Iterator[str]:
+    """Yield commands from a script, skipping blanks and ``#`` comments."""
+    for line in lines:
+        command = line.strip()
+        if not command or command.startswith("#"):
+            continue
+        if command.lower() in {"quit", "exit"}:
+            return
+        yield command
+
+
+def run_script(game: GameEngine, source: TextIO, render: str = "last") -> None:
+    commands: List[str] = []
+
+    def tracked() -> Iterator[str]:
+        for command in script_commands(source):
+            commands.append(command)
+            yield command
+
+    # Stdin may be a person typing or a slow pipe: answer each command as
+    # soon as it arrives instead of waiting for the next one.
+    lookahead = source is not sys.stdin and not source.isatty()
+    for response in game.handle_commands(tracked(), render=render, lookahead=lookahead):
+        print(f"> {commands.pop(0)}")
+        print(response.output)
+
+
 def build_game(
     sample: bool = True,
     *,
     render_ascii_art: bool = True,
     with_llm: bool = True,
+    lazy: bool = False,
+    bundle: bool = True,
+    game: str = DEFAULT_GAME,
+    art_cache: Optional[ArtCache] = None,
+    art_style: str = "ascii",
 ) -> GameEngine:
-    root = Path(__file__).parent
-    path = root / "games" / "pirate_sample.json"
-    metadata_dict = load_metadata(path)
-    metadata = load_game(metadata_dict)
+    catalog = GameCatalog(GAMES_DIR, use_bundle=bundle)
+    if lazy:
+        metadata = load_game_lazy(catalog.path(game))
+    else:
+        metadata = catalog.get(game)
     llm_client = None
     if with_llm:
+        from engine.llm import LLMClient
+
         candidate = LLMClient()
         if candidate.available():
             llm_client = candidate
-    return GameEngine(metadata, render_ascii_art=render_ascii_art, llm_client=llm_client)
+    return GameEngine(
+        metadata,
+        render_ascii_art=render_ascii_art,
+        llm_client=llm_client,
+        copy_on_write=lazy,
+        art_cache=art_cache,
+        art_style=art_style,
+    )
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Play an adventure from games/ in the terminal")
+    parser.add_argument(
+        "--game",
+        default=DEFAULT_GAME,
+        help=f"id (file name without .json) of the game to play (default: {DEFAULT_GAME})",
+    )
+    parser.add_argument(
+        "--list-games",
+        action="store_true",
+        help="list the games found under games/ with their load time and memory, then exit",
+    )
+    parser.add_argument(
+        "--script",
+        metavar="FILE",
+        help="run commands from FILE ('-' for stdin) instead of the interactive prompt",
+    )
+    parser.add_argument(
+        "--render",
+        choices=RENDER_MODES,
+        default="last",
+        help="when to draw location art while running a script (default: last)",
+    )
+    parser.add_argument("--no-llm", action="store_true", help="never contact the LLM")
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="index the game file and load locations only when they are first needed",
+    )
+    parser.add_argument(
+        "--no-bundle",
+        action="store_true",
+        help="parse the game JSON directly instead of its precompiled .gamebundle",
+    )
+    parser.add_argument(
+        "--art",
+        choices=("auto",) + ART_STYLES,
+        default="auto",
+        help="location art style: ASCII, or half-block 256/24-bit color sized to the terminal "
+        "(default: auto, color when stdout is a color terminal)",
+    )
+    parser.add_argument(
+        "--art-cache",
+        metavar="DIR",
+        type=Path,
+        help="directory for rendered location art shared across runs (default: ~/.cache/text-adventure/art)",
+    )
+    parser.add_argument(
+        "--no-art-cache",
+        action="store_true",
+        help="render location art from the PNGs every run instead of reusing the on-disk cache",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="FILE",
+        type=Path,
+        help="save a transcript of the session for scripts/replay_transcript.py",
+    )
+    args = parser.parse_args(argv)
+
+    if args.list_games:
+        for row in GameCatalog(GAMES_DIR, use_bundle=not args.no_bundle).describe():
+            print(
+                f"{row['id']:<24} {row['title']:<32} load {row['load_ms']:8.2f} ms "
+                f"| {row['memory_bytes'] / 1024:8.1f} KiB"
+            )
+        return 0
+    if args.game not in GameCatalog(GAMES_DIR):
+        parser.error(f"unknown game {args.game!r}; see --list-games")
+    game = build_game(
+        with_llm=not args.no_llm,
+        lazy=args.lazy,
+        bundle=not args.no_bundle,
+        game=args.game,
+        art_cache=None if args.no_art_cache else ArtCache(args.art_cache),
+        art_style=detect_art_style(sys.stdout) if args.art == "auto" else args.art,
+    )
+    recorder = TranscriptRecorder(game) if args.record else None
+    try:
+        if args.script is None:
+            run_cli(game)
+        elif args.script == "-":
+            run_script(game, sys.stdin, args.render)
+        else:
+            with open(args.script, "r", encoding="utf-8") as handle:
+                run_script(game, handle, args.render)
+    finally:
+        if recorder is not None:
+            recorder.detach().save(args.record)
+    return 0
 
 
 if __name__ == "__main__":
-    run_cli(build_game())
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,76 @@
+"""Measure the half-block ANSI renderer on the shipped artwork.
+
+For every image and color style the full ``png_to_ansi`` render at the
+given width is timed, along with its two stages: box-filtering the decoded
+rows into the pixel grid, and turning that grid into escape sequences and
+half blocks. Output size and characters per second of the second stage are
+reported too. Decoding dominates; once an image is cached only the
+render cache lookup remains, so its time is shown last.
+
+Usage:
+    python3 scripts/bench_ansi.py
+    python3 scripts/bench_ansi.py --columns 80 --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine import GameEngine, RenderCache
+from engine.art import half_blocks, png_to_ansi
+from engine.catalog import GameCatalog
+from engine.png import PNGImage
+
+
+def best_of(repeat: int, run: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the ANSI half-block renderer")
+    parser.add_argument("images", nargs="*", type=Path, help="defaults to images/*.png")
+    parser.add_argument("--columns", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    paths = args.images or sorted((ROOT / "images").glob("*.png"))
+
+    for path in paths:
+        image = PNGImage(path)
+        columns = min(args.columns, image.width)
+        pixel_rows = max(1, min(image.height, round(image.height * columns / image.width)))
+        downsample = best_of(args.repeat, lambda: list(image.downsample(columns, pixel_rows)))
+        grid = list(image.downsample(columns, pixel_rows))
+        for style in ("256", "truecolor"):
+            text = half_blocks(grid, style)
+            encode = best_of(args.repeat, lambda: half_blocks(grid, style))
+            full = best_of(args.repeat, lambda: png_to_ansi(path, args.columns, style))
+            print(
+                f"{path.name:<20} {style:>9} {columns}x{(pixel_rows + 1) // 2} cells "
+                f"| full {full * 1000:8.1f} ms = decode+filter {downsample * 1000:8.1f} ms "
+                f"+ escapes {encode * 1000:6.2f} ms ({columns * (pixel_rows + 1) // 2 / encode / 1e6:5.2f} M cells/s) "
+                f"| {len(text.encode('utf-8'))} bytes"
+            )
+
+    metadata = GameCatalog(ROOT / "games").get("pirate_sample")
+    engine = GameEngine(metadata, render_cache=RenderCache(), art_style="truecolor", art_columns=args.columns)
+    label = str(paths[0].relative_to(ROOT)) if paths[0].is_relative_to(ROOT) else str(paths[0])
+    engine._render_image_asset(label)
+    cached = best_of(args.repeat * 100, lambda: engine._render_image_asset(label))
+    print(f"cached render of {paths[0].name}: {cached * 1e6:.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
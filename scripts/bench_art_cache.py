@@ -0,0 +1,98 @@
+"""Measure the on-disk ASCII art cache across fresh processes.
+
+Each run starts a new interpreter that builds an engine the way
+``main.py`` does and plays the recorded walkthrough with location art
+drawn after every command, then reports its wall time and the art
+cache's counters. Runs go cold (empty cache directory), warm (entries
+left by the cold run) and without the cache at all. Finally several
+processes render at once into one directory whose budget only fits part
+of the art, exercising concurrent atomic writes and LRU eviction.
+
+Usage:
+    python3 scripts/bench_art_cache.py
+    python3 scripts/bench_art_cache.py --concurrent 8
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+TRANSCRIPT = ROOT / "scripts" / "transcripts" / "pirate_walkthrough.json"
+
+CHILD = """
+import json, sys, time
+from pathlib import Path
+started = time.perf_counter()
+from engine.artcache import ArtCache
+from engine.transcript import Transcript
+from main import build_game
+
+directory, max_bytes, transcript = sys.argv[1:4]
+cache = ArtCache(directory, int(max_bytes)) if directory else None
+game = build_game(with_llm=False, art_cache=cache)
+commands = [entry.command for entry in Transcript.load(Path(transcript)).entries]
+for _ in game.handle_commands(commands, render="each"):
+    pass
+print(json.dumps({"seconds": time.perf_counter() - started, "cache": game.cache_info().get("art_cache")}))
+"""
+
+
+def start(directory: Optional[Path], max_bytes: int) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-c", CHILD, str(directory or ""), str(max_bytes), str(TRANSCRIPT)],
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+
+
+def finish(process: subprocess.Popen) -> Dict[str, object]:
+    output, _ = process.communicate()
+    if process.returncode:
+        raise SystemExit(f"child exited with {process.returncode}")
+    return json.loads(output)
+
+
+def describe(label: str, result: Dict[str, object]) -> None:
+    line = f"{label:<26} {result['seconds'] * 1000:8.1f} ms"
+    cache = result["cache"]
+    if cache:
+        line += (
+            f" | hits {cache['hits']}, misses {cache['misses']}, hit rate {cache['hit_rate']}"
+            f", writes {cache['writes']}, evictions {cache['evictions']}"
+            f" | {cache['entries']} entries, {cache['bytes']} bytes"
+        )
+    print(line)
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the persistent ASCII art cache")
+    parser.add_argument("--concurrent", type=int, default=4, help="processes sharing one small cache")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        describe("no disk cache", finish(start(None, 0)))
+        describe("cold cache", finish(start(Path(directory), 1 << 20)))
+        describe("warm cache", finish(start(Path(directory), 1 << 20)))
+    with tempfile.TemporaryDirectory() as directory:
+        # Room for about one rendered image, so the processes keep evicting
+        # each other's entries while they read and write.
+        started = time.perf_counter()
+        processes = [start(Path(directory), 3000) for _ in range(args.concurrent)]
+        results = [finish(process) for process in processes]
+        elapsed = time.perf_counter() - started
+        for index, result in enumerate(results):
+            describe(f"shared, process {index}", result)
+        print(f"{args.concurrent} concurrent processes finished in {elapsed * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,96 @@
+"""Compare cold-start loading from game JSON and from a precompiled bundle.
+
+Each load runs in a fresh interpreter, so the timings include reading the
+file from the page cache, decoding and building the indexed metadata but
+not any warm state from a previous run. The sample game is measured along
+with a generated world large enough for the difference to show.
+
+Usage:
+    python3 scripts/bench_bundle.py
+    python3 scripts/bench_bundle.py --locations 20000 --objects 10 --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from generate_world import write_world
+
+
+def measure(mode: str, path: Path) -> Dict[str, float]:
+    started = time.perf_counter()
+    from engine.bundle import bundle_path_for, load_bundle
+    from engine.loader import load_game
+
+    imported = time.perf_counter()
+    if mode == "bundle":
+        metadata = load_bundle(bundle_path_for(path), path)
+        if metadata is None:
+            raise SystemExit(f"bundle for {path} is missing or stale")
+    else:
+        with path.open("r", encoding="utf-8") as handle:
+            metadata = load_game(json.load(handle))
+    loaded = time.perf_counter()
+    return {"import_s": imported - started, "load_s": loaded - imported, "objects": len(metadata.objects)}
+
+
+def run_child(mode: str, path: Path) -> Dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", mode, str(path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def compare(label: str, path: Path, repeat: int) -> None:
+    from engine.bundle import compile_bundle, describe_bundle
+
+    bundle = compile_bundle(path)
+    size = describe_bundle(bundle)
+    print(f"{label}: JSON {size['source_size'] / 1e6:.2f} MB, bundle {size['bytes'] / 1e6:.2f} MB")
+    for mode in ("json", "bundle"):
+        runs = [run_child(mode, path) for _ in range(repeat)]
+        load = statistics.median(run["load_s"] for run in runs)
+        print(f"  {mode:>6} | median load {load * 1000:9.2f} ms over {repeat} runs")
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark JSON vs bundle cold start")
+    parser.add_argument("--locations", type=int, default=10000)
+    parser.add_argument("--objects", type=int, default=10, help="objects per location")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        mode, path = args.child
+        print(json.dumps(measure(mode, Path(path))))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sample = Path(tmp) / "pirate_sample.json"
+        sample.write_bytes((ROOT / "games" / "pirate_sample.json").read_bytes())
+        compare("sample game", sample, args.repeat)
+
+        world = Path(tmp) / "world.json"
+        with world.open("w", encoding="utf-8") as handle:
+            write_world(handle, args.locations, args.objects, actors_per_location=1, fanout=2)
+        compare(f"{args.locations} locations x {args.objects} objects", world, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,76 @@
+"""Measure the web app's scaled image copies against the originals.
+
+For every image in ``images/`` and every width in ``DERIVATIVE_WIDTHS``
+narrower than it, the box-filter resize and the PNG encode are timed
+separately and the resulting size is compared with the original file,
+which is what ``/assets`` used to send at every width. The last column
+is the time to serve the cached copy through ``webapp.app``.
+
+Usage:
+    python3 scripts/bench_derivatives.py
+    python3 scripts/bench_derivatives.py images/PirateDeck.png
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+from wsgiref.util import setup_testing_defaults
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import webapp
+from engine.derivatives import DERIVATIVE_WIDTHS, DerivativeCache
+from engine.png import PNGImage, encode_png
+
+
+def serve(path: str, query: str) -> float:
+    environ: dict = {}
+    setup_testing_defaults(environ)
+    environ.update(PATH_INFO=path, QUERY_STRING=query)
+    started = time.perf_counter()
+    b"".join(webapp.app(environ, lambda status, headers: None))
+    return time.perf_counter() - started
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark responsive image derivatives")
+    parser.add_argument("images", nargs="*", type=Path, help="defaults to images/*.png")
+    args = parser.parse_args(argv)
+    paths = [path.resolve() for path in args.images] or sorted((ROOT / "images").glob("*.png"))
+
+    with tempfile.TemporaryDirectory() as directory:
+        webapp.DERIVATIVES = DerivativeCache(Path(directory))
+        for path in paths:
+            image = PNGImage(path)
+            original = path.stat().st_size
+            for width in DERIVATIVE_WIDTHS:
+                if width >= image.width:
+                    continue
+                height = max(1, round(image.height * width / image.width))
+                started = time.perf_counter()
+                rows = list(image.resize(width, height))
+                resized = time.perf_counter()
+                if not image.info.has_alpha:
+                    for line in rows:
+                        del line[3::4]
+                data = encode_png(width, height, rows, alpha=image.info.has_alpha)
+                encoded = time.perf_counter()
+                url = "/assets/" + str(path.relative_to(ROOT))
+                serve(url, f"w={width}")  # builds the cached copy
+                cached = min(serve(url, f"w={width}") for _ in range(5))
+                print(
+                    f"{path.name:<20} {width:>5}w | resize {(resized - started) * 1000:7.1f} ms, "
+                    f"encode {(encoded - resized) * 1000:7.1f} ms | {len(data):>9} bytes, "
+                    f"{len(data) / original:6.1%} of {original} | cached serve {cached * 1000:6.2f} ms"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,52 @@
+"""Benchmark verb dispatch as the registry grows.
+
+Registers an increasing number of throwaway single- and multi-word verbs and
+times how long the registry takes to resolve a handful of built-in commands.
+Dispatch goes through a first-token dict and a phrase trie, so the cost
+should not depend on how many verbs are registered.
+
+Usage:
+    python3 scripts/bench_dispatch.py
+    python3 scripts/bench_dispatch.py --counts 0 100 10000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine import GameEngine
+
+COMMANDS = ["look", "take treasure map", "pick up the lantern", "look at map", "sing a shanty"]
+
+
+def bench_count(extra_verbs: int, number: int) -> None:
+    registry = GameEngine.verbs.copy()
+    for index in range(extra_verbs):
+        registry.add([f"verb{index}", f"do thing {index}"], lambda engine, target: "")
+    timings = []
+    for command in COMMANDS:
+        elapsed = timeit.timeit(lambda: registry.resolve(command), number=number)
+        timings.append(f"{command!r} {elapsed / number * 1e6:5.2f} us")
+    print(f"{len(registry):>7} verbs | " + " | ".join(timings))
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark verb registry dispatch")
+    parser.add_argument("--counts", type=int, nargs="+", default=[0, 10, 100, 1000, 10000])
+    parser.add_argument("--number", type=int, default=20000, help="resolutions per measurement")
+    args = parser.parse_args(argv)
+
+    for count in args.counts:
+        bench_count(count, args.number)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
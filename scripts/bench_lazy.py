@@ -0,0 +1,87 @@
+"""Compare eager and lazy loading of a large generated world.
+
+Each mode runs in a fresh interpreter so resident memory is not shared:
+the child loads the world, builds a copy-on-write engine, runs a few
+commands and reports startup time, time to first output and peak RSS.
+
+Usage:
+    python3 scripts/bench_lazy.py
+    python3 scripts/bench_lazy.py --locations 100000 --objects 10
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from generate_world import write_world
+
+
+def measure(mode: str, path: Path) -> Dict[str, float]:
+    from engine import GameEngine, load_game
+    from engine.lazy import load_game_lazy
+
+    started = time.perf_counter()
+    if mode == "lazy":
+        metadata = load_game_lazy(path)
+    else:
+        with path.open("r", encoding="utf-8") as handle:
+            metadata = load_game(json.load(handle))
+    loaded = time.perf_counter()
+    game = GameEngine(metadata, render_ascii_art=False, copy_on_write=True)
+    game.describe_current_location()
+    first_output = time.perf_counter()
+    for command in ("take object 0-0", "go onward", "look", "inventory"):
+        game.handle_command(command)
+    return {
+        "load_s": loaded - started,
+        "first_output_s": first_output - started,
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark lazy location loading")
+    parser.add_argument("--locations", type=int, default=20000)
+    parser.add_argument("--objects", type=int, default=10, help="objects per location")
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        mode, path = args.child
+        print(json.dumps(measure(mode, Path(path))))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "world.json"
+        with path.open("w", encoding="utf-8") as handle:
+            write_world(handle, args.locations, args.objects, actors_per_location=1, fanout=2)
+        size_mb = path.stat().st_size / 1e6
+        print(f"{args.locations} locations, {args.locations * args.objects} objects, {size_mb:.1f} MB")
+        for mode in ("eager", "lazy"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--child", mode, str(path)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            stats = json.loads(output)
+            print(
+                f"{mode:>5} | load {stats['load_s']:7.3f}s | first output {stats['first_output_s']:7.3f}s"
+                f" | peak RSS {stats['max_rss_mb']:8.1f} MB"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
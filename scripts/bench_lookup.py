@@ -0,0 +1,61 @@
+"""Benchmark entity lookups as the world grows.
+
+Builds synthetic worlds of increasing size, fills the player's inventory and
+times the engine paths that resolve objects by id. With the id-keyed indexes
+on ``GameMetadata`` the per-call cost should stay flat across sizes.
+
+Usage:
+    python3 scripts/bench_lookup.py
+    python3 scripts/bench_lookup.py --sizes 10 100 1000 --objects 10
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine import GameEngine, load_game
+from generate_world import generate_world
+
+
+def bench_size(locations: int, objects_per_location: int, number: int) -> None:
+    metadata = load_game(generate_world(locations, objects_per_location))
+    game = GameEngine(metadata, render_ascii_art=False)
+    # Carry objects from far-away locations so a scan would have to walk the world.
+    for loc_index in range(0, locations, max(1, locations // 10)):
+        obj_id = f"obj_{loc_index}_0"
+        game.state.objects[obj_id].held_by_player = True
+        game.state.player.inventory.append(obj_id)
+    last_id = f"obj_{locations - 1}_{objects_per_location - 1}"
+
+    lookup = timeit.timeit(lambda: game._object_by_id(last_id), number=number)
+    inventory = timeit.timeit(game.describe_inventory, number=number)
+    view = timeit.timeit(game.view_state, number=number)
+    print(
+        f"{locations * objects_per_location:>9} objects | "
+        f"_object_by_id {lookup / number * 1e6:8.2f} us | "
+        f"describe_inventory {inventory / number * 1e6:8.2f} us | "
+        f"view_state {view / number * 1e6:8.2f} us"
+    )
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark id-indexed entity lookups")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--objects", type=int, default=10, help="objects per location")
+    parser.add_argument("--number", type=int, default=2000, help="calls per measurement")
+    args = parser.parse_args(argv)
+
+    for size in args.sizes:
+        bench_size(size, args.objects, args.number)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,66 @@
+"""Report per-session memory for the sample game and a synthetic world.
+
+Each "session" is a GameEngine built on shared metadata, which is what the
+web server keeps per player. Memory is measured with tracemalloc as the
+average growth per session across a batch of sessions.
+
+Usage:
+    python3 scripts/bench_memory.py
+    python3 scripts/bench_memory.py --sessions 200 --objects 10000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine import GameEngine, GameMetadata, build_initial_state, load_game
+from generate_world import generate_world
+
+
+def bytes_per_session(factory: Callable[[], object], sessions: int) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    keep = [factory() for _ in range(sessions)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del keep
+    return (after - before) / sessions
+
+
+def report(label: str, metadata: GameMetadata, sessions: int) -> None:
+    state_bytes = bytes_per_session(lambda: build_initial_state(metadata), sessions)
+    engine_bytes = bytes_per_session(
+        lambda: GameEngine(metadata, render_ascii_art=False), sessions
+    )
+    print(
+        f"{label:<28} {len(metadata.objects):>7} objects | "
+        f"GameState {state_bytes:>12,.0f} B/session | "
+        f"GameEngine {engine_bytes:>12,.0f} B/session"
+    )
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Measure bytes per game session")
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--objects", type=int, default=10000, help="synthetic world object count")
+    args = parser.parse_args(argv)
+
+    sample = json.loads((ROOT / "games" / "pirate_sample.json").read_text(encoding="utf-8"))
+    report("pirate_sample", load_game(sample), args.sessions)
+
+    per_location = 10
+    synthetic = generate_world(max(1, args.objects // per_location), per_location)
+    report("synthetic", load_game(synthetic), max(1, args.sessions // 10))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,106 @@
+"""Compare the NumPy and pure-Python image paths on the shipped artwork.
+
+For every image in ``images/`` this times, with each path, the full decode
+through ``PNGImage.rows``, ``PNGImage.downsample`` to the terminal grid,
+``png_to_ascii`` and a 320-pixel-wide ``PNGImage.resize``, and checks that
+both paths returned the same bytes. NumPy is switched with
+``engine.png.use_numpy``; without it installed only the pure-Python column
+is printed.
+
+Usage:
+    python3 scripts/bench_numpy.py
+    python3 scripts/bench_numpy.py images/PirateDeck.png --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine import png
+from engine.art import ART_COLUMNS, ART_ROWS, png_to_ascii
+from engine.png import PNGImage
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> Tuple[float, object]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def digest(chunks) -> str:
+    # Rows of bytes, or rows of pixel tuples from downsample.
+    hasher = hashlib.sha256()
+    for chunk in chunks:
+        hasher.update(repr(chunk).encode() if isinstance(chunk, list) else bytes(chunk))
+    return hasher.hexdigest()
+
+
+def measure(path: Path, repeat: int) -> Dict[str, Tuple[float, str]]:
+    image = PNGImage(path)
+    columns = min(ART_COLUMNS, image.width)
+    rows = min(ART_ROWS, image.height)
+    width = min(320, image.width)
+    height = max(1, round(image.height * width / image.width))
+    tasks = {
+        "decode": lambda: digest(image.rows()),
+        "downsample": lambda: digest(image.downsample(columns, rows)),
+        "ascii": lambda: digest([png_to_ascii(path).encode()]),
+        "resize": lambda: digest(image.resize(width, height)),
+    }
+    return {name: best_of(repeat, task) for name, task in tasks.items()}
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the NumPy image path against pure Python")
+    parser.add_argument("images", nargs="*", type=Path, help="defaults to images/*.png")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    paths = args.images or sorted((ROOT / "images").glob("*.png"))
+
+    have_numpy = png.use_numpy(True)
+    if not have_numpy:
+        print("NumPy is not installed; timing the pure-Python path only")
+    mismatches = 0
+    totals = {"numpy": 0.0, "python": 0.0}
+    for path in paths:
+        fast: Optional[Dict[str, Tuple[float, str]]] = measure(path, args.repeat) if have_numpy else None
+        png.use_numpy(False)
+        slow = measure(path, args.repeat)
+        png.use_numpy(have_numpy)
+        cells = []
+        for name, (seconds, result) in slow.items():
+            totals["python"] += seconds
+            if fast is None:
+                cells.append(f"{name} {seconds * 1000:7.1f} ms")
+                continue
+            fast_seconds, fast_result = fast[name]
+            totals["numpy"] += fast_seconds
+            same = fast_result == result
+            mismatches += not same
+            cells.append(
+                f"{name} {seconds * 1000:7.1f} -> {fast_seconds * 1000:6.1f} ms "
+                f"({seconds / fast_seconds:4.1f}x{'' if same else ', DIFFERENT OUTPUT'})"
+            )
+        print(f"{path.name:<20} | " + " | ".join(cells))
+    if have_numpy:
+        print(
+            f"all images: pure Python {totals['python']:.2f} s, NumPy {totals['numpy']:.2f} s "
+            f"({totals['python'] / totals['numpy']:.1f}x); {mismatches} outputs differ"
+        )
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
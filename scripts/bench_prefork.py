@@ -0,0 +1,126 @@
+"""Measure per-worker memory when forked workers share one loaded world.
+
+The parent loads a synthetic world (and its shared baseline state) the way
+``webapp.py --workers`` does, then forks workers. Each worker plays a few
+copy-on-write sessions, runs a full garbage collection, optionally reads
+every object's metadata, and reports its ``/proc/self/smaps_rollup``:
+``Private_Dirty`` is what the worker no longer shares with the parent and
+``Pss`` its proportional share of everything. Runs with and without
+``gc.freeze()`` before the fork.
+
+Linux only.
+
+Usage:
+    python3 scripts/bench_prefork.py
+    python3 scripts/bench_prefork.py --locations 10000 --objects 10 --workers 8
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from generate_world import write_world
+
+
+def smaps_kb() -> Dict[str, int]:
+    fields = {}
+    with open("/proc/self/smaps_rollup", encoding="ascii") as handle:
+        for line in handle:
+            name, _, value = line.partition(":")
+            if value.strip().endswith("kB"):
+                fields[name] = int(value.split()[0])
+    return fields
+
+
+def worker(game, sessions: int, commands: int, scan: bool) -> Dict[str, int]:
+    from engine import GameEngine
+
+    engines = [GameEngine(game, render_ascii_art=False, copy_on_write=True) for _ in range(sessions)]
+    for engine in engines:
+        for turn in range(commands):
+            engine.handle_command("go onward" if turn % 3 else "take object")
+            engine.handle_command("look")
+    gc.collect()
+    if scan:
+        # Reading an object still writes its reference count.
+        for obj in game.objects.values():
+            obj.name
+    return smaps_kb()
+
+
+def run(game, workers: int, freeze: bool, scan: bool, sessions: int, commands: int) -> Dict[str, float]:
+    gc.collect()
+    if freeze:
+        gc.freeze()
+    parent = smaps_kb()
+    reports: List[Dict[str, int]] = []
+    for _ in range(workers):
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read)
+            with os.fdopen(write, "w") as out:
+                json.dump(worker(game, sessions, commands, scan), out)
+            os._exit(0)
+        os.close(write)
+        with os.fdopen(read) as handle:
+            reports.append(json.load(handle))
+        os.waitpid(pid, 0)
+    if freeze:
+        gc.unfreeze()
+    return {
+        "parent_rss_mb": parent["Rss"] / 1024,
+        "worker_private_mb": statistics.median(r["Private_Dirty"] for r in reports) / 1024,
+        "worker_rss_mb": statistics.median(r["Rss"] for r in reports) / 1024,
+        "total_unique_mb": (parent["Rss"] + sum(r["Private_Dirty"] for r in reports)) / 1024,
+    }
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark shared memory across forked workers")
+    parser.add_argument("--locations", type=int, default=10000)
+    parser.add_argument("--objects", type=int, default=10, help="objects per location")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--sessions", type=int, default=4, help="sessions per worker")
+    parser.add_argument("--commands", type=int, default=30, help="commands per session")
+    args = parser.parse_args(argv)
+    if not hasattr(os, "fork") or not Path("/proc/self/smaps_rollup").exists():
+        parser.error("needs os.fork and /proc/self/smaps_rollup (Linux)")
+
+    from engine.catalog import GameCatalog
+
+    with tempfile.TemporaryDirectory() as directory:
+        with open(Path(directory) / "world.json", "w", encoding="utf-8") as handle:
+            write_world(handle, args.locations, args.objects, actors_per_location=1, fanout=2)
+        catalog = GameCatalog(Path(directory), use_bundle=False)
+        (entry,) = catalog.preload()
+    game = entry.metadata
+    print(f"{args.locations} locations, {len(game.objects)} objects, {args.workers} workers "
+          f"x {args.sessions} sessions")
+    # Workers still keep one copy of each memory page whose reference counts
+    # they touch; the scan column is the worst case of touching all of them.
+    for scan in (False, True):
+        for freeze in (False, True):
+            result = run(game, args.workers, freeze, scan, args.sessions, args.commands)
+            label = f"{'gc.freeze' if freeze else 'no freeze'}{' + full scan' if scan else ''}"
+            print(
+                f"{label:<24} | parent RSS {result['parent_rss_mb']:7.1f} MB "
+                f"| per worker: private {result['worker_private_mb']:7.1f} MB, RSS {result['worker_rss_mb']:7.1f} MB "
+                f"| all {args.workers + 1} processes {result['total_unique_mb']:7.1f} MB"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,99 @@
+"""Measure hot-reload latency for a large world.
+
+A synthetic world is written to a temporary games directory and tracked
+by a ``GameCatalog``; the file is then rewritten with a few locations
+edited and ``GameCatalog.reload`` is timed against a full rebuild of the
+same file. Live copy-on-write sessions with some progress are migrated
+onto each reloaded version, and the per-session migration cost is
+reported alongside.
+
+Usage:
+    python3 scripts/bench_reload.py
+    python3 scripts/bench_reload.py --locations 10000 --objects 10 --edits 1 10 100
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine import GameEngine
+from engine.catalog import GameCatalog
+from engine.reload import reload_game
+from generate_world import generate_world
+
+
+def edit(world: Dict[str, Any], count: int, revision: int) -> None:
+    """Change the description of ``count`` locations spread across the world."""
+    locations = world["locations"]
+    for location in locations[:: max(1, len(locations) // count)][:count]:
+        location["description"] = f"Revision {revision} of {location['id']}."
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark incremental game reload")
+    parser.add_argument("--locations", type=int, default=10000)
+    parser.add_argument("--objects", type=int, default=10, help="objects per location")
+    parser.add_argument("--edits", type=int, nargs="+", default=[1, 10, 100, 1000], help="locations edited per reload")
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    world = generate_world(args.locations, args.objects, actors_per_location=1, fanout=2)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "world.json"
+        path.write_text(json.dumps(world), encoding="utf-8")
+        print(f"{args.locations} locations, {args.locations * args.objects} objects, {path.stat().st_size / 1e6:.1f} MB JSON")
+
+        catalog = GameCatalog(Path(directory), use_bundle=False)
+        started = time.perf_counter()
+        entry = catalog.entry("world")
+        load_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        catalog.track("world")
+        track_ms = (time.perf_counter() - started) * 1000
+        print(f"initial load {load_ms:8.1f} ms | fingerprinting for reload {track_ms:8.1f} ms")
+
+        sessions = [GameEngine(entry.metadata, render_ascii_art=False, copy_on_write=True) for _ in range(args.sessions)]
+        for engine in sessions:
+            engine.handle_command("go onward")
+            engine.handle_command("take item")
+
+        revision = 0
+        for count in args.edits:
+            incremental: List[float] = []
+            migrate: List[float] = []
+            for _ in range(args.repeat):
+                revision += 1
+                edit(world, count, revision)
+                path.write_text(json.dumps(world), encoding="utf-8")
+                started = time.perf_counter()
+                result = catalog.reload("world")
+                incremental.append(time.perf_counter() - started)
+                assert result is not None and len(result[1].rebuilt) == count
+                started = time.perf_counter()
+                for engine in sessions:
+                    engine.reload_metadata(result[0].metadata)
+                migrate.append((time.perf_counter() - started) / len(sessions))
+            data = path.read_bytes()
+            started = time.perf_counter()
+            reload_game(None, {}, data)
+            full = time.perf_counter() - started
+            print(
+                f"{count:6d} edited | incremental {statistics.median(incremental) * 1000:8.1f} ms "
+                f"| full rebuild {full * 1000:8.1f} ms | migrate {statistics.median(migrate) * 1e6:7.1f} us/session"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,99 @@
+"""Measure memory and hit rates of the process-wide render cache.
+
+Many sessions of the sample game, each drawing the art of both locations,
+are created once with a private ``RenderCache`` per engine (what every
+engine used to keep) and once sharing ``engine.RENDER_CACHE``; the art
+they retain is compared with ``tracemalloc``. Then threads render the
+images concurrently through one shared cache under several byte budgets,
+reporting its hits, misses and evictions for sizing. Every engine sits on
+one on-disk ``ArtCache`` in a temporary directory, so a miss re-reads
+rendered text instead of decoding the PNG again.
+
+Usage:
+    python3 scripts/bench_render_cache.py
+    python3 scripts/bench_render_cache.py --sessions 500 --threads 16
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine import GameEngine
+from engine.artcache import RENDER_CACHE, ArtCache, RenderCache
+from engine.catalog import GameCatalog
+
+IMAGES = sorted(str(path.relative_to(ROOT)) for path in (ROOT / "images").glob("*.png"))
+
+
+def retained_bytes(metadata, art: ArtCache, sessions: int, shared: bool) -> int:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    engines = []
+    for _ in range(sessions):
+        engine = GameEngine(metadata, art_cache=art, render_cache=None if shared else RenderCache())
+        for location in metadata.locations.values():
+            engine._render_location_image(location)
+        engines.append(engine)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return after - before
+
+
+def hammer(cache: RenderCache, art: ArtCache, metadata, threads: int, rounds: int) -> float:
+    def work(offset: int) -> None:
+        engine = GameEngine(metadata, art_cache=art, render_cache=cache)
+        for turn in range(rounds):
+            engine._render_image_asset(IMAGES[(offset + turn) % len(IMAGES)])
+
+    workers = [threading.Thread(target=work, args=(index,)) for index in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - started
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the shared in-memory render cache")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=60, help="renders per thread")
+    args = parser.parse_args(argv)
+
+    metadata = GameCatalog(ROOT / "games").get("pirate_sample")
+    with tempfile.TemporaryDirectory() as directory:
+        art = ArtCache(Path(directory))
+        # Render once up front so decoding time and PNG buffers stay out of the numbers.
+        for image in IMAGES:
+            GameEngine(metadata, art_cache=art, render_cache=RenderCache())._render_image_asset(image)
+        for shared in (False, True):
+            size = retained_bytes(metadata, art, args.sessions, shared)
+            label = "shared RENDER_CACHE" if shared else "cache per engine"
+            print(f"{label:<20} {args.sessions} sessions retain {size / 1024:9.1f} KiB ({size / args.sessions:8.0f} B each)")
+        print(f"RENDER_CACHE: {RENDER_CACHE.stats()}")
+
+        for budget_kib in (4, 8, 16, 64):
+            cache = RenderCache(budget_kib * 1024)
+            seconds = hammer(cache, art, metadata, args.threads, args.rounds)
+            stats = cache.stats()
+            print(
+                f"budget {budget_kib:3d} KiB | {args.threads} threads x {args.rounds} renders in {seconds * 1000:7.1f} ms "
+                f"| hits {stats['hits']}, misses {stats['misses']}, hit rate {stats['hit_rate']}, "
+                f"evictions {stats['evictions']} | {stats['entries']} entries, {stats['bytes']} bytes"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,101 @@
+"""Measure how loading and command handling scale with world size.
+
+For each size a synthetic world is generated and written to a temporary
+file, then the benchmark times ``json.load`` + ``load_game``,
+``build_initial_state``, ``GameEngine`` construction and a fixed command
+mix whose per-verb latency percentiles come from ``engine.transcript``.
+
+Usage:
+    python3 scripts/bench_scaling.py
+    python3 scripts/bench_scaling.py --sizes 1000 10000 100000 --objects 10 --json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine import GameEngine, build_initial_state, load_game
+from engine.transcript import ReplayResult, Transcript, TranscriptEntry, replay
+from generate_world import write_world
+
+
+def command_mix(locations: int) -> Transcript:
+    commands = ["look", "help", "inventory"]
+    for loc_index in range(min(locations, 20)):
+        commands += [
+            f"inspect object {loc_index}-0",
+            f"take object {loc_index}-0",
+            f"open object {loc_index}-1",
+            f"talk actor {loc_index}-0",
+            "go onward",
+        ]
+    return Transcript("mix", [TranscriptEntry(command, "", True, 0.0) for command in commands])
+
+
+def bench_size(locations: int, objects: int, actors: int, fanout: int) -> Dict[str, object]:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "world.json"
+        with path.open("w", encoding="utf-8") as handle:
+            write_world(handle, locations, objects, actors_per_location=actors, fanout=fanout)
+
+        started = time.perf_counter()
+        with path.open("r", encoding="utf-8") as handle:
+            metadata = load_game(json.load(handle))
+        load_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    build_initial_state(metadata)
+    state_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    game = GameEngine(metadata, render_ascii_art=False)
+    engine_seconds = time.perf_counter() - started
+
+    result = replay(game, command_mix(locations), ReplayResult(), check_output=False)
+    return {
+        "locations": locations,
+        "objects": locations * objects,
+        "load_game_s": load_seconds,
+        "build_initial_state_s": state_seconds,
+        "engine_init_s": engine_seconds,
+        **result.summary(),
+    }
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark engine scaling on synthetic worlds")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--objects", type=int, default=10, help="objects per location")
+    parser.add_argument("--actors", type=int, default=1, help="actors per location")
+    parser.add_argument("--fanout", type=int, default=2, help="pathways per location")
+    parser.add_argument("--json", action="store_true", help="print the full JSON report")
+    args = parser.parse_args(argv)
+
+    reports = [bench_size(size, args.objects, args.actors, args.fanout) for size in args.sizes]
+    if args.json:
+        print(json.dumps(reports, indent=2))
+        return 0
+    for report in reports:
+        verbs = report["verbs"]
+        latencies = " ".join(
+            f"{verb}={stats['p95_ms']:.3f}ms" for verb, stats in verbs.items()  # type: ignore[union-attr]
+        )
+        print(
+            f"{report['objects']:>9} objects | load {report['load_game_s']:7.3f}s | "
+            f"state {report['build_initial_state_s']:7.3f}s | engine {report['engine_init_s']:7.3f}s | "
+            f"p95 {latencies}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
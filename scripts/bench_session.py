@@ -0,0 +1,67 @@
+"""Compare full and copy-on-write session creation as the world grows.
+
+A full build copies every entity's initial state into the new session; the
+copy-on-write mode layers empty overlays over a baseline shared by all
+sessions of the same metadata, so creation and reset cost should stay flat.
+
+Usage:
+    python3 scripts/bench_session.py
+    python3 scripts/bench_session.py --sizes 10 1000 10000 --number 50
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine import GameEngine, load_game
+from generate_world import generate_world
+
+
+def session_bytes(metadata, copy_on_write: bool) -> int:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    game = GameEngine(metadata, render_ascii_art=False, copy_on_write=copy_on_write)
+    game.handle_command("take object 0-0")
+    game.handle_command("go onward")
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return after - before
+
+
+def bench_size(locations: int, number: int) -> None:
+    metadata = load_game(generate_world(locations, 10))
+    GameEngine(metadata, render_ascii_art=False, copy_on_write=True)  # build the shared baseline
+    full = timeit.timeit(
+        lambda: GameEngine(metadata, render_ascii_art=False), number=number
+    ) / number
+    cow = timeit.timeit(
+        lambda: GameEngine(metadata, render_ascii_art=False, copy_on_write=True), number=number
+    ) / number
+    print(
+        f"{locations * 10:>8} objects | "
+        f"full {full * 1e3:9.3f} ms {session_bytes(metadata, False):>11,} B | "
+        f"copy-on-write {cow * 1e3:9.3f} ms {session_bytes(metadata, True):>9,} B"
+    )
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark session creation and reset")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--number", type=int, default=20, help="sessions per measurement")
+    args = parser.parse_args(argv)
+
+    for size in args.sizes:
+        bench_size(size, args.number)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,91 @@
+"""Track cold-start import cost of main.py and webapp.py.
+
+Each sample runs ``python -X importtime -c "import <module>"`` in a fresh
+interpreter and parses the report on stderr: the module's cumulative
+import time is what a CLI run or a restarted web worker pays before doing
+any work. Wall-clock process time is reported next to a bare interpreter
+start for reference, along with the slowest imports by self time.
+
+Usage:
+    python3 scripts/bench_startup.py
+    python3 scripts/bench_startup.py --repeat 10 --top 15 --json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+MODULES = ("main", "webapp")
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def import_report(code: str) -> Tuple[float, List[Tuple[str, int, int]]]:
+    """Run ``code`` with -X importtime; return wall seconds and (module, self_us, cumulative_us)."""
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - started
+    rows = []
+    for line in completed.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            rows.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return wall, rows
+
+
+def measure(module: str, repeat: int, top: int) -> Dict[str, object]:
+    cumulative: List[int] = []
+    walls: List[float] = []
+    rows: List[Tuple[str, int, int]] = []
+    for _ in range(repeat):
+        wall, rows = import_report(f"import {module}")
+        walls.append(wall)
+        cumulative.append(next(total for name, _, total in rows if name == module))
+    slowest = sorted(rows, key=lambda row: row[1], reverse=True)[:top]
+    return {
+        "module": module,
+        "import_ms": statistics.median(cumulative) / 1000,
+        "wall_ms": statistics.median(walls) * 1000,
+        "modules_imported": len(rows),
+        "slowest_self_ms": {name: self_us / 1000 for name, self_us, _ in slowest},
+    }
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark cold-start import time")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8, help="slowest imports to list")
+    parser.add_argument("--json", action="store_true", help="print the full JSON report")
+    args = parser.parse_args(argv)
+
+    baseline = statistics.median(import_report("pass")[0] for _ in range(args.repeat)) * 1000
+    reports = [measure(module, args.repeat, args.top) for module in MODULES]
+    if args.json:
+        print(json.dumps({"interpreter_wall_ms": baseline, "modules": reports}, indent=2))
+        return 0
+    print(f"bare interpreter  wall {baseline:7.1f} ms")
+    for report in reports:
+        print(
+            f"import {report['module']:<10} {report['import_ms']:7.1f} ms "
+            f"| wall {report['wall_ms']:7.1f} ms | {report['modules_imported']} modules"
+        )
+        for name, self_ms in report["slowest_self_ms"].items():  # type: ignore[union-attr]
+            print(f"    {self_ms:6.2f} ms  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,101 @@
+"""Measure what interning ids and names through a shared Vocabulary buys.
+
+Memory: a synthetic world is parsed from JSON and loaded with and without
+interning; the parsed document is then dropped and the memory still held
+by the metadata is reported (tracemalloc). Per-session memory is measured
+the same way as ``bench_memory.py``.
+
+Lookups: ``dict`` probes by id with a key that is an equal but distinct
+``str`` (what arrives from a fresh parse), with the interned instance
+itself, and with the vocabulary's small-int code.
+
+Usage:
+    python3 scripts/bench_vocabulary.py
+    python3 scripts/bench_vocabulary.py --locations 10000 --objects 10
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine import GameEngine, GameMetadata, load_game
+from engine.vocabulary import Vocabulary
+from generate_world import generate_world
+
+
+def retained_load(text: str, vocabulary: Optional[Vocabulary]) -> Tuple[GameMetadata, int]:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    data = json.loads(text)
+    game = load_game(data, vocabulary)
+    del data
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return game, after - before
+
+
+def session_bytes(game: GameMetadata, sessions: int) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    keep = [GameEngine(game, render_ascii_art=False) for _ in range(sessions)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del keep
+    return (after - before) / sessions
+
+
+def per_probe_ns(probe, keys: List[object], number: int) -> float:
+    def run() -> None:
+        for key in keys:
+            probe(key)
+
+    return min(timeit.repeat(run, number=number, repeat=5)) / (number * len(keys)) * 1e9
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark vocabulary interning")
+    parser.add_argument("--locations", type=int, default=10000)
+    parser.add_argument("--objects", type=int, default=10, help="objects per location")
+    parser.add_argument("--sessions", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    text = json.dumps(generate_world(args.locations, args.objects, actors_per_location=1, fanout=2))
+    print(f"{args.locations} locations, {args.locations * args.objects} objects, {len(text) / 1e6:.1f} MB JSON")
+
+    plain, plain_bytes = retained_load(text, None)
+    vocabulary = Vocabulary()
+    interned, interned_bytes = retained_load(text, vocabulary)
+    # A reload (or a second game sharing ids) reuses the table already built.
+    _, reload_bytes = retained_load(text, vocabulary)
+    table_bytes = vocabulary.table_bytes()
+    print(f"metadata retained | plain {plain_bytes / 1e6:8.1f} MB | interned {interned_bytes / 1e6:8.1f} MB "
+          f"(table {table_bytes / 1e6:.1f} MB, {len(vocabulary)} entries) | reload {reload_bytes / 1e6:8.1f} MB")
+    print(f"per session       | plain {session_bytes(plain, args.sessions) / 1e3:8.1f} KB "
+          f"| interned {session_bytes(interned, args.sessions) / 1e3:8.1f} KB")
+
+    ids = list(interned.objects)[:: max(1, len(interned.objects) // 1000)]
+    # Equal but distinct strings, as produced by parsing a command or a file.
+    fresh = json.loads(json.dumps(ids))
+    codes = {vocabulary.code(obj_id): obj for obj_id, obj in interned.objects.items()}
+    number = 200
+    probe = interned.objects.__getitem__
+    print(f"dict probe        | fresh str {per_probe_ns(probe, fresh, number):6.1f} ns "
+          f"| interned str {per_probe_ns(probe, ids, number):6.1f} ns "
+          f"| int code {per_probe_ns(codes.__getitem__, [vocabulary.code(i) for i in ids], number):6.1f} ns")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,51 @@
+"""Compile game JSON files into precompiled ``.gamebundle`` files.
+
+Bundles are written next to their source and are picked up automatically
+by ``engine.bundle.load_game_file``; stale bundles are also rebuilt on
+load, so running this is only needed to avoid paying that cost at startup
+(e.g. before deploying the web app).
+
+Usage:
+    python3 scripts/compile_games.py              # every games/*.json
+    python3 scripts/compile_games.py path/to/world.json --force
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine.bundle import bundle_path_for, compile_bundle, describe_bundle, load_bundle
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Compile game JSON into .gamebundle files")
+    parser.add_argument("sources", nargs="*", type=Path, help="game files (default: games/*.json)")
+    parser.add_argument("--force", action="store_true", help="recompile even if the bundle is current")
+    args = parser.parse_args(argv)
+
+    sources = args.sources or sorted((ROOT / "games").glob("*.json"))
+    for source in sources:
+        bundle = bundle_path_for(source)
+        if not args.force and load_bundle(bundle, source) is not None:
+            print(f"{source.name}: up to date")
+            continue
+        started = time.perf_counter()
+        compile_bundle(source, bundle)
+        elapsed = time.perf_counter() - started
+        info = describe_bundle(bundle)
+        print(
+            f"{source.name}: {info['source_size']} -> {info['bytes']} bytes "
+            f"in {elapsed * 1000:.1f} ms ({bundle.name})"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
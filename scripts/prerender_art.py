@@ -0,0 +1,108 @@
+"""Render every image a game can draw into the on-disk art cache.
+
+Collects each location's image and the ``map`` verb's chart from every
+game, in the ASCII style and in both color styles at each ``--widths``
+terminal width, renders the variants the cache does not hold yet in a process pool
+(decoding is CPU-bound pure Python, so processes rather than threads) and
+stores the results in the ``engine.ArtCache`` that ``main.py`` reads.
+Entries are keyed by image content, so a deploy can run this once and
+no player command ever decodes a PNG. ``--web`` also builds the scaled
+copies the web app serves for ``/assets/<image>?w=<width>``. Image paths
+are resolved against the repository root, as ``main.py`` is run from there.
+
+Usage:
+    python3 scripts/prerender_art.py              # every games/*.json
+    python3 scripts/prerender_art.py games/pirate_sample.json --workers 4 --force
+    python3 scripts/prerender_art.py --cache /srv/adventure/art --widths 80 100 120
+    python3 scripts/prerender_art.py --web
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine.art import art_params, referenced_images, render_art
+from engine.artcache import ArtCache
+from engine.bundle import load_game_file
+from engine.derivatives import DERIVATIVE_WIDTHS, DerivativeCache
+
+
+def timed_render(job: Tuple[Path, str, int]) -> Tuple[str, float]:
+    started = time.perf_counter()
+    return render_art(*job), time.perf_counter() - started
+
+
+def timed_derivative(job: Tuple[Path, int]) -> float:
+    started = time.perf_counter()
+    DerivativeCache().path(*job)
+    return time.perf_counter() - started
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Pre-render location art into the art cache")
+    parser.add_argument("sources", nargs="*", type=Path, help="game files (default: games/*.json)")
+    parser.add_argument("--cache", type=Path, help="art cache directory (default: ~/.cache/text-adventure/art)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--widths", type=int, nargs="+", default=[80, 120], help="terminal widths for the color styles"
+    )
+    parser.add_argument("--force", action="store_true", help="render again even if the cache has an entry")
+    parser.add_argument("--web", action="store_true", help="also build the web app's scaled image copies")
+    args = parser.parse_args(argv)
+
+    cache = ArtCache(args.cache)
+    sources = args.sources or sorted((ROOT / "games").glob("*.json"))
+    variants = [("ascii", 0)] + [(style, width) for style in ("256", "truecolor") for width in args.widths]
+    pending: Dict[str, Tuple[Path, str, int]] = {}
+    images: Dict[Path, None] = {}
+    for source in sources:
+        for label in referenced_images(load_game_file(source)):
+            path = ROOT / label
+            if path.suffix.lower() != ".png":
+                continue
+            if not path.exists():
+                print(f"{source.name}: missing {label}")
+                continue
+            images[path] = None
+            for style, width in variants:
+                key = cache.key(path, art_params(style, width))
+                # The same image under two names or in two games renders once.
+                if args.force or not cache.contains(key):
+                    pending.setdefault(key, (path, style, width))
+    workers = max(1, args.workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        if pending:
+            started = time.perf_counter()
+            total = 0.0
+            for (key, (path, style, width)), (text, seconds) in zip(
+                pending.items(), pool.map(timed_render, pending.values())
+            ):
+                cache.put(key, text)
+                total += seconds
+                variant = style if style == "ascii" else f"{style} x{width}"
+                print(f"{path.relative_to(ROOT)} ({variant}): {seconds * 1000:.1f} ms")
+            elapsed = time.perf_counter() - started
+            print(
+                f"rendered {len(pending)} variants into {cache.directory} in {elapsed * 1000:.1f} ms "
+                f"({total * 1000:.1f} ms of rendering across {workers} workers)"
+            )
+        else:
+            print(f"{cache.directory}: up to date")
+        if args.web:
+            jobs = [(path, width) for path in images for width in DERIVATIVE_WIDTHS]
+            for (path, width), seconds in zip(jobs, pool.map(timed_derivative, jobs)):
+                print(f"{path.relative_to(ROOT)} (web, {width}w): {seconds * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,88 @@
+"""Replay a recorded transcript and report per-verb latency percentiles.
+
+Each iteration replays the transcript against a fresh engine built through
+``main.build_game(with_llm=False)``. The report is JSON so runs from
+different commits can be stored and compared; pass ``--baseline`` with an
+earlier report to flag verbs whose p95 latency regressed.
+
+Record a transcript with ``python3 main.py --record FILE`` (optionally
+combined with ``--script``).
+
+Usage:
+    python3 scripts/replay_transcript.py scripts/transcripts/pirate_walkthrough.json
+    python3 scripts/replay_transcript.py TRANSCRIPT --iterations 200 --output run.json
+    python3 scripts/replay_transcript.py TRANSCRIPT --baseline previous.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine.transcript import ReplayResult, Transcript, replay
+from main import build_game
+
+
+def regressions(summary: Dict[str, object], baseline: Dict[str, object], tolerance: float) -> List[str]:
+    found: List[str] = []
+    current_verbs = summary["verbs"]
+    for verb, stats in baseline.get("verbs", {}).items():
+        current = current_verbs.get(verb)  # type: ignore[union-attr]
+        if not current or not stats["p95_ms"]:
+            continue
+        ratio = current["p95_ms"] / stats["p95_ms"]
+        if ratio > 1 + tolerance:
+            found.append(f"{verb}: p95 {stats['p95_ms']:.3f} ms -> {current['p95_ms']:.3f} ms ({ratio:.2f}x)")
+    return found
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Replay a transcript and report latency percentiles")
+    parser.add_argument("transcript", type=Path)
+    parser.add_argument("--iterations", type=int, default=50, help="fresh-engine replays to run")
+    parser.add_argument("--render-art", action="store_true", help="render location art while replaying")
+    parser.add_argument("--output", type=Path, help="write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="earlier JSON report to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed fractional p95 slowdown before a verb counts as regressed",
+    )
+    args = parser.parse_args(argv)
+
+    transcript = Transcript.load(args.transcript)
+    result = ReplayResult()
+    for _ in range(args.iterations):
+        game = build_game(render_ascii_art=args.render_art, with_llm=False)
+        replay(game, transcript, result)
+
+    summary = {
+        "transcript": str(args.transcript),
+        "iterations": args.iterations,
+        **result.summary(),
+    }
+    report = json.dumps(summary, indent=2)
+    if args.output:
+        args.output.write_text(report + "\n", encoding="utf-8")
+    else:
+        print(report)
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        slower = regressions(summary, baseline, args.tolerance)
+        for line in slower:
+            print("regression:", line, file=sys.stderr)
+        if slower:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,41 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from engine.bundle import bundle_path_for, describe_bundle, load_bundle, load_game_file
+
+GAME = Path(__file__).resolve().parent.parent / "games" / "pirate_sample.json"
+
+
+class BundleFreshnessTests(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.source = Path(directory.name) / GAME.name
+        shutil.copyfile(GAME, self.source)
+        self.bundle = bundle_path_for(self.source)
+        load_game_file(self.source)
+
+    def test_touched_source_refreshes_the_header(self) -> None:
+        stat = self.source.stat()
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+        self.assertIsNotNone(load_bundle(self.bundle, self.source))
+        header = describe_bundle(self.bundle)
+        self.assertEqual(header["source_mtime_ns"], self.source.stat().st_mtime_ns)
+        self.assertEqual(header["source_size"], self.source.stat().st_size)
+
+    def test_bundle_is_as_readable_as_its_source(self) -> None:
+        self.source.chmod(0o644)
+        self.bundle.unlink()
+        load_game_file(self.source)
+        self.assertEqual(self.bundle.stat().st_mode & 0o777, 0o644)
+
+    def test_edited_source_is_stale(self) -> None:
+        self.source.write_text(self.source.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+        self.assertIsNone(load_bundle(self.bundle, self.source))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from engine.catalog import GameCatalog, cached_games
+
+GAME = Path(__file__).resolve().parent.parent / "games" / "pirate_sample.json"
+
+
+class CatalogEvictionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / GAME.name
+        shutil.copyfile(GAME, self.path)
+        self.catalog = GameCatalog(Path(directory.name), use_bundle=False)
+
+    def versions(self):
+        return [entry for entry in cached_games() if entry.path == self.path]
+
+    def edit_title(self, title: str) -> None:
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        data["title"] = title
+        self.path.write_text(json.dumps(data), encoding="utf-8")
+
+    def test_reloading_an_untracked_game_evicts_its_old_version(self) -> None:
+        self.catalog.get(self.path.stem)
+        self.edit_title("Edited")
+        entry, _ = self.catalog.reload(self.path.stem)
+        self.assertEqual(self.versions(), [entry])
+        self.assertEqual(entry.metadata.title, "Edited")
+
+    def test_loading_an_edited_game_evicts_its_old_version(self) -> None:
+        self.catalog.get(self.path.stem)
+        self.edit_title("Edited again")
+        self.assertEqual(self.catalog.get(self.path.stem).title, "Edited again")
+        self.assertEqual(len(self.versions()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
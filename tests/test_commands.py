@@ -0,0 +1,24 @@
+import unittest
+
+from engine.engine import VERBS
+from main import build_game
+
+
+class TargetFillerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = build_game(render_ascii_art=False, with_llm=False, bundle=False)
+
+    def test_fillers_are_stripped_from_the_target(self) -> None:
+        verb, target = VERBS.resolve("talk to the briggs")
+        self.assertEqual(verb.name, "talk")
+        self.assertEqual(target, "briggs")
+
+    def test_bare_filler_leaves_no_target(self) -> None:
+        self.assertIsNone(VERBS.resolve("talk to")[1])
+        self.assertIsNone(VERBS.resolve("go to the")[1])
+        self.assertEqual(self.game.handle_command("talk to").output, "Talk to whom?")
+        self.assertEqual(self.game.handle_command("go to").output, "Go where?")
+
+
+if __name__ == "__main__":
+    unittest.main()
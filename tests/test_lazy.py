@@ -0,0 +1,44 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from engine.engine import GameEngine
+from engine.lazy import load_game_lazy
+from scripts.generate_world import write_world
+
+
+class RecordingLLM:
+    def __init__(self) -> None:
+        self.contexts = []
+
+    def generate_response(self, command, context, history) -> str:
+        self.contexts.append(context)
+        return "The wind answers."
+
+
+class LazyLLMFallbackTests(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "world.json"
+        with path.open("w", encoding="utf-8") as handle:
+            write_world(handle, 50, 2)
+        self.metadata = load_game_lazy(path)
+        self.llm = RecordingLLM()
+        self.game = GameEngine(self.metadata, render_ascii_art=False, llm_client=self.llm, copy_on_write=True)
+
+    def test_llm_fallback_keeps_locations_lazy(self) -> None:
+        self.game.handle_command("look")
+        response = self.game.handle_command("sing a shanty")
+        self.assertTrue(response.handled)
+        loaded = set(self.metadata.locations.loaded)
+        self.assertLess(len(loaded), len(self.metadata.locations))
+        current = self.game.current_location
+        expected = {current.id} | {path.target for path in current.pathways}
+        self.assertTrue(expected <= loaded)
+        sent = {location.id for location in self.llm.contexts[-1].locations}
+        self.assertEqual(sent, loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+
+from engine.models import ObjectState
+
+
+class ObjectStateCompatibilityTests(unittest.TestCase):
+    def test_keyword_constructor_keeps_status_order(self) -> None:
+        state = ObjectState(status={"lit": "true", "color": "red", "open": "false"}, held_by_player=True)
+        self.assertTrue(state.held_by_player)
+        self.assertEqual(list(state.status), ["lit", "color", "open"])
+        self.assertEqual(dict(state.status), {"lit": "true", "color": "red", "open": "false"})
+
+    def test_status_assignment_replaces_values_in_order(self) -> None:
+        state = ObjectState(status={"open": "false"})
+        state.status = {"color": "blue", "open": "true"}
+        self.assertEqual(list(state.status.items()), [("color", "blue"), ("open", "true")])
+        self.assertEqual(list(state.copy().status), ["color", "open"])
+
+    def test_readding_a_key_moves_it_to_the_end(self) -> None:
+        state = ObjectState(status={"open": "false", "lit": "true"})
+        state.status["open"] = "true"
+        self.assertEqual(list(state.status), ["open", "lit"])
+        del state.status["open"]
+        state.status["open"] = "false"
+        self.assertEqual(list(state.status), ["lit", "open"])
+
+
+if __name__ == "__main__":
+    unittest.main()
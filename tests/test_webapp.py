@@ -0,0 +1,21 @@
+import os
+import tempfile
+import unittest
+
+import webapp
+
+
+class AssetRootTests(unittest.TestCase):
+    def test_srcset_does_not_depend_on_the_working_directory(self) -> None:
+        previous = os.getcwd()
+        self.addCleanup(os.chdir, previous)
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            location = webapp.load_engine().view_state()["location"]
+            os.chdir(previous)
+        self.assertTrue(location["srcset"])
+        self.assertIn(f"/assets/{location['image']} ", location["srcset"])
+
+
+if __name__ == "__main__":
+    unittest.main()
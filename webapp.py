@@ -1,23 +1,237 @@
 from __future__ import annotations
 
+import html
 import json
-import mimetypes
+import time
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List
-from wsgiref.simple_server import make_server
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs
 
-from engine import GameEngine, LLMClient, load_game
-
-ROOT = Path(__file__).resolve().parent
-GAME_PATH = ROOT / "games" / "pirate_sample.json"
+from engine import GameEngine, GameMetadata
+from engine.catalog import GAME_SUFFIX, GameCatalog
+from engine.derivatives import DerivativeCache
+from engine.png import PNGError
 
+if TYPE_CHECKING:
+    from engine.reload import PollingWatcher, ReloadReport
 
-def load_engine() -> GameEngine:
-    metadata = json.loads(GAME_PATH.read_text(encoding="utf-8"))
-    llm_client = LLMClient()
+ROOT = Path(__file__).resolve().parent
+CATALOG = GameCatalog(ROOT / "games")
+# Scaled copies of images/ for /assets/...?w=<width>, built on first request.
+DERIVATIVES = DerivativeCache()
+DEFAULT_GAME = "pirate_sample"
+
+
+class WebSession:
+    """The engine and chat history for one title."""
+
+    def __init__(self, game_id: str) -> None:
+        self.game_id = game_id
+        self.history: List[Dict[str, str]] = []
+        self.engine = self.reset()
+
+    def reset(self) -> GameEngine:
+        self.engine = load_engine(self.game_id)
+        self.history.clear()
+        self.history.append({"speaker": "game", "text": self.engine.describe_current_location()})
+        return self.engine
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"engine": self.engine.export_session(), "history": self.history}
+
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        self.engine.restore_session(snapshot["engine"])
+        self.history[:] = snapshot["history"]
+
+
+class SharedSessions:
+    """Sessions kept in ``directory`` so that forked workers all play the same ones.
+
+    A request holds an exclusive ``flock`` on its title's file from start to
+    finish. It first adopts the stored snapshot if another worker wrote a
+    newer one (a version counter heads the file, so an unchanged session is
+    never unpickled), and after a command writes its own snapshot back.
+    Requests for one title are thereby serialized across workers. POSIX only.
+    """
+
+    _VERSION = 8  # bytes of big-endian version counter before the pickle
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        # Version of the stored snapshot each local session reflects.
+        self._seen: Dict[str, int] = {}
+
+    @contextmanager
+    def session(self, game_id: str, *, write: bool) -> Iterator[WebSession]:
+        import fcntl
+        import pickle
+
+        with open(self.directory / f"{game_id}.session", "a+b") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            handle.seek(0)
+            version = int.from_bytes(handle.read(self._VERSION) or b"\0", "big")
+            session = get_session(game_id)
+            if version and version != self._seen.get(game_id):
+                session.restore(pickle.loads(handle.read()))
+                self._seen[game_id] = version
+            yield session
+            if write:
+                version += 1
+                handle.seek(0)
+                handle.truncate()
+                handle.write(version.to_bytes(self._VERSION, "big"))
+                handle.write(pickle.dumps(session.snapshot(), pickle.HIGHEST_PROTOCOL))
+                handle.flush()
+                self._seen[game_id] = version
+
+
+# Built on the first request for each title rather than at import, so worker
+# start-up only pays for importing this module.
+_sessions: Dict[str, WebSession] = {}
+_pages: Dict[str, str] = {}
+# Hot reload (opt-in, see enable_reload): the watcher thread builds the new
+# metadata and queues it here; the request thread migrates sessions before
+# handling the next request, so a command never sees a half-swapped game.
+_pending_reloads: Deque[Tuple[str, GameMetadata, "ReloadReport"]] = deque()
+_reloads: Dict[str, Dict[str, object]] = {}
+# Set by serve_prefork; None while a single process owns every session.
+_shared: Optional[SharedSessions] = None
+
+
+def load_engine(game_id: str = DEFAULT_GAME) -> GameEngine:
+    from engine.llm import LLMClient
+
+    llm_client: Optional[LLMClient] = LLMClient()
     if not llm_client.available():
         llm_client = None
-    return GameEngine(load_game(metadata), render_ascii_art=False, llm_client=llm_client)
+    # The catalog shares one metadata per title across sessions, and
+    # copy-on-write sessions share its baseline state, so a reset only
+    # allocates deltas.
+    # Image paths resolve against ROOT, like serve_static, not the working directory.
+    return GameEngine(
+        CATALOG.get(game_id),
+        render_ascii_art=False,
+        llm_client=llm_client,
+        copy_on_write=True,
+        asset_root=ROOT,
+    )
+
+
+def get_session(game_id: str) -> WebSession:
+    """Return the session for ``game_id``; raises KeyError for unknown titles."""
+    session = _sessions.get(game_id)
+    if session is None:
+        CATALOG.path(game_id)
+        session = _sessions[game_id] = WebSession(game_id)
+    return session
+
+
+@contextmanager
+def session_for(game_id: str, *, write: bool = False) -> Iterator[WebSession]:
+    """The session for ``game_id``, kept in step with other workers when forked."""
+    if _shared is None:
+        yield get_session(game_id)
+    else:
+        with _shared.session(game_id, write=write) as session:
+            yield session
+
+
+def enable_reload(interval: float = 1.0) -> "PollingWatcher":
+    """Poll ``games/`` every ``interval`` seconds and hot-reload edited titles.
+
+    Every game is loaded and fingerprinted up front so an edit only rebuilds
+    the locations it touched. A file that fails to parse or validate is
+    reported and the running version is kept.
+    """
+    from engine.reload import PollingWatcher
+
+    for game_id in CATALOG.game_ids():
+        CATALOG.track(game_id)
+
+    def on_change(path: Path) -> None:
+        game_id = path.stem
+        try:
+            result = CATALOG.reload(game_id)
+        except (KeyError, OSError, ValueError) as exc:
+            print(f"Reload of {game_id} failed, keeping the running version:\n{exc}")
+            return
+        if result is not None:
+            entry, report = result
+            _pending_reloads.append((game_id, entry.metadata, report))
+
+    return PollingWatcher(lambda: CATALOG.directory.glob(f"*{GAME_SUFFIX}"), on_change, interval).start()
+
+
+def apply_reloads() -> None:
+    """Move live sessions onto reloaded games queued by the watcher."""
+    while _pending_reloads:
+        game_id, metadata, report = _pending_reloads.popleft()
+        started = time.perf_counter()
+        session = _sessions.get(game_id)
+        if session is not None:
+            session.engine.reload_metadata(metadata)
+        _pages.pop(game_id, None)
+        migrate_ms = (time.perf_counter() - started) * 1000
+        _reloads[game_id] = {**report.as_dict(), "migrate_ms": round(migrate_ms, 3)}
+        print(
+            f"Reloaded {game_id}: rebuilt {len(report.rebuilt)}, reused {report.reused}, "
+            f"removed {len(report.removed)} location(s) in {report.seconds * 1000:.1f} ms; "
+            f"session migrated in {migrate_ms:.1f} ms"
+        )
+
+
+def serve_prefork(server, workers: int) -> None:
+    """Serve from ``workers`` forked processes sharing ``server``'s socket.
+
+    Every game is loaded first and the heap is moved to the collector's
+    permanent generation (``gc.freeze()``), so the workers' collections
+    never write to, and therefore never copy, the inherited metadata pages.
+    Sessions live in a temporary directory of :class:`SharedSessions`, so
+    every worker answers for the same game state. POSIX only.
+    """
+    import gc
+    import os
+    import shutil
+    import signal
+    import tempfile
+
+    global _shared
+    _shared = SharedSessions(Path(tempfile.mkdtemp(prefix="text-adventure-sessions-")))
+    CATALOG.preload()
+    gc.collect()
+    gc.freeze()
+    children = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os._exit(0)
+        children.append(pid)
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    # SIGTERM stops the workers and removes the session files like Ctrl-C.
+    signal.signal(signal.SIGTERM, stop)
+    try:
+        for pid in children:
+            os.waitpid(pid, 0)
+    except KeyboardInterrupt:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except (ChildProcessError, ProcessLookupError):
+                pass
+        raise
+    finally:
+        shutil.rmtree(_shared.directory, ignore_errors=True)
 
 
 def html_response(start_response, body: str, status: str = "200 OK"):
@@ -62,10 +276,21 @@ def unsafe_path(path: Path) -> bool:
     return False
 
 
-def serve_static(start_response, relative: str):
+def serve_static(start_response, relative: str, width: Optional[int] = None):
+    import mimetypes
+
     asset = (ROOT / relative).resolve()
     if not asset.exists() or unsafe_path(asset):
         return not_found(start_response)
+    if width is not None:
+        if asset.suffix.lower() != ".png":
+            return not_found(start_response)
+        try:
+            asset = DERIVATIVES.path(asset, width)
+        except (ValueError, PNGError):
+            return not_found(start_response)
+        except OSError:
+            pass  # cache directory not writable: send the full-size image
     mime, _ = mimetypes.guess_type(str(asset))
     data = asset.read_bytes()
     start_response(
@@ -78,13 +303,13 @@ def serve_static(start_response, relative: str):
     return [data]
 
 
-def landing_page(state_json: str) -> str:
+def landing_page(state_json: str, game_id: str = DEFAULT_GAME, title: str = "Parrot's Clue") -> str:
     template = """<!DOCTYPE html>
 <html lang=\"en\">
 <head>
   <meta charset=\"utf-8\" />
   <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
-  <title>Parrot's Clue</title>
+  <title>__TITLE__</title>
   <style>
     :root {
       color-scheme: dark;
@@ -133,6 +358,18 @@ def landing_page(state_json: str) -> str:
       background: #3a4d7a;
       transform: translateY(-1px);
     }
+    header select {
+      margin-left: auto;
+      margin-right: 0.75rem;
+      background: #2b3b5f;
+      color: inherit;
+      border: 1px solid rgba(255, 255, 255, 0.15);
+      padding: 0.45rem 0.75rem;
+      border-radius: 999px;
+    }
+    header select.hidden {
+      display: none;
+    }
     .stage {
       display: grid;
       grid-template-columns: 2fr 1fr;
@@ -319,12 +556,13 @@ def landing_page(state_json: str) -> str:
 <body>
   <div class=\"app-shell\">
     <header>
-      <h1>Parrot's Clue</h1>
+      <h1>__TITLE__</h1>
+      <select id=\"game-picker\" class=\"hidden\" aria-label=\"Choose a game\"></select>
       <button id=\"reset-btn\" type=\"button\">Restart Adventure</button>
     </header>
     <div class=\"stage\">
       <div class=\"viewport\">
-        <img id=\"location-art\" alt=\"Current location art\" src=\"\" />
+        <img id=\"location-art\" alt=\"Current location art\" src=\"\" sizes=\"(max-width: 900px) 100vw, 600px\" />
         <div class=\"pane\">
           <h2 id=\"location-name\"></h2>
           <p id=\"location-description\"></p>
@@ -356,6 +594,8 @@ def landing_page(state_json: str) -> str:
   </div>
   <script id=\"bootstrap-data\" type=\"application/json\">__STATE__</script>
   <script>
+    const gameId = __GAME__;
+    const gameQuery = `?game=${encodeURIComponent(gameId)}`;
     const historyEl = document.getElementById('history');
     const locationName = document.getElementById('location-name');
     const locationDescription = document.getElementById('location-description');
@@ -420,6 +660,7 @@ def landing_page(state_json: str) -> str:
       const { location } = data.view;
       locationName.textContent = location.name;
       locationDescription.textContent = location.description;
+      locationArt.srcset = location.srcset || '';
       locationArt.src = `/assets/${location.image}`;
       locationArt.alt = `${location.name} artwork`;
       renderList(objectsList, location.objects, 'Nothing of note.');
@@ -431,7 +672,7 @@ def landing_page(state_json: str) -> str:
     async function fetchState(showSpinner = false) {
       if (showSpinner) setLoading(true);
       try {
-        const response = await fetch('/api/state');
+        const response = await fetch(`/api/state${gameQuery}`);
         if (!response.ok) {
           throw new Error('Failed to load state');
         }
@@ -447,7 +688,7 @@ def landing_page(state_json: str) -> str:
     async function sendCommand(command) {
       setLoading(true);
       try {
-        const response = await fetch('/api/command', {
+        const response = await fetch(`/api/command${gameQuery}`, {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
           body: JSON.stringify({ command })
@@ -496,53 +737,63 @@ def landing_page(state_json: str) -> str:
       updateView(initialState);
     }
     fetchState(false);
+
+    async function loadGames() {
+      const picker = document.getElementById('game-picker');
+      try {
+        const response = await fetch('/api/games');
+        if (!response.ok) return;
+        const games = await response.json();
+        if (games.length < 2) return;
+        for (const game of games) {
+          const option = document.createElement('option');
+          option.value = game.id;
+          option.textContent = game.title;
+          option.selected = game.id === gameId;
+          picker.appendChild(option);
+        }
+        picker.classList.remove('hidden');
+        picker.addEventListener('change', () => {
+          window.location.search = `?game=${encodeURIComponent(picker.value)}`;
+        });
+      } catch (error) {
+        console.error(error);
+      }
+    }
+    loadGames();
   </script>
 </body>
 </html>"""
 
-    return template.replace("__STATE__", state_json)
-
-
-engine = load_engine()
-history: List[Dict[str, str]] = []
-
-
-def bootstrap_history() -> None:
-    history.clear()
-    intro = engine.describe_current_location()
-    history.append({"speaker": "game", "text": intro})
-
-
-def rebuild_engine() -> None:
-    global engine
-    engine = load_engine()
-    bootstrap_history()
-
-
-bootstrap_history()
+    return (
+        template.replace("__TITLE__", html.escape(title))
+        .replace("__GAME__", json.dumps(game_id).replace("</", "<\\/"))
+        .replace("__STATE__", state_json)
+    )
 
 
-def collect_state() -> Dict[str, object]:
+def collect_state(session: WebSession) -> Dict[str, object]:
     return {
-        "history": history,
-        "view": engine.view_state(),
+        "game": session.game_id,
+        "history": session.history,
+        "view": session.engine.view_state(),
     }
 
 
-def handle_command(command_text: str) -> Dict[str, object]:
+def handle_command(session: WebSession, command_text: str) -> Dict[str, object]:
     lower = command_text.strip().lower()
     if lower in {"reset", "restart", "start over"}:
-        rebuild_engine()
-        return collect_state()
+        session.reset()
+        return collect_state(session)
 
     if command_text.strip():
-        history.append({"speaker": "user", "text": command_text})
-        response = engine.handle_command(command_text)
-        history.append({"speaker": "game", "text": response.output})
+        session.history.append({"speaker": "user", "text": command_text})
+        response = session.engine.handle_command(command_text)
+        session.history.append({"speaker": "game", "text": response.output})
     else:
-        description = engine.describe_current_location()
-        history.append({"speaker": "game", "text": description})
-    return collect_state()
+        description = session.engine.describe_current_location()
+        session.history.append({"speaker": "game", "text": description})
+    return collect_state(session)
 
 
 def safe_state_payload(state: Dict[str, object]) -> str:
@@ -550,50 +801,110 @@ def safe_state_payload(state: Dict[str, object]) -> str:
     return payload.replace("</", "<\\/")
 
 
-HTML = landing_page(safe_state_payload(collect_state()))
+def landing_html(session: WebSession) -> str:
+    page = _pages.get(session.game_id)
+    if page is None:
+        title = session.engine.metadata.title
+        page = landing_page(safe_state_payload(collect_state(session)), session.game_id, title)
+        _pages[session.game_id] = page
+    return page
 
 
 def app(environ, start_response):
+    if _pending_reloads:
+        apply_reloads()
     path = environ.get("PATH_INFO", "/")
     method = environ.get("REQUEST_METHOD", "GET").upper()
 
-    if path == "/":
+    if path.startswith("/assets/"):
+        relative = path[len("/assets/"):]
+        requested = parse_qs(environ.get("QUERY_STRING", "")).get("w")
+        if requested is None:
+            return serve_static(start_response, relative)
+        if not requested[0].isdigit():
+            return not_found(start_response)
+        return serve_static(start_response, relative, int(requested[0]))
+
+    if path == "/api/games":
         if method != "GET":
             return method_not_allowed(start_response)
-        return html_response(start_response, HTML)
+        return json_response(start_response, CATALOG.describe())
 
-    if path.startswith("/assets/"):
-        relative = path[len("/assets/"):]
-        return serve_static(start_response, relative)
+    if path not in {"/", "/api/state", "/api/stats", "/api/command"}:
+        return not_found(start_response)
+    query = parse_qs(environ.get("QUERY_STRING", ""))
+    game_id = query.get("game", [DEFAULT_GAME])[0]
+    if game_id not in CATALOG:
+        return not_found(start_response)
+    with session_for(game_id, write=path == "/api/command" and method == "POST") as session:
+        return route_session(environ, start_response, path, method, session)
 
-    if path == "/api/state":
+
+def route_session(environ, start_response, path: str, method: str, session: WebSession):
+    game_id = session.game_id
+    if path == "/":
         if method != "GET":
             return method_not_allowed(start_response)
-        return json_response(start_response, collect_state())
+        return html_response(start_response, landing_html(session))
 
-    if path == "/api/command":
-        if method != "POST":
+    if path == "/api/state":
+        if method != "GET":
             return method_not_allowed(start_response)
-        try:
-            length = int(environ.get("CONTENT_LENGTH") or 0)
-        except ValueError:
-            length = 0
-        raw = environ["wsgi.input"].read(length) if length > 0 else b""
-        try:
-            payload = json.loads(raw.decode("utf-8") or "{}")
-        except json.JSONDecodeError:
-            payload = {}
-        command_text = str(payload.get("command", ""))
-        state = handle_command(command_text)
-        return json_response(start_response, state)
+        return json_response(start_response, collect_state(session))
 
-    return not_found(start_response)
+    if path == "/api/stats":
+        if method != "GET":
+            return method_not_allowed(start_response)
+        entry = CATALOG.entry(game_id)
+        return json_response(
+            start_response,
+            {
+                **session.engine.cache_info(),
+                "game": {"id": game_id, "load_ms": entry.load_seconds * 1000, "memory_bytes": entry.memory_bytes},
+                "reload": _reloads.get(game_id),
+                "derivatives": DERIVATIVES.stats(),
+            },
+        )
+
+    if method != "POST":
+        return method_not_allowed(start_response)
+    try:
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+    except ValueError:
+        length = 0
+    raw = environ["wsgi.input"].read(length) if length > 0 else b""
+    try:
+        payload = json.loads(raw.decode("utf-8") or "{}")
+    except json.JSONDecodeError:
+        payload = {}
+    command_text = str(payload.get("command", ""))
+    state = handle_command(session, command_text)
+    return json_response(start_response, state)
 
 
 if __name__ == "__main__":
+    import argparse
+    import os
+    from wsgiref.simple_server import make_server
+
+    parser = argparse.ArgumentParser(description="Serve the adventure in a browser")
+    parser.add_argument("--reload", action="store_true", help="hot-reload edited games/*.json files")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between reload polls")
+    parser.add_argument("--workers", type=int, default=1, help="forked worker processes sharing the games")
+    args = parser.parse_args()
+    if args.workers > 1 and args.reload:
+        parser.error("--reload cannot be combined with --workers")
+    if args.workers > 1 and not hasattr(os, "fork"):
+        parser.error("--workers needs os.fork, which this platform lacks")
+    if args.reload:
+        enable_reload(args.interval)
+
     with make_server("127.0.0.1", 8000, app) as server:
-        print("Serving Parrot's Clue on http://127.0.0.1:8000")
+        print(f"Serving {len(CATALOG.game_ids())} game(s) on http://127.0.0.1:8000")
         try:
-            server.serve_forever()
+            if args.workers > 1:
+                serve_prefork(server, args.workers)
+            else:
+                server.serve_forever()
         except KeyboardInterrupt:
             print("\nServer stopped.")